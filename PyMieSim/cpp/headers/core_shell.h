@@ -19,7 +19,7 @@
             double x_shell;
 
             Scatterer(double core_diameter, double shell_width, complex128 core_index, complex128 shell_index,
-                double medium_index, SOURCE::BaseSource &source, size_t max_order = 0)
+                double medium_index, SOURCE::BaseSource &source, size_t max_order = 0, double tolerance = 0)
             : BaseSphericalScatterer(source, max_order, medium_index), core_diameter(core_diameter), shell_width(shell_width),
             core_index(core_index), shell_index(shell_index)
             {
@@ -29,6 +29,7 @@
                 this->max_order = (max_order == 0) ? this->get_wiscombe_criterion(this->size_parameter) : max_order;
                 this->apply_medium();
                 this->compute_an_bn();
+                this->truncate_series(tolerance);
             }
 
             void compute_size_parameter() override {
@@ -55,6 +56,7 @@
             std::variant<std::vector<complex128>, std::vector<std::vector<complex128>>> shell;
             std::variant<std::vector<double>, std::vector<std::vector<double>>> medium;
             std::vector<size_t> shape;
+            std::vector<size_t> zip_map; // Axis followed by each axis of the set, see get_zip_map, empty when every axis is independent.
 
             Set() = default;
 
@@ -69,6 +71,18 @@
                 update_shape();
             }
 
+            // Makes the parameters of the given axes vary together, the set then iterates over their tuples.
+            void zip_axes(const std::vector<size_t> &axes)
+            {
+                zip_map.clear();
+                update_shape();
+
+                zip_map = get_zip_map(shape, axes);
+                update_shape();
+            }
+
+            size_t get_zip_axis(size_t axis) const { return zip_map.empty() ? axis : zip_map[axis]; }
+
             void update_shape() {
                 shape.clear();
                 shape.push_back(core_diameter.size());
@@ -92,9 +106,53 @@
                     std::get<std::vector<double>>(medium).size() :
                     std::get<std::vector<std::vector<double>>>(medium).size()
                 );
+
+                for (size_t axis = 0; axis < zip_map.size(); ++axis)
+                    if (zip_map[axis] != axis)
+                        shape[axis] = 1;
+            }
+
+            // Sub-set restricted to the indices [start, stop) of one of its axes {core_diameter, shell_width, core, shell, medium}.
+            // The parameters of zipped axes are sliced along the axis they follow, the others having a size of 1.
+            Set slice(size_t axis, size_t start, size_t stop) const {
+                if (axis >= shape.size())
+                    throw std::invalid_argument("Invalid coreshell set axis: " + std::to_string(axis));
+
+                Set output = *this;
+
+                for (size_t parameter = 0; parameter < shape.size(); ++parameter) {
+                    if (get_zip_axis(parameter) != axis)
+                        continue;
+
+                    switch (parameter) {
+                        case 0: output.core_diameter = slice_vector(core_diameter, start, stop); break;
+                        case 1: output.shell_width = slice_vector(shell_width, start, stop); break;
+                        case 2: output.core = slice_vector(core, start, stop); break;
+                        case 3: output.shell = slice_vector(shell, start, stop); break;
+                        case 4: output.medium = slice_vector(medium, start, stop); break;
+                    }
+                }
+
+                output.update_shape();
+
+                return output;
             }
 
-            Scatterer to_object(size_t wl, size_t cd, size_t sw, size_t ci, size_t si, size_t mi, SOURCE::BaseSource &source) const {
+            // Same set for the source wavelengths [start, stop), the materials being tabulated per wavelength.
+            Set slice_wavelength(size_t start, size_t stop) const {
+                Set output = *this;
+
+                ::slice_wavelength(output.core, start, stop);
+                ::slice_wavelength(output.shell, start, stop);
+                ::slice_wavelength(output.medium, start, stop);
+
+                return output;
+            }
+
+            Scatterer to_object(size_t wl, size_t cd, size_t sw, size_t ci, size_t si, size_t mi, SOURCE::BaseSource &source, double tolerance = 0) const {
+                std::array<size_t, 5> index = unzip_index<5>({cd, sw, ci, si, mi}, zip_map);
+                cd = index[0], sw = index[1], ci = index[2], si = index[3], mi = index[4];
+
                 complex128 core_value;
                 complex128 shell_value;
                 double medium_value;
@@ -123,7 +181,7 @@
                     medium_value = indices[mi];
                 }
 
-                return Scatterer(core_diameter[cd], shell_width[sw], core_value, shell_value, medium_value, source);
+                return Scatterer(core_diameter[cd], shell_width[sw], core_value, shell_value, medium_value, source, 0, tolerance);
             }
 
     };
@@ -1,6 +1,7 @@
 #pragma once
 
 #include "base_class.cpp"
+#include <optional>
 
 namespace CYLINDER
 {
@@ -16,6 +17,11 @@ namespace CYLINDER
             std::vector<complex128> a2n;
             std::vector<complex128> b2n;
 
+            // Series sums of both polarizations and the asymmetry parameter, filled on first use.
+            mutable std::optional<std::pair<complex128, complex128>> Qsca_sum;
+            mutable std::optional<std::pair<double, double>> Qext_sum;
+            mutable std::optional<double> g_value;
+
 
             pybind11::array_t<complex128> get_a1n_py(size_t _max_order) { _max_order == 0 ? _max_order = this->max_order : _max_order = max_order; return vector_to_numpy(a1n, {_max_order}); }
             pybind11::array_t<complex128> get_b1n_py(size_t _max_order) { _max_order == 0 ? _max_order = this->max_order : _max_order = max_order; return vector_to_numpy(b1n, {_max_order}); }
@@ -27,13 +33,14 @@ namespace CYLINDER
             std::vector<complex128> get_a2n() const { return a2n; };
             std::vector<complex128> get_b2n() const { return b2n; };
 
-            Scatterer(double diameter, complex128 index, double medium_index, SOURCE::BaseSource &source, size_t max_order = 0) :
+            Scatterer(double diameter, complex128 index, double medium_index, SOURCE::BaseSource &source, size_t max_order = 0, double tolerance = 0) :
             Base(max_order, source, medium_index), diameter(diameter), index(index)
             {
                 this->compute_area();
                 this->compute_size_parameter();
                 this->max_order = (max_order == 0) ? this->get_wiscombe_criterion(this->size_parameter) : max_order;
                 this->compute_an_bn();
+                this->truncate_series(tolerance);
             }
 
             void compute_size_parameter() override {
@@ -47,6 +54,9 @@ namespace CYLINDER
             double get_g() const override;
             double get_Qsca() const override;
             double get_Qext() const override;
+            std::pair<complex128, complex128> get_Qsca_sum() const;
+            std::pair<double, double> get_Qext_sum() const;
+            void truncate_series(const double tolerance);
             double process_polarization(const complex128 value_0, const complex128 value_1) const ;
             void compute_an_bn();
 
@@ -61,6 +71,7 @@ namespace CYLINDER
             std::variant<std::vector<complex128>, std::vector<std::vector<complex128>>> scatterer;
             std::variant<std::vector<double>, std::vector<std::vector<double>>> medium;
             std::vector<size_t> shape;
+            std::vector<size_t> zip_map; // Axis followed by each axis of the set, see get_zip_map, empty when every axis is independent.
 
             Set() = default;
 
@@ -73,6 +84,18 @@ namespace CYLINDER
                 update_shape();
             }
 
+            // Makes the parameters of the given axes vary together, the set then iterates over their tuples.
+            void zip_axes(const std::vector<size_t> &axes)
+            {
+                zip_map.clear();
+                update_shape();
+
+                zip_map = get_zip_map(shape, axes);
+                update_shape();
+            }
+
+            size_t get_zip_axis(size_t axis) const { return zip_map.empty() ? axis : zip_map[axis]; }
+
             void update_shape() {
                 shape.clear();
                 shape.push_back(diameter.size());
@@ -87,15 +110,61 @@ namespace CYLINDER
                 else
                     shape.push_back(std::get<std::vector<double>>(medium).size());
 
+                for (size_t axis = 0; axis < zip_map.size(); ++axis)
+                    if (zip_map[axis] != axis)
+                        shape[axis] = 1;
+
+            }
+
+        // Sub-set restricted to the indices [start, stop) of one of its axes {diameter, index, medium}. The parameters of zipped
+        // axes are sliced along the axis they follow, the others having a size of 1.
+        Set slice(size_t axis, size_t start, size_t stop) const
+        {
+            if (axis >= shape.size())
+                throw std::invalid_argument("Invalid cylinder set axis: " + std::to_string(axis));
+
+            Set output = *this;
+
+            for (size_t parameter = 0; parameter < shape.size(); ++parameter)
+            {
+                if (get_zip_axis(parameter) != axis)
+                    continue;
+
+                switch (parameter)
+                {
+                    case 0: output.diameter = slice_vector(diameter, start, stop); break;
+                    case 1: output.scatterer = slice_vector(scatterer, start, stop); break;
+                    case 2: output.medium = slice_vector(medium, start, stop); break;
+                }
             }
 
-        Scatterer to_object(size_t d, size_t i, size_t wl, size_t mi, SOURCE::BaseSource& source) const
+            output.update_shape();
+
+            return output;
+        }
+
+        // Same set for the source wavelengths [start, stop), the materials being tabulated per wavelength.
+        Set slice_wavelength(size_t start, size_t stop) const
         {
+            Set output = *this;
+
+            ::slice_wavelength(output.scatterer, start, stop);
+            ::slice_wavelength(output.medium, start, stop);
+
+            return output;
+        }
+
+        Scatterer to_object(size_t d, size_t i, size_t wl, size_t mi, SOURCE::BaseSource& source, double tolerance = 0) const
+        {
+            auto [d_, i_, mi_] = unzip_index<3>({d, i, mi}, zip_map);
+
             return Scatterer(
-                diameter[d],
-                std::holds_alternative<std::vector<std::vector<complex128>>>(scatterer) ? std::get<std::vector<std::vector<complex128>>>(scatterer)[i][wl] : std::get<std::vector<complex128>>(scatterer)[i],
-                std::holds_alternative<std::vector<std::vector<double>>>(medium) ? std::get<std::vector<std::vector<double>>>(medium)[mi][wl] : std::get<std::vector<double>>(medium)[mi],
-                source
+                diameter[d_],
+                std::holds_alternative<std::vector<std::vector<complex128>>>(scatterer) ? std::get<std::vector<std::vector<complex128>>>(scatterer)[i_][wl] : std::get<std::vector<complex128>>(scatterer)[i_],
+                std::holds_alternative<std::vector<std::vector<double>>>(medium) ? std::get<std::vector<std::vector<double>>>(medium)[mi_][wl] : std::get<std::vector<double>>(medium)[mi_],
+                source,
+                0,
+                tolerance
             );
         }
     };
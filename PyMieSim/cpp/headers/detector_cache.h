@@ -0,0 +1,131 @@
+#pragma once
+
+#include <list>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <tuple>
+#include <vector>
+#include <complex>
+#include "fibonacci_mesh.cpp"
+
+namespace DETECTOR {
+
+    using complex128 = std::complex<double>;
+
+    // Meshes and mode fields of the detectors, which the experiments rebuild for every point of their grid and the single
+    // detectors for every instance although they only depend on a few parameters. Each entry is immutable and shared by
+    // the detectors built from it, the least recently used entries being evicted once their size exceeds the budget.
+    // The cache is local to each binary module, the detectors of the experiments and the single detectors thus having
+    // their own cache and budget.
+    class Cache {
+        public:
+            // (sampling, max_angle, phi_offset, gamma_offset, rotation, quadrature, mode_number), with an empty mode
+            // number for the mesh itself.
+            using Key = std::tuple<size_t, double, double, double, double, std::string, std::string>;
+
+            static constexpr size_t default_budget = 256 * 1024 * 1024;
+
+            static Cache& get_instance() {
+                static Cache instance;
+                return instance;
+            }
+
+            // Returns the mesh of the key, computed and stored if it is not cached.
+            template <typename Function>
+            std::shared_ptr<const FibonacciMesh> get_mesh(const Key &key, Function &&compute) {
+                return this->get<FibonacciMesh>(key, std::forward<Function>(compute), [](const FibonacciMesh &mesh) { return mesh.get_memory_size(); });
+            }
+
+            // Returns the mode field of the key, computed and stored if it is not cached.
+            template <typename Function>
+            std::shared_ptr<const std::vector<complex128>> get_scalar_field(const Key &key, Function &&compute) {
+                return this->get<std::vector<complex128>>(key, std::forward<Function>(compute), [](const std::vector<complex128> &field) { return field.size() * sizeof(complex128); });
+            }
+
+            // Sets the budget in bytes of the cached entries, 0 disables the cache.
+            void set_budget(size_t budget) {
+                std::lock_guard<std::mutex> lock(this->mutex);
+                this->budget = budget;
+                this->evict();
+            }
+
+            size_t get_budget() {
+                std::lock_guard<std::mutex> lock(this->mutex);
+                return this->budget;
+            }
+
+            // Size in bytes of the cached entries.
+            size_t get_size() {
+                std::lock_guard<std::mutex> lock(this->mutex);
+                return this->size;
+            }
+
+            void clear() {
+                std::lock_guard<std::mutex> lock(this->mutex);
+                this->entries.clear();
+                this->index.clear();
+                this->size = 0;
+            }
+
+        private:
+            struct Entry {
+                Key key;
+                std::shared_ptr<const void> value;
+                size_t size;
+            };
+
+            std::list<Entry> entries;  // From the most to the least recently used
+            std::map<Key, std::list<Entry>::iterator> index;
+            size_t size = 0;
+            size_t budget = default_budget;
+            std::mutex mutex;
+
+            Cache() = default;
+
+            // The entry is computed without holding the lock, so that the detectors built in parallel by the experiments
+            // only wait on each other for the lookups.
+            template <typename Value, typename Function, typename Size>
+            std::shared_ptr<const Value> get(const Key &key, Function &&compute, Size &&get_size) {
+                {
+                    std::lock_guard<std::mutex> lock(this->mutex);
+                    auto iterator = this->index.find(key);
+
+                    if (iterator != this->index.end()) {
+                        this->entries.splice(this->entries.begin(), this->entries, iterator->second);
+                        return std::static_pointer_cast<const Value>(iterator->second->value);
+                    }
+                }
+
+                std::shared_ptr<const Value> value = std::make_shared<const Value>(compute());
+                size_t value_size = get_size(*value);
+
+                std::lock_guard<std::mutex> lock(this->mutex);
+
+                // Computed in the meantime by another thread.
+                auto iterator = this->index.find(key);
+                if (iterator != this->index.end())
+                    return std::static_pointer_cast<const Value>(iterator->second->value);
+
+                if (value_size > this->budget)
+                    return value;
+
+                this->entries.push_front(Entry{key, value, value_size});
+                this->index.emplace(key, this->entries.begin());
+                this->size += value_size;
+                this->evict();
+
+                return value;
+            }
+
+            void evict() {
+                while (this->size > this->budget) {
+                    this->size -= this->entries.back().size;
+                    this->index.erase(this->entries.back().key);
+                    this->entries.pop_back();
+                }
+            }
+    };
+
+} // namespace DETECTOR
@@ -7,6 +7,7 @@
 #include "fibonacci_mesh.cpp"
 #include "utils.cpp"
 #include "numpy_interface.cpp"
+#include "detector_cache.h"
 #include <LG_modes.h>
 #include <HG_modes.h>
 #include <LP_modes.h>
@@ -25,74 +26,79 @@ namespace DETECTOR {
             double rotation = 0.0;
             bool coherent = true;
             bool mean_coupling = true;
+            std::string quadrature = "fibonacci";
             double max_angle = 0;
             std::vector<complex128> scalar_field;
-            FibonacciMesh fibonacci_mesh;
+            std::shared_ptr<const FibonacciMesh> fibonacci_mesh;
 
             Detector() = default;
 
-            Detector(std::string mode_number, size_t sampling, double NA, double phi_offset, double gamma_offset, double polarization_filter, double rotation, bool coherent, bool mean_coupling) :
+            Detector(std::string mode_number, size_t sampling, double NA, double phi_offset, double gamma_offset, double polarization_filter, double rotation, bool coherent, bool mean_coupling, const std::string &quadrature = "fibonacci") :
             sampling(sampling), NA(NA), phi_offset(phi_offset), gamma_offset(gamma_offset), polarization_filter(polarization_filter),
-            rotation(rotation), coherent(coherent), mean_coupling(mean_coupling)
+            rotation(rotation), coherent(coherent), mean_coupling(mean_coupling), quadrature(quadrature)
             {
                 this->max_angle = NA2Angle(this->NA);
 
-                this->fibonacci_mesh = FibonacciMesh(
-                    this->sampling,
-                    this->max_angle,
-                    this->phi_offset,
-                    this->gamma_offset,
-                    this->rotation
-                );
+                Cache &cache = Cache::get_instance();
 
-                int number_0 = mode_number[2] - '0';
-                int number_1 = mode_number[3] - '0';
+                Cache::Key key{this->sampling, this->max_angle, this->phi_offset, this->gamma_offset, this->rotation, this->quadrature, ""};
 
-                if (mode_number.substr(0, 2) == "LG")  // Laguerre-Gauss mode
-                    this->scalar_field = get_LG_mode_field(
-                        this->fibonacci_mesh.base_cartesian_coordinates.x,
-                        this->fibonacci_mesh.base_cartesian_coordinates.y,
-                        number_0,
-                        number_1
-                    );
-                else if (mode_number.substr(0, 2) == "HG")  // Hermit-Gauss mode
-                    this->scalar_field = get_HG_mode_field(
-                        this->fibonacci_mesh.base_cartesian_coordinates.x,
-                        this->fibonacci_mesh.base_cartesian_coordinates.y,
-                        number_0,
-                        number_1
-                    );
-                else if (mode_number.substr(0, 2) == "LP")  // Fiber Linearly Polarized mode
-                    this->scalar_field = get_LP_mode_field(
-                        this->fibonacci_mesh.base_cartesian_coordinates.x,
-                        this->fibonacci_mesh.base_cartesian_coordinates.y,
-                        number_0,
-                        number_1
+                this->fibonacci_mesh = cache.get_mesh(key, [this]() {
+                    return FibonacciMesh(
+                        this->sampling,
+                        this->max_angle,
+                        this->phi_offset,
+                        this->gamma_offset,
+                        this->rotation,
+                        this->quadrature
                     );
-                else if (mode_number.substr(0, 2) == "NC")  // Non-coherent mode
-                    this->scalar_field = std::vector<complex128>(this->fibonacci_mesh.base_cartesian_coordinates.x.size(), 1.0);
+                });
 
-                else
-                    throw std::invalid_argument("Invalid mode family name");
+                std::get<6>(key) = mode_number;
+
+                this->scalar_field = *cache.get_scalar_field(key, [this, &mode_number]() { return this->compute_scalar_field(mode_number); });
             }
 
             template <typename T>
-            double get_coupling(T& scatterer) {
+            double get_coupling(const T& scatterer) const {
+                if (!this->needs_far_field())
+                    return get_coupling_azimuthal_no_coherent(scatterer);
+
+                auto [theta_field, phi_field] = scatterer.compute_unstructured_fields(*this->fibonacci_mesh);
+
+                return get_coupling_from_fields(scatterer, theta_field, phi_field);
+            }
+
+            // Coupling from the far-field of the scatterer already evaluated over the mesh, which is shared by the
+            // detectors only differing by their mode or polarization filter.
+            template <typename T>
+            double get_coupling_from_fields(const T& scatterer, const std::vector<complex128>& theta_field, const std::vector<complex128>& phi_field) const {
                 if (this->coherent)
-                    return this->mean_coupling ? get_coupling_mean_coherent(scatterer) : get_coupling_point_coherent(scatterer);
+                    return this->mean_coupling ? get_coupling_mean_coherent(theta_field, phi_field) : get_coupling_point_coherent(theta_field, phi_field);
+                else if (this->is_on_axis())
+                    return get_coupling_azimuthal_no_coherent(scatterer);
                 else
-                    return this->mean_coupling ? get_coupling_mean_no_coherent(scatterer) : get_coupling_point_no_coherent(scatterer);
+                    return this->mean_coupling ? get_coupling_mean_no_coherent(theta_field, phi_field) : get_coupling_point_no_coherent(theta_field, phi_field);
             }
 
-            template <typename T> double get_coupling_point_no_coherent(T& scatterer);
-            template <typename T> double get_coupling_mean_no_coherent(T& scatterer);
-            template <typename T> double get_coupling_point_coherent(T& scatterer);
-            template <typename T> double get_coupling_mean_coherent(T& scatterer);
+            // A cap centered on the forward direction, on which the non-coherent coupling reduces to a polar integral.
+            bool is_on_axis() const { return this->phi_offset == 0.0 && this->gamma_offset == 0.0; }
+
+            // Whether the coupling is integrated from the far-field over the mesh.
+            bool needs_far_field() const { return this->coherent || !this->is_on_axis(); }
+
+            template <typename T> double get_coupling_azimuthal_no_coherent(const T& scatterer) const;
+            double get_coupling_point_no_coherent(const std::vector<complex128>& theta_field, const std::vector<complex128>& phi_field) const;
+            double get_coupling_mean_no_coherent(const std::vector<complex128>& theta_field, const std::vector<complex128>& phi_field) const;
+            double get_coupling_point_coherent(const std::vector<complex128>& theta_field, const std::vector<complex128>& phi_field) const;
+            double get_coupling_mean_coherent(const std::vector<complex128>& theta_field, const std::vector<complex128>& phi_field) const;
 
         private:
             template <typename T> double calculate_coupling(const T& scatterer, bool point, bool coherent);
             std::tuple<std::vector<complex128>, std::vector<complex128>> get_projected_fields(const std::vector<complex128>& theta_field, const std::vector<complex128>& phi_field) const;
             void apply_scalar_field(std::vector<complex128> &field0, std::vector<complex128> &field1) const;
+            std::vector<complex128> compute_scalar_field(const std::string &mode_number) const;
+            void normalize_scalar_field(std::vector<complex128> &scalar_field, bool normalize) const;
             template <typename T> inline double get_norm1_squared(const std::vector<T>& array) const;
             template <typename T> inline double get_norm2_squared(const std::vector<T>& array) const;
             template <typename T> inline void square_array(std::vector<T>& array);
@@ -111,12 +117,10 @@ namespace DETECTOR {
             std::vector<double> rotation;
             bool coherent;
             bool mean_coupling;
+            std::string quadrature;
 
             std::vector<std::vector<complex128>> scalar_fields;
 
-
-
-
             std::vector<size_t> shape;
 
             Set() = default;
@@ -129,13 +133,59 @@ namespace DETECTOR {
                 const std::vector<double> &polarization_filter,
                 const std::vector<double> &rotation,
                 const bool &coherent,
-                const bool &mean_coupling)
+                const bool &mean_coupling,
+                const std::string &quadrature = "fibonacci")
             : mode_numbers(mode_numbers), sampling(sampling), NA(NA), phi_offset(phi_offset), gamma_offset(gamma_offset),
-              polarization_filter(polarization_filter), rotation(rotation), coherent(coherent), mean_coupling(mean_coupling)
+              polarization_filter(polarization_filter), rotation(rotation), coherent(coherent), mean_coupling(mean_coupling), quadrature(quadrature)
               {
+                if (quadrature != "fibonacci" && quadrature != "gauss")
+                    throw std::invalid_argument("Invalid quadrature: " + quadrature + ", must be either 'fibonacci' or 'gauss'");
+
                 this->shape = {mode_numbers.size(), sampling.size(), rotation.size(), NA.size(), phi_offset.size(), gamma_offset.size(), polarization_filter.size()};
               }
 
+            // Sub-set restricted to the indices [start, stop) of one of its axes
+            // {mode_number, sampling, rotation, NA, phi_offset, gamma_offset, polarization_filter}.
+            Set slice(size_t axis, size_t start, size_t stop) const
+            {
+                Set output = *this;
+
+                switch (axis)
+                {
+                    case 0: output.mode_numbers = slice_vector(mode_numbers, start, stop); break;
+                    case 1: output.sampling = slice_vector(sampling, start, stop); break;
+                    case 2: output.rotation = slice_vector(rotation, start, stop); break;
+                    case 3: output.NA = slice_vector(NA, start, stop); break;
+                    case 4: output.phi_offset = slice_vector(phi_offset, start, stop); break;
+                    case 5: output.gamma_offset = slice_vector(gamma_offset, start, stop); break;
+                    case 6: output.polarization_filter = slice_vector(polarization_filter, start, stop); break;
+                    default: throw std::invalid_argument("Invalid detector set axis: " + std::to_string(axis));
+                }
+
+                output.shape = {output.mode_numbers.size(), output.sampling.size(), output.rotation.size(), output.NA.size(), output.phi_offset.size(), output.gamma_offset.size(), output.polarization_filter.size()};
+
+                return output;
+            }
+
+            // Builds every detector of the set once, flattened in the order of the set shape, so that
+            // the experiment loops can share them read-only across threads instead of rebuilding them.
+            std::vector<Detector> to_objects() const
+            {
+                std::vector<Detector> detectors;
+                detectors.reserve(mode_numbers.size() * sampling.size() * rotation.size() * NA.size() * phi_offset.size() * gamma_offset.size() * polarization_filter.size());
+
+                for (size_t mn = 0; mn < mode_numbers.size(); ++mn)
+                for (size_t fs = 0; fs < sampling.size(); ++fs)
+                for (size_t ra = 0; ra < rotation.size(); ++ra)
+                for (size_t na = 0; na < NA.size(); ++na)
+                for (size_t po = 0; po < phi_offset.size(); ++po)
+                for (size_t go = 0; go < gamma_offset.size(); ++go)
+                for (size_t pf = 0; pf < polarization_filter.size(); ++pf)
+                    detectors.push_back(this->to_object(mn, fs, ra, na, po, go, pf));
+
+                return detectors;
+            }
+
             Detector to_object(size_t mn, size_t fs, size_t ra, size_t na, size_t po, size_t go, size_t pf) const
             {
                 return Detector(
@@ -147,7 +197,8 @@ namespace DETECTOR {
                     this->polarization_filter[pf],
                     this->rotation[ra],
                     this->coherent,
-                    this->mean_coupling
+                    this->mean_coupling,
+                    this->quadrature
                 );
             }
     };
@@ -7,17 +7,115 @@
 #include "cylinder.cpp"
 #include "core_shell.cpp"
 #include "detectors.cpp"
+#include <algorithm>
+#include <array>
+#include <atomic>
+#include <chrono>
+#include <exception>
+#include <map>
+#include <memory>
+#include <numeric>
+#include <stdexcept>
+#include <string>
+
+#ifdef _OPENMP
+#include <omp.h>
+#endif
 
 typedef std::complex<double> complex128;
 
 #define DEFINE_SPHERE_FUNCTION(name) \
-    pybind11::array_t<double> get_sphere_##name() const { return get_sphere_data(&SPHERE::Scatterer::get_##name); }
+    pybind11::array_t<double> get_sphere_##name(const pybind11::object &out = pybind11::none()) const { return get_sphere_data(&SPHERE::Scatterer::get_##name, sphere_dependencies.at(#name), out); }
 
 #define DEFINE_CYLINDER_FUNCTION(name) \
-    pybind11::array_t<double> get_cylinder_##name() const { return get_cylinder_data(&CYLINDER::Scatterer::get_##name); }
+    pybind11::array_t<double> get_cylinder_##name(const pybind11::object &out = pybind11::none()) const { return get_cylinder_data(&CYLINDER::Scatterer::get_##name, cylinder_dependencies.at(#name), out); }
 
 #define DEFINE_CORESHELL_FUNCTION(name) \
-    pybind11::array_t<double> get_coreshell_##name() const { return get_coreshell_data(&CORESHELL::Scatterer::get_##name); }
+    pybind11::array_t<double> get_coreshell_##name(const pybind11::object &out = pybind11::none()) const { return get_coreshell_data(&CORESHELL::Scatterer::get_##name, coreshell_dependencies.at(#name), out); }
+
+#define MEASURE_ENTRY(type, name) {#name, &type::Scatterer::get_##name}
+
+#define COEFFICIENT_ENTRY(label, type, coefficient, order) {label, {&type::Scatterer::get_##coefficient, order}}
+
+
+// Mapping between the measure short labels and the scatterer methods, used to evaluate several measures in a single pass.
+template<typename Scatterer> using MeasureMap = std::map<std::string, double (Scatterer::*)() const>;
+
+template<typename Scatterer> using CoefficientMap = std::map<std::string, std::pair<std::vector<complex128> (Scatterer::*)() const, size_t>>;
+
+// Source axes {wavelength, jones_vector, NA, optical_power} a measure depends on. A measure is only computed over
+// the axes it depends on and broadcast, as a zero-stride view, over the others.
+using SourceDependency = std::array<bool, 4>;
+
+
+// Watches the grid loop of a computation, run with the GIL released. Every iteration checks whether the computation was
+// cancelled and counts the grid points it completed. Only the master thread reports the progress to the Python callback,
+// as callback(completed, total), taking the GIL at most once per interval so that the other threads never wait on it.
+class LoopMonitor
+{
+    public:
+        LoopMonitor(const std::shared_ptr<std::atomic<bool>> &cancel_flag, const pybind11::object &callback, double interval, size_t total)
+        : cancel_flag(cancel_flag), callback(callback), with_callback(!callback.is_none()), interval(interval), total(total) {}
+
+        bool is_stopped() const
+        {
+            return cancel_flag->load(std::memory_order_relaxed) || failed.load(std::memory_order_relaxed);
+        }
+
+        void update(size_t count)
+        {
+            if (!with_callback)
+                return;
+
+            size_t value = completed.fetch_add(count, std::memory_order_relaxed) + count;
+
+            #ifdef _OPENMP
+            if (omp_get_thread_num() != 0)
+                return;
+            #endif
+
+            std::chrono::steady_clock::time_point now = std::chrono::steady_clock::now();
+
+            if (std::chrono::duration<double>(now - last_report).count() < interval || failed.load())
+                return;
+
+            last_report = now;
+
+            pybind11::gil_scoped_acquire acquire;
+
+            // An exception raised by the callback, e.g. a KeyboardInterrupt, stops the loop and is raised by finish.
+            try { callback(value, total); }
+            catch (...)
+            {
+                error = std::current_exception();
+                failed.store(true);
+            }
+        }
+
+        // Called after the loop, with the GIL held: raises the error of the callback or the cancellation, else reports completion.
+        void finish() const
+        {
+            if (error)
+                std::rethrow_exception(error);
+
+            if (cancel_flag->load())
+                throw std::runtime_error("The computation was cancelled.");
+
+            if (with_callback)
+                callback(total, total);
+        }
+
+    private:
+        std::shared_ptr<std::atomic<bool>> cancel_flag;
+        const pybind11::object &callback;
+        bool with_callback;
+        double interval;
+        size_t total;
+        std::atomic<size_t> completed{0};
+        std::atomic<bool> failed{false};
+        std::exception_ptr error;
+        std::chrono::steady_clock::time_point last_report = std::chrono::steady_clock::now();
+};
 
 
 class Experiment
@@ -29,14 +127,385 @@ class Experiment
         DETECTOR::Set detectorSet;
         SOURCE::Set sourceSet;
 
+        // Number of OpenMP threads used by the computations, 0 falls back to the OpenMP default (OMP_NUM_THREADS).
+        // The GIL is released while the parameter grid is evaluated, the sets must not be modified meanwhile.
+        size_t n_threads = 0;
+
+        // OpenMP schedule of the grid loops: "static", "dynamic", "guided" or "cost". The iterations of a point of the grid
+        // grow with the size parameter of the scatterer (max_order) and with the sampling of the detector, the "cost" schedule
+        // therefore visits these axes by decreasing value with a dynamic schedule, so that the cheapest points come last.
+        std::string schedule = "static";
+        size_t schedule_chunk = 0;
+
+        void set_schedule(const std::string &kind, size_t chunk)
+        {
+            if (kind != "static" && kind != "dynamic" && kind != "guided" && kind != "cost")
+                throw std::invalid_argument("Invalid schedule: " + kind + ", valid options are static, dynamic, guided and cost.");
+
+            schedule = kind;
+            schedule_chunk = chunk;
+        }
+
+        // Sets the schedule of the loops run with schedule(runtime) by the calling thread, a chunk of 0 is the OpenMP default.
+        void apply_schedule() const
+        {
+            #ifdef _OPENMP
+            omp_sched_t kind = schedule == "static" ? omp_sched_static : schedule == "guided" ? omp_sched_guided : omp_sched_dynamic;
+            omp_set_schedule(kind, static_cast<int>(schedule_chunk));
+            #endif
+        }
+
+        // Order in which the size points of an axis are visited, by decreasing cost under the "cost" schedule. An axis zipped
+        // with a previous one, of size 1, is left as is.
+        template<typename T>
+        std::vector<size_t> get_axis_order(const std::vector<T> &cost, size_t size) const
+        {
+            std::vector<size_t> order(size);
+            std::iota(order.begin(), order.end(), 0);
+
+            if (schedule == "cost" && cost.size() == size)
+                std::stable_sort(order.begin(), order.end(), [&cost](size_t i, size_t j) { return cost[i] > cost[j]; });
+
+            return order;
+        }
+
+        // Cooperative cancellation flag, checked by every iteration of the computation loops. It is shared with the slices
+        // of the experiment and renewed by copy(), so that each asynchronous computation can be cancelled on its own.
+        std::shared_ptr<std::atomic<bool>> cancel_flag = std::make_shared<std::atomic<bool>>(false);
+
         Experiment() = default;
 
+        Experiment copy() const
+        {
+            Experiment output = *this;
+            output.cancel_flag = std::make_shared<std::atomic<bool>>(false);
+            return output;
+        }
+
+        void cancel() const { cancel_flag->store(true); }
+
+        bool is_cancelled() const { return cancel_flag->load(std::memory_order_relaxed); }
+
+        // Python callable called as progress_callback(completed, total) with the number of grid points computed.
+        pybind11::object progress_callback = pybind11::none();
+        double progress_interval = 0.1;
+
+        void set_progress(const pybind11::object &callback, double interval)
+        {
+            progress_callback = callback;
+            progress_interval = interval;
+        }
+
+        // The remaining iterations of a cancelled loop are skipped, the partial result is then discarded by LoopMonitor::finish.
+        LoopMonitor get_monitor(size_t total) const { return LoopMonitor(cancel_flag, progress_callback, progress_interval, total); }
+
+        void set_num_threads(size_t value) { n_threads = value; }
+
+        // Relative magnitude below which the trailing orders of the Mie coefficients are dropped, 0 keeps every order of
+        // the Wiscombe criterion. It applies to every path alike, the coefficient measures reading first orders the truncation always keeps.
+        double series_tolerance = 0;
+
+        void set_series_tolerance(double value)
+        {
+            if (value < 0 || value >= 1)
+                throw std::invalid_argument("The series tolerance must lie in [0, 1), got: " + std::to_string(value));
+
+            series_tolerance = value;
+        }
+
+        size_t get_num_threads() const
+        {
+            if (n_threads != 0)
+                return n_threads;
+
+            #ifdef _OPENMP
+            return omp_get_max_threads();
+            #else
+            return 1;
+            #endif
+        }
+
         void set_sphere(SPHERE::Set& set) { sphereSet = set; }
         void set_cylinder(CYLINDER::Set& set) { cylinderSet = set; }
         void set_coreshell(CORESHELL::Set& set) { coreshellSet = set; }
         void set_source(SOURCE::Set &set) { sourceSet = set; }
         void set_detector(DETECTOR::Set &set) { detectorSet = set; }
 
+        // Experiment restricted to the indices [start, stop) of one axis of a component set, used to evaluate a large
+        // parameter grid slab by slab. Slicing the source wavelength also slices the materials tabulated per wavelength.
+        Experiment get_slice(const std::string &component, size_t axis, size_t start, size_t stop) const
+        {
+            Experiment output = *this;
+
+            if (component == "source")
+            {
+                output.sourceSet = sourceSet.slice(axis, start, stop);
+
+                if (axis == 0)
+                {
+                    output.sphereSet = sphereSet.slice_wavelength(start, stop);
+                    output.cylinderSet = cylinderSet.slice_wavelength(start, stop);
+                    output.coreshellSet = coreshellSet.slice_wavelength(start, stop);
+                }
+            }
+            else if (component == "sphere")
+                output.sphereSet = sphereSet.slice(axis, start, stop);
+            else if (component == "cylinder")
+                output.cylinderSet = cylinderSet.slice(axis, start, stop);
+            else if (component == "coreshell")
+                output.coreshellSet = coreshellSet.slice(axis, start, stop);
+            else if (component == "detector")
+                output.detectorSet = detectorSet.slice(axis, start, stop);
+            else
+                throw std::invalid_argument("Invalid component: " + component);
+
+            return output;
+        }
+
+        inline static const MeasureMap<SPHERE::Scatterer> sphere_measures = {
+            MEASURE_ENTRY(SPHERE, Qsca), MEASURE_ENTRY(SPHERE, Qext), MEASURE_ENTRY(SPHERE, Qabs), MEASURE_ENTRY(SPHERE, Qpr),
+            MEASURE_ENTRY(SPHERE, Qback), MEASURE_ENTRY(SPHERE, Qforward), MEASURE_ENTRY(SPHERE, Qratio),
+            MEASURE_ENTRY(SPHERE, Csca), MEASURE_ENTRY(SPHERE, Cext), MEASURE_ENTRY(SPHERE, Cabs), MEASURE_ENTRY(SPHERE, Cpr),
+            MEASURE_ENTRY(SPHERE, Cback), MEASURE_ENTRY(SPHERE, Cforward), MEASURE_ENTRY(SPHERE, Cratio), MEASURE_ENTRY(SPHERE, g),
+            MEASURE_ENTRY(SPHERE, max_order)
+        };
+
+        inline static const MeasureMap<CYLINDER::Scatterer> cylinder_measures = {
+            MEASURE_ENTRY(CYLINDER, Qsca), MEASURE_ENTRY(CYLINDER, Qext), MEASURE_ENTRY(CYLINDER, Qabs),
+            MEASURE_ENTRY(CYLINDER, Csca), MEASURE_ENTRY(CYLINDER, Cext), MEASURE_ENTRY(CYLINDER, Cabs), MEASURE_ENTRY(CYLINDER, g),
+            MEASURE_ENTRY(CYLINDER, max_order)
+        };
+
+        inline static const MeasureMap<CORESHELL::Scatterer> coreshell_measures = {
+            MEASURE_ENTRY(CORESHELL, Qsca), MEASURE_ENTRY(CORESHELL, Qext), MEASURE_ENTRY(CORESHELL, Qabs), MEASURE_ENTRY(CORESHELL, Qpr),
+            MEASURE_ENTRY(CORESHELL, Qback), MEASURE_ENTRY(CORESHELL, Qforward), MEASURE_ENTRY(CORESHELL, Qratio),
+            MEASURE_ENTRY(CORESHELL, Csca), MEASURE_ENTRY(CORESHELL, Cext), MEASURE_ENTRY(CORESHELL, Cabs), MEASURE_ENTRY(CORESHELL, Cpr),
+            MEASURE_ENTRY(CORESHELL, Cback), MEASURE_ENTRY(CORESHELL, Cforward), MEASURE_ENTRY(CORESHELL, Cratio), MEASURE_ENTRY(CORESHELL, g),
+            MEASURE_ENTRY(CORESHELL, max_order)
+        };
+
+        inline static const CoefficientMap<SPHERE::Scatterer> sphere_coefficients = {
+            COEFFICIENT_ENTRY("a1", SPHERE, an, 1), COEFFICIENT_ENTRY("b1", SPHERE, bn, 1),
+            COEFFICIENT_ENTRY("a2", SPHERE, an, 2), COEFFICIENT_ENTRY("b2", SPHERE, bn, 2),
+            COEFFICIENT_ENTRY("a3", SPHERE, an, 3), COEFFICIENT_ENTRY("b3", SPHERE, bn, 3)
+        };
+
+        inline static const CoefficientMap<CYLINDER::Scatterer> cylinder_coefficients = {
+            COEFFICIENT_ENTRY("a11", CYLINDER, a1n, 1), COEFFICIENT_ENTRY("b11", CYLINDER, b1n, 1),
+            COEFFICIENT_ENTRY("a21", CYLINDER, a2n, 1), COEFFICIENT_ENTRY("b21", CYLINDER, b2n, 1),
+            COEFFICIENT_ENTRY("a12", CYLINDER, a1n, 2), COEFFICIENT_ENTRY("b12", CYLINDER, b1n, 2),
+            COEFFICIENT_ENTRY("a22", CYLINDER, a2n, 2), COEFFICIENT_ENTRY("b22", CYLINDER, b2n, 2),
+            COEFFICIENT_ENTRY("a13", CYLINDER, a1n, 3), COEFFICIENT_ENTRY("b13", CYLINDER, b1n, 3),
+            COEFFICIENT_ENTRY("a23", CYLINDER, a2n, 3), COEFFICIENT_ENTRY("b23", CYLINDER, b2n, 3)
+        };
+
+        inline static const CoefficientMap<CORESHELL::Scatterer> coreshell_coefficients = {
+            COEFFICIENT_ENTRY("a1", CORESHELL, an, 1), COEFFICIENT_ENTRY("b1", CORESHELL, bn, 1),
+            COEFFICIENT_ENTRY("a2", CORESHELL, an, 2), COEFFICIENT_ENTRY("b2", CORESHELL, bn, 2),
+            COEFFICIENT_ENTRY("a3", CORESHELL, an, 3), COEFFICIENT_ENTRY("b3", CORESHELL, bn, 3)
+        };
+
+        static constexpr SourceDependency wavelength_dependency = {true, false, false, false};
+        static constexpr SourceDependency polarization_dependency = {true, true, false, false};
+        static constexpr SourceDependency full_dependency = {true, true, true, true};
+
+        inline static const std::map<std::string, SourceDependency> sphere_dependencies = {
+            {"Qsca", wavelength_dependency}, {"Qext", wavelength_dependency}, {"Qabs", wavelength_dependency}, {"Qpr", wavelength_dependency},
+            {"Qback", wavelength_dependency}, {"Qforward", wavelength_dependency}, {"Qratio", wavelength_dependency},
+            {"Csca", wavelength_dependency}, {"Cext", wavelength_dependency}, {"Cabs", wavelength_dependency}, {"Cpr", wavelength_dependency},
+            {"Cback", wavelength_dependency}, {"Cforward", wavelength_dependency}, {"Cratio", wavelength_dependency}, {"g", wavelength_dependency},
+            {"max_order", wavelength_dependency}
+        };
+
+        // The response of a cylinder is weighted by the incident polarization for every measure but the number of orders.
+        inline static const std::map<std::string, SourceDependency> cylinder_dependencies = {
+            {"Qsca", polarization_dependency}, {"Qext", polarization_dependency}, {"Qabs", polarization_dependency},
+            {"Csca", polarization_dependency}, {"Cext", polarization_dependency}, {"Cabs", polarization_dependency}, {"g", polarization_dependency},
+            {"max_order", wavelength_dependency}
+        };
+
+        inline static const std::map<std::string, SourceDependency> coreshell_dependencies = sphere_dependencies;
+
+        static std::vector<size_t> reduce_shape(std::vector<size_t> array_shape, const SourceDependency &dependency) {
+            for (size_t i = 0; i < dependency.size(); ++i)
+                if (!dependency[i])
+                    array_shape[i] = 1;
+
+            return array_shape;
+        }
+
+        static SourceDependency merge_dependency(const SourceDependency &first, const SourceDependency &second) {
+            SourceDependency output;
+
+            for (size_t i = 0; i < output.size(); ++i)
+                output[i] = first[i] || second[i];
+
+            return output;
+        }
+
+        // Whether a grid point holds the value of a measure, that is its index is zero on every source axis the measure is broadcast over.
+        static bool is_computed_point(const std::vector<size_t> &multi_index, const SourceDependency &dependency) {
+            for (size_t i = 0; i < dependency.size(); ++i)
+                if (!dependency[i] && multi_index[i] != 0)
+                    return false;
+
+            return true;
+        }
+
+        // Weighted reduction of the results along one of their scatterer or detector axes, e.g. over a size distribution. The
+        // results hold that axis with a size of 2, the weighted mean and variance, which the loops accumulate point by point
+        // so that the values along the axis are never stored. The results are not reduced when the weights are empty.
+        size_t reduction_axis = 0;
+        std::vector<double> reduction_weights, reduction_totals;
+
+        void set_reduction(size_t axis, const std::vector<double> &weights)
+        {
+            double sum = 0;
+
+            for (double weight : weights)
+            {
+                if (!(weight >= 0))
+                    throw std::invalid_argument("The weights of a reduction must be non-negative.");
+
+                sum += weight;
+            }
+
+            if (!weights.empty() && sum == 0)
+                throw std::invalid_argument("The weights of a reduction must not all be zero.");
+
+            reduction_axis = axis;
+            reduction_weights.clear();
+            reduction_totals.clear();
+
+            for (double weight : weights)
+            {
+                reduction_weights.push_back(weight / sum);
+                reduction_totals.push_back((reduction_totals.empty() ? 0 : reduction_totals.back()) + reduction_weights.back());
+            }
+        }
+
+        bool with_reduction() const { return !reduction_weights.empty(); }
+
+        // Shape in which the results of a grid of the given shape are stored, the reduced axis holding the mean and variance.
+        std::vector<size_t> get_statistics_shape(std::vector<size_t> shape) const
+        {
+            if (!with_reduction())
+                return shape;
+
+            if (reduction_axis < sourceSet.shape.size() || reduction_axis >= shape.size())
+                throw std::invalid_argument("Invalid reduction axis " + std::to_string(reduction_axis) + ", only the scatterer and detector axes of the result can be reduced.");
+
+            if (reduction_weights.size() != shape[reduction_axis])
+                throw std::invalid_argument("Got " + std::to_string(reduction_weights.size()) + " weights for a reduced axis of size " + std::to_string(shape[reduction_axis]));
+
+            shape[reduction_axis] = 2;
+
+            return shape;
+        }
+
+        // Offset between the mean and the variance of a point in results of the given statistics shape, 0 without reduction.
+        size_t get_variance_stride(const std::vector<size_t> &shape) const
+        {
+            if (!with_reduction())
+                return 0;
+
+            return get_vector_sigma(std::vector<size_t>(shape.begin() + reduction_axis + 1, shape.end()));
+        }
+
+        // Each point of reduced results is accumulated by a single iteration of the loops, visiting the reduced axis in order,
+        // so that the statistics do not depend on the number of threads or the schedule. inner_axes are the axes a loop
+        // already iterates within its iterations. When the reduced axis is not one of them, the parallel loops run over its
+        // first index only and each iteration steps through its indices.
+        bool is_stepped_reduction(const std::vector<size_t> &inner_axes) const
+        {
+            return with_reduction() && std::find(inner_axes.begin(), inner_axes.end(), reduction_axis) == inner_axes.end();
+        }
+
+        std::vector<size_t> get_parallel_shape(std::vector<size_t> shape, const std::vector<size_t> &inner_axes) const
+        {
+            if (is_stepped_reduction(inner_axes))
+                shape[reduction_axis] = 1;
+
+            return shape;
+        }
+
+        size_t get_step_count(const std::vector<size_t> &inner_axes) const
+        {
+            return is_stepped_reduction(inner_axes) ? reduction_weights.size() : 1;
+        }
+
+        // Index along axis at the given step of an iteration of the parallel loops, at index along that axis.
+        size_t get_step_index(size_t axis, size_t index, size_t step) const
+        {
+            return with_reduction() && axis == reduction_axis ? step : index;
+        }
+
+        // The coupling scales with the squared amplitude of the source, which only varies with its wavelength, NA and optical power.
+        // It is therefore computed at unit amplitude for the first NA and optical power of the source only, into output_array, then
+        // scaled in place over the whole source grid instead of being integrated again for every NA and optical power. block_size
+        // is the size of the non-source axes. The variances of reduced results, at variance_stride from their mean, scale with
+        // the square of the coupling.
+        void scale_coupling_to_source_grid(pybind11::array_t<double> &output_array, size_t block_size, size_t variance_stride = 0) const
+        {
+            std::vector<size_t> shape = sourceSet.shape;
+
+            size_t n_point = shape[2] * shape[3];
+
+            double *output = output_array.mutable_data();
+
+            pybind11::gil_scoped_release release;
+
+            std::vector<double> scales(get_vector_sigma(shape));
+
+            for (size_t wl=0; wl<shape[0]; ++wl)
+            for (size_t jv=0; jv<shape[1]; ++jv)
+            for (size_t na=0; na<shape[2]; ++na)
+            for (size_t op=0; op<shape[3]; ++op)
+                scales[flatten_multi_index({wl, jv, na, op}, shape)] = pow(sourceSet.to_object(wl, jv, na, op).amplitude, 2);
+
+            #pragma omp parallel for collapse(2) num_threads(get_num_threads())
+            for (size_t reference=0; reference<shape[0] * shape[1]; ++reference)
+            for (size_t i=0; i<block_size; ++i)
+            {
+                double
+                    *value = output + reference * n_point * block_size + i,
+                    coupling = value[0];
+
+                bool is_variance = variance_stride != 0 && (i / variance_stride) % 2 == 1;
+
+                for (size_t point = 0; point < n_point; ++point)
+                {
+                    double scale = scales[reference * n_point + point];
+
+                    value[point * block_size] = coupling * (is_variance ? scale * scale : scale);
+                }
+            }
+        }
+
+        // Calls function(mn, pf, coupling) with the coupling of the scatterer for every mode and polarization filter of the
+        // detector set on the mesh of flat index mesh over the {sampling, rotation, NA, phi_offset, gamma_offset} axes,
+        // detectors being ordered as by DETECTOR::Set::to_objects. These detectors share the mesh, over which the far-field
+        // is evaluated once instead of once per detector.
+        template <typename Scatterer, typename Function>
+        void for_each_mesh_coupling(const std::vector<DETECTOR::Detector> &detectors, const Scatterer &scatterer, size_t mesh, Function &&function) const
+        {
+            size_t
+                n_mode = detectorSet.shape[0],
+                n_filter = detectorSet.shape[6],
+                n_mesh = detectors.size() / (n_mode * n_filter);
+
+            const DETECTOR::Detector &mesh_detector = detectors[mesh * n_filter];
+
+            std::vector<complex128> theta_field, phi_field;
+
+            if (mesh_detector.needs_far_field())
+                std::tie(theta_field, phi_field) = scatterer.compute_unstructured_fields(*mesh_detector.fibonacci_mesh);
+
+            for (size_t mn = 0; mn < n_mode; ++mn)
+                for (size_t pf = 0; pf < n_filter; ++pf)
+                    function(mn, pf, abs(detectors[(mn * n_mesh + mesh) * n_filter + pf].get_coupling_from_fields(scatterer, theta_field, phi_field)));
+        }
+
         static size_t flatten_multi_index(const std::vector<size_t>& multi_index, const std::vector<size_t>& dimensions) { // Trust chatGPT on that one
             size_t flatten_index = 0;
             size_t stride = 1;
@@ -50,12 +519,98 @@ class Experiment
             return flatten_index;
         }
 
+        // Sorts the requested measures into real-valued measures, multipole coefficients and coupling.
+        template<typename Scatterer>
+        static void split_measures(
+            const std::vector<std::string> &measures,
+            const MeasureMap<Scatterer> &measure_map,
+            const CoefficientMap<Scatterer> &coefficient_map,
+            std::vector<std::string> &data_labels,
+            std::vector<std::string> &coefficient_labels,
+            bool &with_coupling)
+        {
+            with_coupling = false;
+
+            for (const std::string &measure : measures)
+            {
+                if (measure_map.count(measure))
+                    data_labels.push_back(measure);
+                else if (coefficient_map.count(measure))
+                    coefficient_labels.push_back(measure);
+                else if (measure == "coupling")
+                    with_coupling = true;
+                else
+                    throw std::invalid_argument("Invalid measure: " + measure);
+            }
+        }
+
+        // Rows of a table of points, each row holding the indices of a point along every axis of the given shape.
+        static std::vector<std::vector<size_t>> get_point_indices(const pybind11::array_t<size_t> &indices, const std::vector<size_t> &shape)
+        {
+            if (indices.ndim() != 2 || static_cast<size_t>(indices.shape(1)) != shape.size())
+                throw std::invalid_argument("The table of points must be a 2D array with " + std::to_string(shape.size()) + " indices per row.");
+
+            auto table = indices.unchecked<2>();
+
+            std::vector<std::vector<size_t>> points(table.shape(0), std::vector<size_t>(shape.size()));
+
+            for (size_t p = 0; p < points.size(); ++p)
+            for (size_t axis = 0; axis < shape.size(); ++axis)
+            {
+                if (table(p, axis) >= shape[axis])
+                    throw std::invalid_argument("Point index " + std::to_string(table(p, axis)) + " out of range for axis " + std::to_string(axis) + " of size " + std::to_string(shape[axis]));
+
+                points[p][axis] = table(p, axis);
+            }
+
+            return points;
+        }
+
+        // Detectors of the points, whose detector indices start at first_axis. Each distinct detector is built once,
+        // detector_index then maps every point to its detector.
+        std::vector<DETECTOR::Detector> get_point_detectors(const std::vector<std::vector<size_t>> &points, size_t first_axis, std::vector<size_t> &detector_index) const
+        {
+            std::map<size_t, size_t> flat_to_detector;
+            std::vector<std::vector<size_t>> detector_points;
+
+            detector_index.resize(points.size());
+
+            for (size_t p = 0; p < points.size(); ++p)
+            {
+                std::vector<size_t> multi_index(points[p].begin() + first_axis, points[p].end());
+
+                auto [iterator, inserted] = flat_to_detector.emplace(flatten_multi_index(multi_index, detectorSet.shape), detector_points.size());
+
+                if (inserted)
+                    detector_points.push_back(multi_index);
+
+                detector_index[p] = iterator->second;
+            }
+
+            std::vector<DETECTOR::Detector> detectors(detector_points.size());
+
+            pybind11::gil_scoped_release release;
+
+            #pragma omp parallel for schedule(dynamic) num_threads(get_num_threads())
+            for (size_t d = 0; d < detector_points.size(); ++d)
+            {
+                const std::vector<size_t> &index = detector_points[d];
+                detectors[d] = detectorSet.to_object(index[0], index[1], index[2], index[3], index[4], index[5], index[6]);
+            }
+
+            return detectors;
+        }
+
         //--------------------------------------SPHERE------------------------------------
-        template<typename Function> pybind11::array_t<complex128> get_sphere_coefficient(Function function, size_t max_order=0) const;
+        template<typename Function> pybind11::array_t<complex128> get_sphere_coefficient(Function function, size_t max_order=0, const pybind11::object &out = pybind11::none()) const;
+
+        template<typename Function> pybind11::array_t<double> get_sphere_data(Function function, const SourceDependency &dependency, const pybind11::object &out = pybind11::none()) const;
+
+        pybind11::array_t<double> get_sphere_coupling(const pybind11::object &out = pybind11::none()) const;
 
-        template<typename Function> pybind11::array_t<double> get_sphere_data(Function function) const;
+        pybind11::dict get_sphere_many(const std::vector<std::string> &measures) const;
 
-        pybind11::array_t<double> get_sphere_coupling() const;
+        pybind11::array get_sphere_points(const std::string &measure, const pybind11::array_t<size_t> &indices) const;
 
         DEFINE_SPHERE_FUNCTION(Qsca)
         DEFINE_SPHERE_FUNCTION(Qext)
@@ -72,13 +627,18 @@ class Experiment
         DEFINE_SPHERE_FUNCTION(Cratio)
         DEFINE_SPHERE_FUNCTION(Cforward)
         DEFINE_SPHERE_FUNCTION(g)
+        DEFINE_SPHERE_FUNCTION(max_order)
 
         //--------------------------------------CYLINDER------------------------------------
-        template<typename Function> pybind11::array_t<complex128> get_cylinder_coefficient(Function function, size_t max_order=0) const;
+        template<typename Function> pybind11::array_t<complex128> get_cylinder_coefficient(Function function, size_t max_order=0, const pybind11::object &out = pybind11::none()) const;
 
-        template<typename Function> pybind11::array_t<double> get_cylinder_data(Function function) const;
+        template<typename Function> pybind11::array_t<double> get_cylinder_data(Function function, const SourceDependency &dependency, const pybind11::object &out = pybind11::none()) const;
 
-        pybind11::array_t<double> get_cylinder_coupling() const;
+        pybind11::array_t<double> get_cylinder_coupling(const pybind11::object &out = pybind11::none()) const;
+
+        pybind11::dict get_cylinder_many(const std::vector<std::string> &measures) const;
+
+        pybind11::array get_cylinder_points(const std::string &measure, const pybind11::array_t<size_t> &indices) const;
 
         DEFINE_CYLINDER_FUNCTION(Qsca)
         DEFINE_CYLINDER_FUNCTION(Qext)
@@ -87,13 +647,18 @@ class Experiment
         DEFINE_CYLINDER_FUNCTION(Cext)
         DEFINE_CYLINDER_FUNCTION(Cabs)
         DEFINE_CYLINDER_FUNCTION(g)
+        DEFINE_CYLINDER_FUNCTION(max_order)
 
         //--------------------------------------CORESHELL------------------------------------
-        template<typename Function> pybind11::array_t<complex128> get_coreshell_coefficient(Function function, size_t max_order=0) const;
+        template<typename Function> pybind11::array_t<complex128> get_coreshell_coefficient(Function function, size_t max_order=0, const pybind11::object &out = pybind11::none()) const;
+
+        template<typename Function> pybind11::array_t<double> get_coreshell_data(Function function, const SourceDependency &dependency, const pybind11::object &out = pybind11::none()) const;
 
-        template<typename Function> pybind11::array_t<double> get_coreshell_data(Function function) const;
+        pybind11::array_t<double> get_coreshell_coupling(const pybind11::object &out = pybind11::none()) const;
 
-        pybind11::array_t<double> get_coreshell_coupling() const;
+        pybind11::dict get_coreshell_many(const std::vector<std::string> &measures) const;
+
+        pybind11::array get_coreshell_points(const std::string &measure, const pybind11::array_t<size_t> &indices) const;
 
         DEFINE_CORESHELL_FUNCTION(Qsca)
         DEFINE_CORESHELL_FUNCTION(Qext)
@@ -110,42 +675,162 @@ class Experiment
         DEFINE_CORESHELL_FUNCTION(Cratio)
         DEFINE_CORESHELL_FUNCTION(Cforward)
         DEFINE_CORESHELL_FUNCTION(g)
+        DEFINE_CORESHELL_FUNCTION(max_order)
 
 
         pybind11::array_t<complex128> get_sphere_an(size_t max_order) const { return get_sphere_coefficient( &SPHERE::Scatterer::get_an, max_order ) ; }
         pybind11::array_t<complex128> get_sphere_bn(size_t max_order) const { return get_sphere_coefficient( &SPHERE::Scatterer::get_bn, max_order ) ; }
-        pybind11::array_t<complex128> get_sphere_a1() const { return get_sphere_coefficient( &SPHERE::Scatterer::get_an, 1 ) ; }
-        pybind11::array_t<complex128> get_sphere_b1() const { return get_sphere_coefficient( &SPHERE::Scatterer::get_bn, 1 ) ; }
-        pybind11::array_t<complex128> get_sphere_a2() const { return get_sphere_coefficient( &SPHERE::Scatterer::get_an, 2 ) ; }
-        pybind11::array_t<complex128> get_sphere_b2() const { return get_sphere_coefficient( &SPHERE::Scatterer::get_bn, 2 ) ; }
-        pybind11::array_t<complex128> get_sphere_a3() const { return get_sphere_coefficient( &SPHERE::Scatterer::get_an, 3 ) ; }
-        pybind11::array_t<complex128> get_sphere_b3() const { return get_sphere_coefficient( &SPHERE::Scatterer::get_bn, 3 ) ; }
+        pybind11::array_t<complex128> get_sphere_a1(const pybind11::object &out = pybind11::none()) const { return get_sphere_coefficient( &SPHERE::Scatterer::get_an, 1, out ) ; }
+        pybind11::array_t<complex128> get_sphere_b1(const pybind11::object &out = pybind11::none()) const { return get_sphere_coefficient( &SPHERE::Scatterer::get_bn, 1, out ) ; }
+        pybind11::array_t<complex128> get_sphere_a2(const pybind11::object &out = pybind11::none()) const { return get_sphere_coefficient( &SPHERE::Scatterer::get_an, 2, out ) ; }
+        pybind11::array_t<complex128> get_sphere_b2(const pybind11::object &out = pybind11::none()) const { return get_sphere_coefficient( &SPHERE::Scatterer::get_bn, 2, out ) ; }
+        pybind11::array_t<complex128> get_sphere_a3(const pybind11::object &out = pybind11::none()) const { return get_sphere_coefficient( &SPHERE::Scatterer::get_an, 3, out ) ; }
+        pybind11::array_t<complex128> get_sphere_b3(const pybind11::object &out = pybind11::none()) const { return get_sphere_coefficient( &SPHERE::Scatterer::get_bn, 3, out ) ; }
 
         pybind11::array_t<complex128> get_cylinder_a1n(size_t max_order) const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_a1n, max_order ) ; }
         pybind11::array_t<complex128> get_cylinder_b1n(size_t max_order) const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_b1n, max_order ) ; }
         pybind11::array_t<complex128> get_cylinder_a2n(size_t max_order) const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_a2n, max_order ) ; }
         pybind11::array_t<complex128> get_cylinder_b2n(size_t max_order) const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_b2n, max_order ) ; }
-        pybind11::array_t<complex128> get_cylinder_a11() const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_a1n, 1 ) ; }
-        pybind11::array_t<complex128> get_cylinder_b11() const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_b1n, 1 ) ; }
-        pybind11::array_t<complex128> get_cylinder_a21() const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_a2n, 1 ) ; }
-        pybind11::array_t<complex128> get_cylinder_b21() const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_b2n, 1 ) ; }
-        pybind11::array_t<complex128> get_cylinder_a12() const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_a1n, 2 ) ; }
-        pybind11::array_t<complex128> get_cylinder_b12() const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_b1n, 2 ) ; }
-        pybind11::array_t<complex128> get_cylinder_a22() const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_a2n, 2 ) ; }
-        pybind11::array_t<complex128> get_cylinder_b22() const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_b2n, 2 ) ; }
-        pybind11::array_t<complex128> get_cylinder_a13() const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_a1n, 3 ) ; }
-        pybind11::array_t<complex128> get_cylinder_b13() const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_b1n, 3 ) ; }
-        pybind11::array_t<complex128> get_cylinder_a23() const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_a2n, 3 ) ; }
-        pybind11::array_t<complex128> get_cylinder_b23() const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_b2n, 3 ) ; }
+        pybind11::array_t<complex128> get_cylinder_a11(const pybind11::object &out = pybind11::none()) const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_a1n, 1, out ) ; }
+        pybind11::array_t<complex128> get_cylinder_b11(const pybind11::object &out = pybind11::none()) const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_b1n, 1, out ) ; }
+        pybind11::array_t<complex128> get_cylinder_a21(const pybind11::object &out = pybind11::none()) const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_a2n, 1, out ) ; }
+        pybind11::array_t<complex128> get_cylinder_b21(const pybind11::object &out = pybind11::none()) const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_b2n, 1, out ) ; }
+        pybind11::array_t<complex128> get_cylinder_a12(const pybind11::object &out = pybind11::none()) const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_a1n, 2, out ) ; }
+        pybind11::array_t<complex128> get_cylinder_b12(const pybind11::object &out = pybind11::none()) const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_b1n, 2, out ) ; }
+        pybind11::array_t<complex128> get_cylinder_a22(const pybind11::object &out = pybind11::none()) const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_a2n, 2, out ) ; }
+        pybind11::array_t<complex128> get_cylinder_b22(const pybind11::object &out = pybind11::none()) const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_b2n, 2, out ) ; }
+        pybind11::array_t<complex128> get_cylinder_a13(const pybind11::object &out = pybind11::none()) const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_a1n, 3, out ) ; }
+        pybind11::array_t<complex128> get_cylinder_b13(const pybind11::object &out = pybind11::none()) const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_b1n, 3, out ) ; }
+        pybind11::array_t<complex128> get_cylinder_a23(const pybind11::object &out = pybind11::none()) const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_a2n, 3, out ) ; }
+        pybind11::array_t<complex128> get_cylinder_b23(const pybind11::object &out = pybind11::none()) const { return get_cylinder_coefficient( &CYLINDER::Scatterer::get_b2n, 3, out ) ; }
 
         pybind11::array_t<complex128> get_coreshell_an(size_t max_order) const { return get_coreshell_coefficient( &CORESHELL::Scatterer::get_an, max_order ) ; }
         pybind11::array_t<complex128> get_coreshell_bn(size_t max_order) const { return get_coreshell_coefficient( &CORESHELL::Scatterer::get_bn, max_order ) ; }
-        pybind11::array_t<complex128> get_coreshell_a1() const { return get_coreshell_coefficient( &CORESHELL::Scatterer::get_an, 1 ) ; }
-        pybind11::array_t<complex128> get_coreshell_b1() const { return get_coreshell_coefficient( &CORESHELL::Scatterer::get_bn, 1 ) ; }
-        pybind11::array_t<complex128> get_coreshell_a2() const { return get_coreshell_coefficient( &CORESHELL::Scatterer::get_an, 2 ) ; }
-        pybind11::array_t<complex128> get_coreshell_b2() const { return get_coreshell_coefficient( &CORESHELL::Scatterer::get_bn, 2 ) ; }
-        pybind11::array_t<complex128> get_coreshell_a3() const { return get_coreshell_coefficient( &CORESHELL::Scatterer::get_an, 3 ) ; }
-        pybind11::array_t<complex128> get_coreshell_b3() const { return get_coreshell_coefficient( &CORESHELL::Scatterer::get_bn, 3 ) ; }
+        pybind11::array_t<complex128> get_coreshell_a1(const pybind11::object &out = pybind11::none()) const { return get_coreshell_coefficient( &CORESHELL::Scatterer::get_an, 1, out ) ; }
+        pybind11::array_t<complex128> get_coreshell_b1(const pybind11::object &out = pybind11::none()) const { return get_coreshell_coefficient( &CORESHELL::Scatterer::get_bn, 1, out ) ; }
+        pybind11::array_t<complex128> get_coreshell_a2(const pybind11::object &out = pybind11::none()) const { return get_coreshell_coefficient( &CORESHELL::Scatterer::get_an, 2, out ) ; }
+        pybind11::array_t<complex128> get_coreshell_b2(const pybind11::object &out = pybind11::none()) const { return get_coreshell_coefficient( &CORESHELL::Scatterer::get_bn, 2, out ) ; }
+        pybind11::array_t<complex128> get_coreshell_a3(const pybind11::object &out = pybind11::none()) const { return get_coreshell_coefficient( &CORESHELL::Scatterer::get_an, 3, out ) ; }
+        pybind11::array_t<complex128> get_coreshell_b3(const pybind11::object &out = pybind11::none()) const { return get_coreshell_coefficient( &CORESHELL::Scatterer::get_bn, 3, out ) ; }
 };
 
 
+// Destination of the values of a measure computed over the reduced shape of its result. When an out array is given, or
+// direct is set, they are written straight into the result at every point they are broadcast to, so that no intermediate
+// result is held in memory. Otherwise they are stored over the reduced shape, of which get_array returns a broadcast view.
+// The values of reduced results are accumulated into the weighted mean and variance of their point as they are stored.
+template <typename T>
+class ResultBuffer
+{
+    public:
+        ResultBuffer(const Experiment &experiment, const std::vector<size_t> &reduced_shape, const std::vector<size_t> &full_shape, const pybind11::object &out, bool direct = false)
+        : experiment(experiment), values_shape(experiment.get_statistics_shape(reduced_shape)), result_shape(experiment.get_statistics_shape(full_shape))
+        {
+            variance_stride = experiment.get_variance_stride(result_shape);
+
+            if (direct || !out.is_none())
+            {
+                output_array = get_output_array<T>(result_shape, out);
+                output = output_array.mutable_data();
+                offsets = get_broadcast_offsets(values_shape, result_shape);
+            }
+            else
+                values.resize(get_vector_sigma(values_shape));
+        }
+
+        bool is_direct() const { return output != nullptr; }
+
+        // Stores the value of the point of multi_index, over the reduced shape. The points of reduced results must be stored
+        // by a single thread, in the order of the reduced axis.
+        void store(std::vector<size_t> multi_index, T value)
+        {
+            size_t step = 0;
+
+            if (variance_stride != 0)
+                std::swap(step, multi_index[experiment.reduction_axis]);
+
+            T *point = is_direct()
+                ? output + Experiment::flatten_multi_index(multi_index, result_shape)
+                : values.data() + Experiment::flatten_multi_index(multi_index, values_shape);
+
+            if (variance_stride == 0)
+                point[0] = value;
+            else
+                accumulate(point, step, value);
+
+            if (!is_direct())
+                return;
+
+            for (size_t i = 1; i < offsets.size(); ++i)
+            {
+                point[offsets[i]] = point[0];
+
+                if (variance_stride != 0)
+                    point[offsets[i] + variance_stride] = point[variance_stride];
+            }
+        }
+
+        pybind11::array_t<T> get_array()
+        {
+            if (is_direct())
+                return output_array;
+
+            return vector_to_broadcast_numpy(std::move(values), values_shape, result_shape);
+        }
+
+    private:
+        const Experiment &experiment;
+        std::vector<size_t> values_shape, result_shape, offsets;
+        size_t variance_stride;
+        std::vector<T> values;
+        pybind11::array_t<T> output_array;
+        T *output = nullptr;
+
+        // West's update of the weighted mean and of the weighted sum of the squared deviations, held at variance_stride from
+        // the mean, with the value of the given step. The weights summing to 1, that sum is the variance once every step is
+        // accumulated. It is computed from the deviations to the mean, which keeps its precision when the spread is small.
+        void accumulate(T *point, size_t step, T value) const
+        {
+            if (step == 0)
+                point[0] = point[variance_stride] = 0;
+
+            double
+                weight = experiment.reduction_weights[step],
+                total = experiment.reduction_totals[step];
+
+            if (total == 0)
+                return;
+
+            T delta = value - point[0];
+
+            point[0] += weight / total * delta;
+            point[variance_stride] += weight * delta * (value - point[0]);
+        }
+
+        // Flat offsets, in an array of full_shape, of the points a value computed over reduced_shape is broadcast to.
+        static std::vector<size_t> get_broadcast_offsets(const std::vector<size_t> &reduced_shape, const std::vector<size_t> &full_shape)
+        {
+            std::vector<size_t> offsets = {0};
+
+            for (size_t i = 0, stride = get_vector_sigma(full_shape); i < full_shape.size(); ++i)
+            {
+                stride /= full_shape[i];
+
+                if (reduced_shape[i] == full_shape[i])
+                    continue;
+
+                std::vector<size_t> broadcast_offsets;
+
+                for (size_t offset : offsets)
+                    for (size_t j = 0; j < full_shape[i]; ++j)
+                        broadcast_offsets.push_back(offset + j * stride);
+
+                offsets = std::move(broadcast_offsets);
+            }
+
+            return offsets;
+        }
+};
+
+
+
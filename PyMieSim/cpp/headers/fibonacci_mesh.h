@@ -2,6 +2,7 @@
 
 #include <vector>
 #include <cmath>
+#include <string>
 #include "coordinates.cpp"
 #include "utils.cpp"
 #include "numpy_interface.cpp"
@@ -17,6 +18,10 @@ class FibonacciMesh {
         double gamma_offset = 0.0;
         double dOmega = 0.0;
         double Omega = 0.0;
+        std::string quadrature = "fibonacci";
+
+        // Solid angle of each point relative to dOmega, empty for the equal-area points of the Fibonacci quadrature.
+        std::vector<double> weights;
 
         Spherical spherical_coordinates;
         Cartesian cartesian_coordinates;
@@ -34,11 +39,18 @@ class FibonacciMesh {
 
         FibonacciMesh() = default;
 
-        FibonacciMesh(int sampling, double max_angle, double phi_offset, double gamma_offset, double rotation):
-            sampling(sampling), max_angle(max_angle), phi_offset(phi_offset), gamma_offset(gamma_offset) {
+        FibonacciMesh(int sampling, double max_angle, double phi_offset, double gamma_offset, double rotation, const std::string &quadrature = "fibonacci"):
+            sampling(sampling), max_angle(max_angle), phi_offset(phi_offset), gamma_offset(gamma_offset), quadrature(quadrature) {
+
+            if (quadrature == "fibonacci") {
+                cartesian_coordinates = Cartesian(sampling);
+                compute_mesh();
+            }
+            else if (quadrature == "gauss")
+                compute_gauss_mesh();
+            else
+                throw std::invalid_argument("Invalid quadrature: " + quadrature + ", must be either 'fibonacci' or 'gauss'");
 
-            cartesian_coordinates = Cartesian(sampling);
-            compute_mesh();
             base_cartesian_coordinates = cartesian_coordinates;
 
             rotate_around_center();
@@ -53,8 +65,11 @@ class FibonacciMesh {
         void compute_projections();
         void rotate_around_axis(double angle);
         void compute_mesh();
+        void compute_gauss_mesh();
         void compute_properties();
 
+        size_t get_memory_size() const;
+
         double NA2Angle(double NA) const;
 
         std::vector<double> get_principal_axis() const;
@@ -75,6 +90,8 @@ class FibonacciMesh {
         py::array_t<double> get_base_y_py() const {return vector_to_numpy_copy(base_cartesian_coordinates.y);};
         py::array_t<double> get_base_z_py() const {return vector_to_numpy_copy(base_cartesian_coordinates.z);};
 
+        py::array_t<double> get_weights_py() const;
+
         py::array_t<double> get_r_py() const {return vector_to_numpy_copy(spherical_coordinates.r);};
         py::array_t<double> get_phi_py() const {return vector_to_numpy_copy(spherical_coordinates.phi);};
         py::array_t<double> get_theta_py() const { return vector_to_numpy_copy(spherical_coordinates.theta);};
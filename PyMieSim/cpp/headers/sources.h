@@ -3,6 +3,7 @@
 #include <vector>
 #include <complex>
 #include <cmath> // For std::isnan
+#include "utils.cpp"
 
 #define PI (double)3.14159265358979323846264338
 #define EPSILON0 (double)8.854187817620389e-12
@@ -87,6 +88,25 @@ namespace SOURCE
                 };
             }
 
+            // Sub-set restricted to the indices [start, stop) of one of its axes {wavelength, jones_vector, NA, optical_power}.
+            Set slice(size_t axis, size_t start, size_t stop) const
+            {
+                Set output = *this;
+
+                switch (axis)
+                {
+                    case 0: output.wavelength = slice_vector(wavelength, start, stop); break;
+                    case 1: output.jones_vector = slice_vector(jones_vector, start, stop); break;
+                    case 2: output.NA = slice_vector(NA, start, stop); break;
+                    case 3: output.optical_power = slice_vector(optical_power, start, stop); break;
+                    default: throw std::invalid_argument("Invalid source set axis: " + std::to_string(axis));
+                }
+
+                output.shape = {output.wavelength.size(), output.jones_vector.size(), output.NA.size(), output.optical_power.size()};
+
+                return output;
+            }
+
             Gaussian to_object(size_t index_wavelength, size_t index_jones, size_t index_na, size_t index_optical_power) const
             {
                 return Gaussian(
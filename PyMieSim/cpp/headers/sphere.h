@@ -6,6 +6,7 @@ using complex128 = std::complex<double>;
 #include <iostream>
 namespace SPHERE
 {
+    using RiccatiBessel = std::tuple<std::vector<double>, std::vector<double>>;
 
     class Scatterer: public BaseSphericalScatterer
     {
@@ -13,18 +14,39 @@ namespace SPHERE
             double diameter;
             complex128 index;
 
-            Scatterer(const double diameter, const complex128 index, const double medium_index, const SOURCE::BaseSource &source, size_t max_order = 0) :
+            Scatterer(const double diameter, const complex128 index, const double medium_index, const SOURCE::BaseSource &source, size_t max_order = 0, const double tolerance = 0) :
                 BaseSphericalScatterer(source, max_order, medium_index), diameter(diameter), index(index)
             {
                 this->compute_area();
                 this->compute_size_parameter();
                 this->max_order = (max_order == 0) ? this->get_wiscombe_criterion(this->size_parameter) : max_order;
                 this->compute_an_bn();
+                this->truncate_series(tolerance);
+            }
 
+            // Reuses the Riccati-Bessel functions of the size parameter, e.g. for a sweep over the scatterer index, max_order follows from their size.
+            Scatterer(const double diameter, const complex128 index, const double medium_index, const SOURCE::BaseSource &source, const RiccatiBessel &riccati_bessel, const double tolerance = 0) :
+                BaseSphericalScatterer(source, std::get<0>(riccati_bessel).size() - 1, medium_index), diameter(diameter), index(index)
+            {
+                this->compute_area();
+                this->compute_size_parameter();
+                this->compute_an_bn(riccati_bessel);
+                this->truncate_series(tolerance);
+            }
+
+            static double get_size_parameter(const double diameter, const double wavelength, const double medium_index) {
+                return PI * diameter / wavelength * medium_index;
+            }
+
+            // Riccati-Bessel functions psi_n, chi_n of the size parameter up to the Wiscombe criterion, independent of the scatterer index.
+            static RiccatiBessel compute_riccati_bessel(const double diameter, const double wavelength, const double medium_index) {
+                double size_parameter = get_size_parameter(diameter, wavelength, medium_index);
+
+                return VSH::SPHERICAL::compute_riccati_bessel(get_wiscombe_criterion(size_parameter), size_parameter);
             }
 
             void compute_size_parameter() override {
-                this->size_parameter = PI * this->diameter / this->source.wavelength * this->medium_index;
+                this->size_parameter = get_size_parameter(this->diameter, this->source.wavelength, this->medium_index);
             }
 
             void compute_area() override {
@@ -33,6 +55,7 @@ namespace SPHERE
 
             void compute_cn_dn();
             void compute_an_bn();
+            void compute_an_bn(const RiccatiBessel &riccati_bessel);
     };
 
     class Set
@@ -42,6 +65,7 @@ namespace SPHERE
             std::variant<std::vector<complex128>, std::vector<std::vector<complex128>>> scatterer;
             std::variant<std::vector<double>, std::vector<std::vector<double>>> medium;
             std::vector<size_t> shape;
+            std::vector<size_t> zip_map; // Axis followed by each axis of the set, see get_zip_map, empty when every axis is independent.
 
             Set() = default;
 
@@ -54,6 +78,18 @@ namespace SPHERE
                 update_shape();
             }
 
+            // Makes the parameters of the given axes vary together, the set then iterates over their tuples.
+            void zip_axes(const std::vector<size_t> &axes)
+            {
+                zip_map.clear();
+                update_shape();
+
+                zip_map = get_zip_map(shape, axes);
+                update_shape();
+            }
+
+            size_t get_zip_axis(size_t axis) const { return zip_map.empty() ? axis : zip_map[axis]; }
+
             void update_shape() {
                 shape.clear();
                 shape.push_back(diameter.size());
@@ -67,17 +103,99 @@ namespace SPHERE
                     shape.push_back(std::get<std::vector<std::vector<double>>>(medium).size());
                 else
                     shape.push_back(std::get<std::vector<double>>(medium).size());
+
+                for (size_t axis = 0; axis < zip_map.size(); ++axis)
+                    if (zip_map[axis] != axis)
+                        shape[axis] = 1;
             }
 
-        Scatterer to_object(size_t d, size_t i, size_t wl, size_t mi, SOURCE::BaseSource& source) const
+        complex128 get_index(size_t i, size_t wl) const
+        {
+            return std::holds_alternative<std::vector<std::vector<complex128>>>(scatterer) ? std::get<std::vector<std::vector<complex128>>>(scatterer)[i][wl] : std::get<std::vector<complex128>>(scatterer)[i];
+        }
+
+        double get_medium_index(size_t mi, size_t wl) const
+        {
+            return std::holds_alternative<std::vector<std::vector<double>>>(medium) ? std::get<std::vector<std::vector<double>>>(medium)[mi][wl] : std::get<std::vector<double>>(medium)[mi];
+        }
+
+        // Sub-set restricted to the indices [start, stop) of one of its axes {diameter, index, medium}. The parameters of zipped
+        // axes are sliced along the axis they follow, the others having a size of 1.
+        Set slice(size_t axis, size_t start, size_t stop) const
         {
+            if (axis >= shape.size())
+                throw std::invalid_argument("Invalid sphere set axis: " + std::to_string(axis));
+
+            Set output = *this;
+
+            for (size_t parameter = 0; parameter < shape.size(); ++parameter)
+            {
+                if (get_zip_axis(parameter) != axis)
+                    continue;
+
+                switch (parameter)
+                {
+                    case 0: output.diameter = slice_vector(diameter, start, stop); break;
+                    case 1: output.scatterer = slice_vector(scatterer, start, stop); break;
+                    case 2: output.medium = slice_vector(medium, start, stop); break;
+                }
+            }
+
+            output.update_shape();
+
+            return output;
+        }
+
+        // Same set for the source wavelengths [start, stop), the materials being tabulated per wavelength.
+        Set slice_wavelength(size_t start, size_t stop) const
+        {
+            Set output = *this;
+
+            ::slice_wavelength(output.scatterer, start, stop);
+            ::slice_wavelength(output.medium, start, stop);
+
+            return output;
+        }
+
+        // The tolerance truncates the series of coefficients, see BaseSphericalScatterer::truncate_series.
+        Scatterer to_object(size_t d, size_t i, size_t wl, size_t mi, SOURCE::BaseSource& source, double tolerance = 0) const
+        {
+            auto [d_, i_, mi_] = unzip_index<3>({d, i, mi}, zip_map);
+
+            return Scatterer(
+                diameter[d_],
+                this->get_index(i_, wl),
+                this->get_medium_index(mi_, wl),
+                source,
+                0,
+                tolerance
+            );
+        }
+
+        Scatterer to_object(size_t d, size_t i, size_t wl, size_t mi, SOURCE::BaseSource& source, const RiccatiBessel &riccati_bessel, double tolerance = 0) const
+        {
+            // The ladders are shared along the index axis, which no longer holds when the medium varies with the index.
+            if (get_zip_axis(2) == 1)
+                return to_object(d, i, wl, mi, source, tolerance);
+
+            auto [d_, i_, mi_] = unzip_index<3>({d, i, mi}, zip_map);
+
             return Scatterer(
-                diameter[d],
-                std::holds_alternative<std::vector<std::vector<complex128>>>(scatterer) ? std::get<std::vector<std::vector<complex128>>>(scatterer)[i][wl] : std::get<std::vector<complex128>>(scatterer)[i],
-                std::holds_alternative<std::vector<std::vector<double>>>(medium) ? std::get<std::vector<std::vector<double>>>(medium)[mi][wl] : std::get<std::vector<double>>(medium)[mi],
-                source
+                diameter[d_],
+                this->get_index(i_, wl),
+                this->get_medium_index(mi_, wl),
+                source,
+                riccati_bessel,
+                tolerance
             );
         }
+
+        RiccatiBessel get_riccati_bessel(size_t d, size_t wl, size_t mi, const SOURCE::BaseSource& source) const
+        {
+            auto [d_, i_, mi_] = unzip_index<3>({d, 0, mi}, zip_map);
+
+            return Scatterer::compute_riccati_bessel(diameter[d_], source.wavelength, this->get_medium_index(mi_, wl));
+        }
     };
 }
 
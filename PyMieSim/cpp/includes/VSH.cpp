@@ -17,6 +17,46 @@ namespace VSH{
            return Dn;
         }
 
+        // Riccati-Bessel functions psi_n(x) = x j_n(x) and chi_n(x) = -x y_n(x) for orders 0 to max_order and a real argument.
+        // chi_n is stable in upward recurrence for every order, psi_n only up to n ~ x: above it, psi_n is obtained
+        // from the ratios psi_n / psi_{n-1} computed by downward recurrence, as for the logarithmic derivative.
+        inline std::tuple<std::vector<double>, std::vector<double>> compute_riccati_bessel(size_t max_order, double x)
+        {
+            std::vector<double> psi(max_order + 1), chi(max_order + 1);
+
+            psi[0] = sin(x);
+            chi[0] = cos(x);
+
+            if (max_order == 0)
+                return std::make_tuple(psi, chi);
+
+            psi[1] = psi[0] / x - chi[0];
+            chi[1] = chi[0] / x + psi[0];
+
+            for (size_t order = 1; order < max_order; ++order)
+                chi[order + 1] = (2. * order + 1.) / x * chi[order] - chi[order - 1];
+
+            size_t switch_order = std::max<size_t>(1, std::min(max_order, static_cast<size_t>(x)));
+
+            for (size_t order = 1; order < switch_order; ++order)
+                psi[order + 1] = (2. * order + 1.) / x * psi[order] - psi[order - 1];
+
+            if (switch_order == max_order)
+                return std::make_tuple(psi, chi);
+
+            size_t nmx = std::max(max_order, static_cast<size_t>(x)) + 16 + static_cast<size_t>(std::sqrt(x));
+
+            std::vector<double> ratio(nmx + 2, 0.0);
+
+            for (size_t order = nmx; order > switch_order; --order)
+                ratio[order] = 1. / ((2. * order + 1.) / x - ratio[order + 1]);
+
+            for (size_t order = switch_order + 1; order < max_order + 1; ++order)
+                psi[order] = ratio[order] * psi[order - 1];
+
+            return std::make_tuple(psi, chi);
+        }
+
         inline std::tuple<std::vector<complex128>, std::vector<complex128>> MiePiTau(double mu, size_t max_order)
         {
           std::vector<complex128> pin, taun;
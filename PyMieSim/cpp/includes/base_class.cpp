@@ -2,6 +2,7 @@
 
 #include "utils.cpp"
 #include <vector>
+#include <algorithm>
 #include <pybind11/pybind11.h>
 #include <pybind11/numpy.h>
 #include "sources.cpp"
@@ -58,10 +59,27 @@ public:
         return source.amplitude / (source.k * radius) * exp(-complex128(0, 1) * source.k * radius);
     }
 
-    size_t get_wiscombe_criterion(const double size_parameter) const {
+    static size_t get_wiscombe_criterion(const double size_parameter) {
         return static_cast<size_t>(2 + size_parameter + 4 * std::cbrt(size_parameter)) + 16;
     }
 
+    // Number of orders kept up to the last term above tolerance times the largest one, the terms past the size parameter
+    // decaying faster than geometrically. The first orders are always kept as the multipole measures read them.
+    static size_t get_truncated_order(const std::vector<double> &terms, const double tolerance) {
+        double threshold = tolerance * *std::max_element(terms.begin(), terms.end());
+
+        size_t order = terms.size();
+
+        while (order > min_truncated_order && terms[order - 1] <= threshold)
+            --order;
+
+        return order;
+    }
+
+    static constexpr size_t min_truncated_order = 4;
+
+    double get_max_order() const { return static_cast<double>(max_order); }
+
     std::tuple<std::vector<complex128>, std::vector<complex128>>
     compute_structured_fields(const std::vector<complex128>& S1, const std::vector<complex128>& S2, const std::vector<double>& theta, const double& radius = 1.) const {
         std::vector<complex128> phi_field, theta_field;
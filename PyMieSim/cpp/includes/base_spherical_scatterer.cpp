@@ -7,6 +7,7 @@
 #include <cmath>
 #include <vector>
 #include <complex>
+#include <optional>
 #include <base_class.cpp>
 
 #include <pybind11/pybind11.h>
@@ -22,6 +23,8 @@ public:
     std::vector<complex128> cn;
     std::vector<complex128> dn;
 
+    mutable std::optional<double> Qsca_sum, Qext_sum, Qback_sum, g_sum;
+
     BaseSphericalScatterer() = default;
     virtual ~BaseSphericalScatterer() = default;
 
@@ -45,28 +48,41 @@ public:
     double get_Cratio() const {return get_Qratio() * area;};
 
     double get_g() const {
-        double value = 0;
+        return get_g_sum() * 4. / ( get_Qsca() * pow(size_parameter, 2) );
+    }
 
-          for(size_t it = 0; it < max_order-1; ++it) {
-             double n = (double) it + 1;
+    double get_Qsca() const {
+        return get_Qsca_sum() * 2. / pow( size_parameter, 2.);
+    }
 
-              value += ( n * (n + 2.) / (n + 1.) ) * std::real(this->an[it] * std::conj(this->an[it+1]) + this->bn[it] * std::conj(this->bn[it+1]) );
-              value += ( (2. * n + 1. ) / ( n * (n + 1.) ) )  * std::real( this->an[it] * std::conj(this->bn[it]) );
-          }
-          return value * 4. / ( get_Qsca() * pow(size_parameter, 2) );
-      }
+    double get_Qext() const {
+        return get_Qext_sum() * 2. / pow( size_parameter, 2.);
+    }
+
+    double get_Qback() const {
+        double value = get_Qback_sum() / pow(size_parameter, 2.);
+        return std::abs(value);
+    }
+
+    // Series sums over the coefficients, each summed once on first use. The size parameter and the area are
+    // applied on read since both remain writable from Python.
+    double get_Qsca_sum() const {
+        if (Qsca_sum)
+            return *Qsca_sum;
 
-    double get_Qsca() const {
         double value = 0;
 
         for(size_t it = 0; it < max_order; ++it){
             double n = (double) it + 1;
             value += (2.* n + 1.) * ( pow( std::abs(this->an[it]), 2) + pow( std::abs(this->bn[it]), 2)  );
         }
-        return value * 2. / pow( size_parameter, 2.);
+        return *(Qsca_sum = value);
     }
 
-    double get_Qext() const {
+    double get_Qext_sum() const {
+        if (Qext_sum)
+            return *Qext_sum;
+
         double value = 0;
         for(size_t it = 0; it < max_order; ++it)
         {
@@ -74,10 +90,13 @@ public:
             value += (2.* n + 1.) * std::real( this->an[it] + this->bn[it] );
 
         }
-        return value * 2. / pow( size_parameter, 2.);
+        return *(Qext_sum = value);
     }
 
-    double get_Qback() const {
+    double get_Qback_sum() const {
+        if (Qback_sum)
+            return *Qback_sum;
+
         complex128 value = 0;
 
         for(size_t it = 0; it < max_order-1; ++it)
@@ -87,8 +106,48 @@ public:
             value += (2. * n + 1) * pow(-1., n) * ( this->an[it] - this->bn[it] ) ;
         }
 
-        value = pow( std::abs(value), 2. ) / pow(size_parameter, 2.);
-        return std::abs(value);
+        return *(Qback_sum = pow( std::abs(value), 2. ));
+    }
+
+    double get_g_sum() const {
+        if (g_sum)
+            return *g_sum;
+
+        double value = 0;
+
+        for(size_t it = 0; it < max_order-1; ++it) {
+            double n = (double) it + 1;
+
+            value += ( n * (n + 2.) / (n + 1.) ) * std::real(this->an[it] * std::conj(this->an[it+1]) + this->bn[it] * std::conj(this->bn[it+1]) );
+            value += ( (2. * n + 1. ) / ( n * (n + 1.) ) )  * std::real( this->an[it] * std::conj(this->bn[it]) );
+        }
+        return *(g_sum = value);
+    }
+
+    // Drops the trailing orders whose |an| + |bn| fall below tolerance relative to the largest order, a tolerance of 0
+    // keeping every order of the Wiscombe criterion.
+    void truncate_series(const double tolerance) {
+        if (tolerance <= 0)
+            return;
+
+        std::vector<double> terms(max_order);
+
+        for (size_t it = 0; it < max_order; ++it)
+            terms[it] = std::abs(this->an[it]) + std::abs(this->bn[it]);
+
+        max_order = get_truncated_order(terms, tolerance);
+
+        an.resize(max_order);
+        bn.resize(max_order);
+
+        this->reset_sums();
+    }
+
+    void reset_sums() {
+        Qsca_sum.reset();
+        Qext_sum.reset();
+        Qback_sum.reset();
+        g_sum.reset();
     }
 
     std::tuple<std::vector<complex128>, std::vector<complex128>> compute_s1s2(const std::vector<double> &phi) const {
@@ -21,6 +21,8 @@ namespace CORESHELL
 
     void Scatterer::compute_an_bn()
     {
+        this->reset_sums();
+
         an.resize(max_order);
         bn.resize(max_order);
 
@@ -5,6 +5,35 @@
 namespace CYLINDER
 {
     double Scatterer::get_Qsca() const {
+        auto [Qsca1, Qsca2] = this->get_Qsca_sum();
+
+        Qsca1 =  2. / size_parameter * Qsca1;
+        Qsca2 =  2. / size_parameter * Qsca2;
+
+        return process_polarization(Qsca1, Qsca2);
+    }
+
+    double Scatterer::get_Qext() const {
+        auto [real_1, real_2] = this->get_Qext_sum();
+
+        complex128
+            Qext1 = 2. / size_parameter * real_1,
+            Qext2 = 2. / size_parameter * real_2;
+
+        return this->process_polarization(Qext1, Qext2);
+    }
+
+    double Scatterer::get_g() const {
+        if (!g_value)
+            g_value = this->get_g_with_fields(1000);
+
+        return *g_value;
+    }
+
+    std::pair<complex128, complex128> Scatterer::get_Qsca_sum() const {
+        if (Qsca_sum)
+            return *Qsca_sum;
+
         complex128 Qsca1=0, Qsca2=0;
 
         for(size_t order = 1; order < max_order; order++)
@@ -13,13 +42,13 @@ namespace CYLINDER
             Qsca2 +=  pow( std::abs(this->a2n[order]), 2 ) + pow( std::abs(this->b2n[order]), 2 ) ;
         }
 
-        Qsca1 =  2. / size_parameter * ( 2.0 * Qsca1 + pow( abs(this->b1n[0]), 2 ) );
-        Qsca2 =  2. / size_parameter * ( 2.0 * Qsca2 + pow( abs(this->a2n[0]), 2 ) );
-
-        return process_polarization(Qsca1, Qsca2);
+        return *(Qsca_sum = std::make_pair(2.0 * Qsca1 + pow( abs(this->b1n[0]), 2 ), 2.0 * Qsca2 + pow( abs(this->a2n[0]), 2 )));
     }
 
-    double Scatterer::get_Qext() const {
+    std::pair<double, double> Scatterer::get_Qext_sum() const {
+        if (Qext_sum)
+            return *Qext_sum;
+
         complex128 Qext1 = 0, Qext2 = 0;
 
         for(size_t it = 1; it < max_order; ++it){
@@ -27,21 +56,41 @@ namespace CYLINDER
             Qext2 += this->a2n[it];
         }
 
-        Qext1 = 2. / size_parameter * std::real( this->b1n[0] + 2.0 * Qext1 );
-        Qext2 = 2. / size_parameter * std::real( this->a1n[0] + 2.0 * Qext2 );
-
-        return this->process_polarization(Qext1, Qext2);
-    }
-
-    double Scatterer::get_g() const {
-        return this->get_g_with_fields(1000);
+        return *(Qext_sum = std::make_pair(std::real( this->b1n[0] + 2.0 * Qext1 ), std::real( this->a1n[0] + 2.0 * Qext2 )));
     }
 
     double Scatterer::process_polarization(const complex128 value_0, const complex128 value_1) const {
         return abs( value_1 ) * pow(abs(source.jones_vector[0]), 2) + abs( value_0 ) * pow(abs(source.jones_vector[1]), 2);
     }
 
+    // Drops the trailing orders whose coefficients of both polarizations fall below tolerance relative to the largest
+    // order, a tolerance of 0 keeping every order of the Wiscombe criterion.
+    void Scatterer::truncate_series(const double tolerance) {
+        if (tolerance <= 0)
+            return;
+
+        std::vector<double> terms(max_order);
+
+        for (size_t order = 0; order < max_order; ++order)
+            terms[order] = std::abs(this->a1n[order]) + std::abs(this->b1n[order]) + std::abs(this->a2n[order]) + std::abs(this->b2n[order]);
+
+        max_order = get_truncated_order(terms, tolerance);
+
+        this->a1n.resize(max_order);
+        this->b1n.resize(max_order);
+        this->a2n.resize(max_order);
+        this->b2n.resize(max_order);
+
+        this->Qsca_sum.reset();
+        this->Qext_sum.reset();
+        this->g_value.reset();
+    }
+
     void Scatterer::compute_an_bn() {
+        this->Qsca_sum.reset();
+        this->Qext_sum.reset();
+        this->g_value.reset();
+
         // Resize vectors to hold Mie coefficients for the specified maximum order
         this->a1n.resize(max_order);
         this->b1n.resize(max_order);
@@ -53,22 +102,16 @@ namespace CYLINDER
             m = this->index / this->medium_index, // Relative refractive index
             mx = m * size_parameter; // Scaled size parameter for internal calculations
 
-        // Precompute Bessel and Hankel functions up to max_order
-        std::vector<complex128>
-            J_z(max_order + 1),
-            J_z_p(max_order + 1),
-            J_x(max_order + 1),
-            J_x_p(max_order + 1),
-            H_x(max_order + 1),
-            H_x_p(max_order + 1);
+        // Bessel and Hankel functions up to max_order with their derivatives, each ladder from a single recurrence
+        auto [J_z, J_z_p] = compute_Jn_and_derivative(max_order, mx);
+        auto [J_x, J_x_p] = compute_Jn_and_derivative(max_order, size_parameter);
+        auto [Y_x, Y_x_p] = compute_Yn_and_derivative(max_order, size_parameter);
+
+        std::vector<complex128> H_x(max_order + 1), H_x_p(max_order + 1);
 
         for (size_t order = 0; order < max_order + 1; ++order){
-            J_z[order] = compute_Jn(order, mx);
-            J_z_p[order] = compute_Jn_p(order, mx);
-            J_x[order] = compute_Jn(order, size_parameter);
-            J_x_p[order] = compute_Jn_p(order, size_parameter);
-            H_x[order] = compute_H1(order, size_parameter);
-            H_x_p[order] = compute_H1_p(order, size_parameter);
+            H_x[order] = J_x[order] + complex128(0, 1) * Y_x[order];
+            H_x_p[order] = J_x_p[order] + complex128(0, 1) * Y_x_p[order];
         }
 
         // Compute Mie coefficients a1n, a2n, b1n, b2n for each order
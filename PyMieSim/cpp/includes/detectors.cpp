@@ -9,11 +9,47 @@ namespace DETECTOR {
 
     using complex128 = std::complex<double>;
 
+    // Non-coherent coupling of a cap centered on the forward direction. Averaged over the azimuth, the polarization terms
+    // |J0 cos + J1 sin|^2 of the far-field integrate to pi (|J0|^2 + |J1|^2), leaving a 1-D integral of |S1|^2 and |S2|^2 over
+    // mu = cos(angle to the axis). S1 and S2 are polynomials of degree max_order in mu, so that max_order + 1 Gauss-Legendre
+    // nodes integrate them exactly instead of evaluating them at every point of the mesh.
     template <class T>
-    double Detector::get_coupling_point_no_coherent(T &scatterer)
+    double Detector::get_coupling_azimuthal_no_coherent(const T &scatterer) const
     {
-        auto [theta_field, phi_field] = scatterer.compute_unstructured_fields(this->fibonacci_mesh);
+        auto [mu, weights] = compute_gauss_legendre(scatterer.max_order + 1, cos(this->max_angle), 1.0);
 
+        // Elevation of the nodes, as taken by compute_s1s2
+        std::vector<double> phi(mu.size());
+        for (size_t i = 0; i < mu.size(); ++i)
+            phi[i] = asin(mu[i]);
+
+        auto [S1, S2] = scatterer.compute_s1s2(phi);
+
+        double
+            coupling_theta = 0,
+            coupling_phi = 0,
+            prefactor = PI * std::norm(scatterer.compute_propagator(1.0)) * (std::norm(scatterer.source.jones_vector[0]) + std::norm(scatterer.source.jones_vector[1]));
+
+        for (size_t i = 0; i < mu.size(); ++i)
+        {
+            coupling_theta += weights[i] * std::norm(S1[i]);
+            coupling_phi += weights[i] * std::norm(S2[i]);
+        }
+
+        coupling_theta *= prefactor;
+        coupling_phi *= prefactor;
+
+        this->apply_polarization_filter(
+            coupling_theta,
+            coupling_phi,
+            this->polarization_filter
+        );
+
+        return 0.5 * EPSILON0 * C * (coupling_theta + coupling_phi);
+    }
+
+    double Detector::get_coupling_point_no_coherent(const std::vector<complex128> &theta_field, const std::vector<complex128> &phi_field) const
+    {
         double
             coupling_theta = this->get_norm2_squared(theta_field),
             coupling_phi = this->get_norm2_squared(phi_field);
@@ -24,22 +60,18 @@ namespace DETECTOR {
             this->polarization_filter
         );
 
-        return 0.5 * EPSILON0 * C * (coupling_theta + coupling_phi) * this->fibonacci_mesh.dOmega;
+        return 0.5 * EPSILON0 * C * (coupling_theta + coupling_phi) * this->fibonacci_mesh->dOmega;
     }
 
 
 
-    template <class T>
-    double Detector::get_coupling_mean_no_coherent(T &scatterer)
+    double Detector::get_coupling_mean_no_coherent(const std::vector<complex128> &theta_field, const std::vector<complex128> &phi_field) const
     {
-        return get_coupling_point_no_coherent(scatterer);
+        return get_coupling_point_no_coherent(theta_field, phi_field);
     }
 
-    template <class T>
-    double Detector::get_coupling_point_coherent(T &scatterer)
+    double Detector::get_coupling_point_coherent(const std::vector<complex128> &theta_field, const std::vector<complex128> &phi_field) const
     {
-        auto [theta_field, phi_field] = scatterer.compute_unstructured_fields(this->fibonacci_mesh);
-
         auto [horizontal_projection, vertical_projection] = this->get_projected_fields(theta_field, phi_field);
 
         this->apply_scalar_field(horizontal_projection, vertical_projection);
@@ -54,15 +86,12 @@ namespace DETECTOR {
             this->polarization_filter
         );
 
-        return 0.5 * EPSILON0 * C * (coupling_theta + coupling_phi) * this->fibonacci_mesh.dOmega;
+        return 0.5 * EPSILON0 * C * (coupling_theta + coupling_phi) * this->fibonacci_mesh->dOmega;
     }
 
 
-    template <class T> double
-    Detector::get_coupling_mean_coherent(T &scatterer)
+    double Detector::get_coupling_mean_coherent(const std::vector<complex128> &theta_field, const std::vector<complex128> &phi_field) const
     {
-        auto [theta_field, phi_field] = scatterer.compute_unstructured_fields(this->fibonacci_mesh);
-
         auto [horizontal_projection, vertical_projection] = this->get_projected_fields(theta_field, phi_field);
 
         this->apply_scalar_field(horizontal_projection, vertical_projection);
@@ -77,7 +106,7 @@ namespace DETECTOR {
             this->polarization_filter
         );
 
-        return 0.5 * EPSILON0 * C * (coupling_theta + coupling_phi) * this->fibonacci_mesh.dOmega / this->fibonacci_mesh.Omega;
+        return 0.5 * EPSILON0 * C * (coupling_theta + coupling_phi) * this->fibonacci_mesh->dOmega / this->fibonacci_mesh->Omega;
     }
 
     std::tuple<std::vector<complex128>, std::vector<complex128>>
@@ -91,14 +120,14 @@ namespace DETECTOR {
         for (size_t i=0; i<theta_field.size(); ++i)
         {
             vertical_projection[i] =
-                theta_field[i] * this->fibonacci_mesh.vertical_perpendicular_projection[i] +
-                phi_field[i] * this->fibonacci_mesh.vertical_parallel_projection[i] ;  // new_version
+                theta_field[i] * this->fibonacci_mesh->vertical_perpendicular_projection[i] +
+                phi_field[i] * this->fibonacci_mesh->vertical_parallel_projection[i] ;  // new_version
 
 
 
             horizontal_projection[i] =
-                theta_field[i] * this->fibonacci_mesh.horizontal_perpendicular_projection[i] +
-                phi_field[i] * this->fibonacci_mesh.horizontal_parallel_projection[i] ; // new_version
+                theta_field[i] * this->fibonacci_mesh->horizontal_perpendicular_projection[i] +
+                phi_field[i] * this->fibonacci_mesh->horizontal_parallel_projection[i] ; // new_version
         }
 
         return std::make_tuple(horizontal_projection, vertical_projection);
@@ -115,13 +144,74 @@ namespace DETECTOR {
         }
     }
 
+    std::vector<complex128> Detector::compute_scalar_field(const std::string &mode_number) const
+    {
+        int number_0 = mode_number[2] - '0';
+        int number_1 = mode_number[3] - '0';
+
+        std::vector<double>
+            x = this->fibonacci_mesh->base_cartesian_coordinates.x,
+            y = this->fibonacci_mesh->base_cartesian_coordinates.y;
+
+        // The modes are scaled to the outermost point, which for the Gauss nodes lies inside the rim of the cap.
+        if (!this->fibonacci_mesh->weights.empty()) {
+            x.push_back(sin(std::min(this->max_angle, PI / 2.0)));
+            y.push_back(0.0);
+        }
+
+        std::vector<complex128> scalar_field;
+
+        if (mode_number.substr(0, 2) == "LG")  // Laguerre-Gauss mode
+            scalar_field = get_LG_mode_field(x, y, number_0, number_1);
+        else if (mode_number.substr(0, 2) == "HG")  // Hermit-Gauss mode
+            scalar_field = get_HG_mode_field(x, y, number_0, number_1);
+        else if (mode_number.substr(0, 2) == "LP")  // Fiber Linearly Polarized mode
+            scalar_field = get_LP_mode_field(x, y, number_0, number_1);
+        else if (mode_number.substr(0, 2) == "NC")  // Non-coherent mode
+            scalar_field = std::vector<complex128>(x.size(), 1.0);
+
+        else
+            throw std::invalid_argument("Invalid mode family name");
+
+        if (!this->fibonacci_mesh->weights.empty())
+            this->normalize_scalar_field(scalar_field, mode_number.substr(0, 2) != "NC");
+
+        return scalar_field;
+    }
+
+    // The sums below are in units of dOmega, the points of a Gauss mesh being weighted by their solid angle relative to it.
+    // Drops the rim point added for the scaling of the mode and, for a coherent mode, restores the unit norm of the field
+    // with the points weighted as in the coupling sums.
+    void Detector::normalize_scalar_field(std::vector<complex128> &scalar_field, bool normalize) const
+    {
+        scalar_field.pop_back();
+
+        if (!normalize)
+            return;
+
+        double norm = 0.0;
+        for (size_t i = 0; i < scalar_field.size(); ++i)
+            norm += this->fibonacci_mesh->weights[i] * std::norm(scalar_field[i]);
+
+        norm = std::sqrt(norm);
+
+        for (complex128 &value : scalar_field)
+            value /= norm;
+    }
+
     template <class T> inline
     double Detector::get_norm1_squared(const std::vector<T> &array) const
     {
+        const std::vector<double> &weights = this->fibonacci_mesh->weights;
+
         T sum  = 0.0;
 
-        for (auto v : array)
-            sum += v;
+        if (weights.empty())
+            for (auto v : array)
+                sum += v;
+        else
+            for (size_t i = 0; i < array.size(); ++i)
+                sum += weights[i] * array[i];
 
         return pow(abs(sum), 2);
     }
@@ -129,10 +219,16 @@ namespace DETECTOR {
     template <class T> inline
     double Detector::get_norm2_squared(const std::vector<T> &array) const
     {
+      const std::vector<double> &weights = this->fibonacci_mesh->weights;
+
       T sum  = 0.0;
 
-      for (auto v : array)
-        sum += pow( abs(v), 2 );
+      if (weights.empty())
+        for (auto v : array)
+          sum += pow( abs(v), 2 );
+      else
+        for (size_t i = 0; i < array.size(); ++i)
+          sum += weights[i] * pow( abs(array[i]), 2 );
 
       return abs(sum);
     }
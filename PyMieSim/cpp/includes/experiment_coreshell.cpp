@@ -1,81 +1,123 @@
 #pragma once
 
 template<typename Function>
-pybind11::array_t<complex128> Experiment::get_coreshell_coefficient(Function function, size_t max_order) const
+pybind11::array_t<complex128> Experiment::get_coreshell_coefficient(Function function, size_t max_order, const pybind11::object &out) const
 {
     using namespace CORESHELL;
 
-    std::vector<size_t> array_shape = concatenate_vector(
-        sourceSet.shape,
-        coreshellSet.shape
-    );
+    if (with_reduction())
+        throw std::invalid_argument("The multipole coefficients cannot be reduced.");
+
+    std::vector<size_t>
+        array_shape = concatenate_vector(sourceSet.shape, coreshellSet.shape),
+        reduced_shape = reduce_shape(array_shape, wavelength_dependency);
 
-    size_t full_size = get_vector_sigma(array_shape);
+    ResultBuffer<complex128> output_buffer(*this, reduced_shape, array_shape, out);
 
-    std::vector<complex128> output_array(full_size);
+    std::vector<size_t>
+        core_diameter_order = get_axis_order(coreshellSet.core_diameter, coreshellSet.shape[0]),
+        shell_width_order = get_axis_order(coreshellSet.shell_width, coreshellSet.shape[1]);
+
+    LoopMonitor monitor = get_monitor(get_vector_sigma(reduced_shape));
 
-    #pragma omp parallel for collapse(9)
-    for (size_t wl=0; wl<array_shape[0]; ++wl)
-    for (size_t jv=0; jv<array_shape[1]; ++jv)
-    for (size_t na=0; na<array_shape[2]; ++na)
-    for (size_t op=0; op<array_shape[3]; ++op)
-    for (size_t cd=0; cd<array_shape[4]; ++cd)
-    for (size_t sw=0; sw<array_shape[5]; ++sw)
-    for (size_t cm=0; cm<array_shape[6]; ++cm)
-    for (size_t sm=0; sm<array_shape[7]; ++sm)
-    for (size_t mi=0; mi<array_shape[8]; ++mi)
     {
-        size_t idx = flatten_multi_index({wl, jv, na, op, cd, sw, cm, sm, mi}, array_shape);
+        pybind11::gil_scoped_release release;
+
+        apply_schedule();
+
+        #pragma omp parallel for collapse(9) schedule(runtime) num_threads(get_num_threads())
+        for (size_t wl=0; wl<reduced_shape[0]; ++wl)
+        for (size_t jv=0; jv<reduced_shape[1]; ++jv)
+        for (size_t na=0; na<reduced_shape[2]; ++na)
+        for (size_t op=0; op<reduced_shape[3]; ++op)
+        for (size_t cd_=0; cd_<reduced_shape[4]; ++cd_)
+        for (size_t sw_=0; sw_<reduced_shape[5]; ++sw_)
+        for (size_t cm=0; cm<reduced_shape[6]; ++cm)
+        for (size_t sm=0; sm<reduced_shape[7]; ++sm)
+        for (size_t mi=0; mi<reduced_shape[8]; ++mi)
+        {
+            if (monitor.is_stopped()) continue;
 
-        SOURCE::Gaussian source = sourceSet.to_object(wl, jv, na, op);
+            size_t cd = core_diameter_order[cd_], sw = shell_width_order[sw_];
 
-        CORESHELL::Scatterer scatterer = coreshellSet.to_object(wl, cd, sw, cm, sm, mi, source);
+            SOURCE::Gaussian source = sourceSet.to_object(wl, jv, na, op);
 
-        output_array[idx] = (scatterer.*function)()[max_order];
+            CORESHELL::Scatterer scatterer = coreshellSet.to_object(wl, cd, sw, cm, sm, mi, source, series_tolerance);
+
+            output_buffer.store({wl, jv, na, op, cd, sw, cm, sm, mi}, (scatterer.*function)()[max_order]);
+
+            monitor.update(1);
+        }
     }
 
-    return vector_to_numpy(output_array, array_shape);
+    monitor.finish();
+
+    return output_buffer.get_array();
 }
 
 template<typename Function>
-pybind11::array_t<double> Experiment::get_coreshell_data(Function function) const
+pybind11::array_t<double> Experiment::get_coreshell_data(Function function, const SourceDependency &dependency, const pybind11::object &out) const
 {
     using namespace CORESHELL;
 
-    std::vector<size_t> array_shape = concatenate_vector(
-        sourceSet.shape,
-        coreshellSet.shape
-    );
+    std::vector<size_t>
+        array_shape = concatenate_vector(sourceSet.shape, coreshellSet.shape),
+        reduced_shape = reduce_shape(array_shape, dependency);
+
+    ResultBuffer<double> output_buffer(*this, reduced_shape, array_shape, out);
 
-    size_t full_size = get_vector_sigma(array_shape);
+    std::vector<size_t> loop_shape = get_parallel_shape(reduced_shape, {});
 
-    std::vector<double> output_array(full_size);
+    size_t n_step = get_step_count({});
+
+    std::vector<size_t>
+        core_diameter_order = get_axis_order(coreshellSet.core_diameter, coreshellSet.shape[0]),
+        shell_width_order = get_axis_order(coreshellSet.shell_width, coreshellSet.shape[1]);
+
+    LoopMonitor monitor = get_monitor(get_vector_sigma(reduced_shape));
 
-    #pragma omp parallel for collapse(9)
-    for (size_t wl=0; wl<array_shape[0]; ++wl)
-    for (size_t jv=0; jv<array_shape[1]; ++jv)
-    for (size_t na=0; na<array_shape[2]; ++na)
-    for (size_t op=0; op<array_shape[3]; ++op)
-    for (size_t cd=0; cd<array_shape[4]; ++cd)
-    for (size_t sw=0; sw<array_shape[5]; ++sw)
-    for (size_t cm=0; cm<array_shape[6]; ++cm)
-    for (size_t sm=0; sm<array_shape[7]; ++sm)
-    for (size_t mi=0; mi<array_shape[8]; ++mi)
     {
-        size_t idx = flatten_multi_index({wl, jv, na, op, cd, sw, cm, sm, mi}, array_shape);
+        pybind11::gil_scoped_release release;
+
+        apply_schedule();
+
+        #pragma omp parallel for collapse(9) schedule(runtime) num_threads(get_num_threads())
+        for (size_t wl=0; wl<loop_shape[0]; ++wl)
+        for (size_t jv=0; jv<loop_shape[1]; ++jv)
+        for (size_t na=0; na<loop_shape[2]; ++na)
+        for (size_t op=0; op<loop_shape[3]; ++op)
+        for (size_t cd_=0; cd_<loop_shape[4]; ++cd_)
+        for (size_t sw_=0; sw_<loop_shape[5]; ++sw_)
+        for (size_t cm_=0; cm_<loop_shape[6]; ++cm_)
+        for (size_t sm_=0; sm_<loop_shape[7]; ++sm_)
+        for (size_t mi_=0; mi_<loop_shape[8]; ++mi_)
+        {
+            if (monitor.is_stopped()) continue;
 
-        SOURCE::Gaussian source = sourceSet.to_object(wl, jv, na, op);
+            SOURCE::Gaussian source = sourceSet.to_object(wl, jv, na, op);
 
-        CORESHELL::Scatterer scatterer = coreshellSet.to_object(wl, cd, sw, cm, sm, mi, source);
+            for (size_t step = 0; step < n_step; ++step)
+            {
+                size_t
+                    cd = get_step_index(4, core_diameter_order[cd_], step), sw = get_step_index(5, shell_width_order[sw_], step),
+                    cm = get_step_index(6, cm_, step), sm = get_step_index(7, sm_, step), mi = get_step_index(8, mi_, step);
 
-        output_array[idx] = (scatterer.*function)();
+                CORESHELL::Scatterer scatterer = coreshellSet.to_object(wl, cd, sw, cm, sm, mi, source, series_tolerance);
+
+                output_buffer.store({wl, jv, na, op, cd, sw, cm, sm, mi}, (scatterer.*function)());
+            }
+
+            monitor.update(n_step);
+        }
     }
 
-    return vector_to_numpy(output_array, array_shape);
+    monitor.finish();
+
+    return output_buffer.get_array();
 }
 
 
-pybind11::array_t<double> Experiment::get_coreshell_coupling() const
+pybind11::array_t<double> Experiment::get_coreshell_coupling(const pybind11::object &out) const
 {
     using namespace CORESHELL;
 
@@ -85,40 +127,272 @@ pybind11::array_t<double> Experiment::get_coreshell_coupling() const
         detectorSet.shape
     );
 
-    size_t full_size = get_vector_sigma(array_shape);
-
-    std::vector<double> output_array(full_size);
-
-    #pragma omp parallel for collapse(16)
-    for (size_t wl=0; wl<array_shape[0]; ++wl)
-    for (size_t jv=0; jv<array_shape[1]; ++jv)
-    for (size_t na_=0; na_<array_shape[2]; ++na_)
-    for (size_t op=0; op<array_shape[3]; ++op)
-    for (size_t cd=0; cd<array_shape[4]; ++cd)
-    for (size_t sw=0; sw<array_shape[5]; ++sw)
-    for (size_t cm=0; cm<array_shape[6]; ++cm)
-    for (size_t sm=0; sm<array_shape[7]; ++sm)
-    for (size_t mi=0; mi<array_shape[8]; ++mi)
-    for (size_t mn=0; mn<array_shape[9]; ++mn)
-    for (size_t fs=0; fs<array_shape[10]; ++fs)
-    for (size_t ra=0; ra<array_shape[11]; ++ra)
-    for (size_t na=0; na<array_shape[12]; ++na)
-    for (size_t po=0; po<array_shape[13]; ++po)
-    for (size_t go=0; go<array_shape[14]; ++go)
-    for (size_t pf=0; pf<array_shape[15]; ++pf)
+    // Integrated once per {wavelength, jones_vector}, into the results of the first NA and optical power of the source. Without
+    // other NA or optical power, it is written at the amplitude of the source, else scaled in place over them afterwards.
+    std::vector<size_t> reduced_shape = reduce_shape(array_shape, polarization_dependency);
+
+    bool is_broadcast = sourceSet.shape[2] * sourceSet.shape[3] != 1;
+
+    ResultBuffer<double> output_buffer(*this, array_shape, array_shape, out, true);
+
+    // The mode and polarization filter axes are iterated within, over the far-field shared by their mesh.
+    std::vector<size_t> loop_shape = get_parallel_shape(reduced_shape, {9, 15});
+
+    size_t n_step = get_step_count({9, 15});
+
+    std::vector<DETECTOR::Detector> detectors = detectorSet.to_objects();
+
+    std::vector<size_t>
+        core_diameter_order = get_axis_order(coreshellSet.core_diameter, coreshellSet.shape[0]),
+        shell_width_order = get_axis_order(coreshellSet.shell_width, coreshellSet.shape[1]),
+        sampling_order = get_axis_order(detectorSet.sampling, detectorSet.shape[1]),
+        mesh_shape = slice_vector(detectorSet.shape, 1, 6);
+
+    LoopMonitor monitor = get_monitor(get_vector_sigma(reduced_shape));
+
     {
-        size_t idx = flatten_multi_index({wl, jv, na_, op, cd, sw, cm, sm, mi, mn, fs, ra, na, po, go, pf}, array_shape);
+        pybind11::gil_scoped_release release;
+
+        apply_schedule();
+
+        #pragma omp parallel for collapse(14) schedule(runtime) num_threads(get_num_threads())
+        for (size_t wl=0; wl<loop_shape[0]; ++wl)
+        for (size_t jv=0; jv<loop_shape[1]; ++jv)
+        for (size_t na_=0; na_<loop_shape[2]; ++na_)
+        for (size_t op=0; op<loop_shape[3]; ++op)
+        for (size_t cd_=0; cd_<loop_shape[4]; ++cd_)
+        for (size_t sw_=0; sw_<loop_shape[5]; ++sw_)
+        for (size_t cm_=0; cm_<loop_shape[6]; ++cm_)
+        for (size_t sm_=0; sm_<loop_shape[7]; ++sm_)
+        for (size_t mi_=0; mi_<loop_shape[8]; ++mi_)
+        for (size_t fs_=0; fs_<loop_shape[10]; ++fs_)
+        for (size_t ra_=0; ra_<loop_shape[11]; ++ra_)
+        for (size_t dn_=0; dn_<loop_shape[12]; ++dn_)
+        for (size_t po_=0; po_<loop_shape[13]; ++po_)
+        for (size_t go_=0; go_<loop_shape[14]; ++go_)
+        {
+            if (monitor.is_stopped()) continue;
+
+            SOURCE::Gaussian source = sourceSet.to_object(wl, jv, na_, op);
+            double scale = is_broadcast ? 1.0 : pow(source.amplitude, 2);
+            source.amplitude = 1.0;  // The coupling is scaled to the amplitude of the source, here or by scale_coupling_to_source_grid
+
+            for (size_t step = 0; step < n_step; ++step)
+            {
+                size_t
+                    cd = get_step_index(4, core_diameter_order[cd_], step), sw = get_step_index(5, shell_width_order[sw_], step),
+                    cm = get_step_index(6, cm_, step), sm = get_step_index(7, sm_, step), mi = get_step_index(8, mi_, step),
+                    fs = get_step_index(10, sampling_order[fs_], step), ra = get_step_index(11, ra_, step), na = get_step_index(12, dn_, step),
+                    po = get_step_index(13, po_, step), go = get_step_index(14, go_, step);
+
+                CORESHELL::Scatterer scatterer = coreshellSet.to_object(wl, cd, sw, cm, sm, mi, source, series_tolerance);
+
+                size_t mesh = flatten_multi_index({fs, ra, na, po, go}, mesh_shape);
 
-        SOURCE::Gaussian source = sourceSet.to_object(wl, jv, na_, op);
+                for_each_mesh_coupling(detectors, scatterer, mesh, [&](size_t mn, size_t pf, double coupling) {
+                    output_buffer.store({wl, jv, na_, op, cd, sw, cm, sm, mi, mn, fs, ra, na, po, go, pf}, scale * coupling);
+                });
+            }
 
-        DETECTOR::Detector detector = detectorSet.to_object(mn, fs, ra, na, po, go, pf);
+            monitor.update(n_step * loop_shape[9] * loop_shape[15]);
+        }
+    }
+
+    monitor.finish();
 
-        CORESHELL::Scatterer scatterer = coreshellSet.to_object(wl, cd, sw, cm, sm, mi, source);
+    pybind11::array_t<double> numpy_array = output_buffer.get_array();
+
+    if (is_broadcast)
+    {
+        std::vector<size_t> output_shape = get_statistics_shape(array_shape);
 
-        output_array[idx] = abs( detector.get_coupling(scatterer) );
+        scale_coupling_to_source_grid(numpy_array, get_vector_sigma(output_shape) / get_vector_sigma(sourceSet.shape), get_variance_stride(output_shape));
     }
 
-    return vector_to_numpy(output_array, array_shape);
+    return numpy_array;
 }
 
 
+pybind11::dict Experiment::get_coreshell_many(const std::vector<std::string> &measures) const
+{
+    using namespace CORESHELL;
+
+    std::vector<std::string> data_labels, coefficient_labels;
+    bool with_coupling;
+
+    split_measures(measures, coreshell_measures, coreshell_coefficients, data_labels, coefficient_labels, with_coupling);
+
+    std::vector<size_t> array_shape = concatenate_vector(sourceSet.shape, coreshellSet.shape);
+
+    // Each measure is stored over the source axes it depends on only, the scatterers are computed over their union.
+    SourceDependency loop_dependency = with_coupling ? polarization_dependency : wavelength_dependency;
+
+    std::vector<SourceDependency> data_dependencies;
+    std::vector<std::vector<size_t>> data_shapes;
+    std::vector<std::vector<double>> data_arrays;
+
+    for (const std::string &label : data_labels)
+    {
+        data_dependencies.push_back(coreshell_dependencies.at(label));
+        data_shapes.push_back(reduce_shape(array_shape, data_dependencies.back()));
+        data_arrays.emplace_back(get_vector_sigma(data_shapes.back()));
+        loop_dependency = merge_dependency(loop_dependency, data_dependencies.back());
+    }
+
+    std::vector<size_t>
+        loop_shape = reduce_shape(array_shape, loop_dependency),
+        coefficient_shape = reduce_shape(array_shape, wavelength_dependency);
+
+    size_t detector_size = with_coupling ? get_vector_sigma(detectorSet.shape) : 0;
+
+    std::vector<std::vector<complex128>> coefficient_arrays(coefficient_labels.size(), std::vector<complex128>(get_vector_sigma(coefficient_shape)));
+
+    // The coupling is integrated once per {wavelength, jones_vector}, into its results of the first NA and optical power of
+    // the source. Without other NA or optical power, it is written at the amplitude of the source, else scaled over them afterwards.
+    pybind11::array_t<double> coupling_array(with_coupling ? concatenate_vector(array_shape, detectorSet.shape) : std::vector<size_t>{0});
+
+    double *coupling_data = coupling_array.mutable_data();
+
+    bool is_broadcast = sourceSet.shape[2] * sourceSet.shape[3] != 1;
+
+    std::vector<DETECTOR::Detector> detectors = with_coupling ? detectorSet.to_objects() : std::vector<DETECTOR::Detector>{};
+
+    size_t n_mesh = with_coupling ? detector_size / (detectorSet.shape[0] * detectorSet.shape[6]) : 0;
+
+    std::vector<size_t>
+        core_diameter_order = get_axis_order(coreshellSet.core_diameter, coreshellSet.shape[0]),
+        shell_width_order = get_axis_order(coreshellSet.shell_width, coreshellSet.shape[1]);
+
+    LoopMonitor monitor = get_monitor(get_vector_sigma(loop_shape));
+
+    {
+        pybind11::gil_scoped_release release;
+
+        apply_schedule();
+
+        #pragma omp parallel for collapse(9) schedule(runtime) num_threads(get_num_threads())
+        for (size_t wl=0; wl<loop_shape[0]; ++wl)
+        for (size_t jv=0; jv<loop_shape[1]; ++jv)
+        for (size_t na=0; na<loop_shape[2]; ++na)
+        for (size_t op=0; op<loop_shape[3]; ++op)
+        for (size_t cd_=0; cd_<loop_shape[4]; ++cd_)
+        for (size_t sw_=0; sw_<loop_shape[5]; ++sw_)
+        for (size_t cm=0; cm<loop_shape[6]; ++cm)
+        for (size_t sm=0; sm<loop_shape[7]; ++sm)
+        for (size_t mi=0; mi<loop_shape[8]; ++mi)
+        {
+            if (monitor.is_stopped()) continue;
+
+            size_t cd = core_diameter_order[cd_], sw = shell_width_order[sw_];
+
+            std::vector<size_t> multi_index = {wl, jv, na, op, cd, sw, cm, sm, mi};
+
+            SOURCE::Gaussian source = sourceSet.to_object(wl, jv, na, op);
+            double scale = is_broadcast ? 1.0 : pow(source.amplitude, 2);
+            source.amplitude = 1.0;  // The coupling is scaled to the amplitude of the source, here or by scale_coupling_to_source_grid
+
+            CORESHELL::Scatterer scatterer = coreshellSet.to_object(wl, cd, sw, cm, sm, mi, source, series_tolerance);
+
+            for (size_t m = 0; m < data_labels.size(); ++m)
+                if (is_computed_point(multi_index, data_dependencies[m]))
+                    data_arrays[m][flatten_multi_index(multi_index, data_shapes[m])] = (scatterer.*coreshell_measures.at(data_labels[m]))();
+
+            if (is_computed_point(multi_index, wavelength_dependency))
+                for (size_t m = 0; m < coefficient_labels.size(); ++m)
+                {
+                    auto [function, order] = coreshell_coefficients.at(coefficient_labels[m]);
+                    coefficient_arrays[m][flatten_multi_index(multi_index, coefficient_shape)] = (scatterer.*function)()[order];
+                }
+
+            if (is_computed_point(multi_index, polarization_dependency))
+                for (size_t mesh = 0; mesh < n_mesh; ++mesh)
+                    for_each_mesh_coupling(detectors, scatterer, mesh, [&](size_t mn, size_t pf, double coupling) {
+                        coupling_data[flatten_multi_index(multi_index, array_shape) * detector_size + (mn * n_mesh + mesh) * detectorSet.shape[6] + pf] = scale * coupling;
+                    });
+
+            monitor.update(1);
+        }
+    }
+
+    monitor.finish();
+
+    pybind11::dict output;
+
+    for (size_t m = 0; m < data_labels.size(); ++m)
+        output[data_labels[m].c_str()] = vector_to_broadcast_numpy(std::move(data_arrays[m]), data_shapes[m], array_shape);
+
+    for (size_t m = 0; m < coefficient_labels.size(); ++m)
+        output[coefficient_labels[m].c_str()] = vector_to_broadcast_numpy(std::move(coefficient_arrays[m]), coefficient_shape, array_shape);
+
+    if (with_coupling)
+    {
+        if (is_broadcast)
+            scale_coupling_to_source_grid(coupling_array, get_vector_sigma(array_shape) / get_vector_sigma(sourceSet.shape) * detector_size);
+
+        output["coupling"] = coupling_array;
+    }
+
+    return output;
+}
+
+
+pybind11::array Experiment::get_coreshell_points(const std::string &measure, const pybind11::array_t<size_t> &indices) const
+{
+    using namespace CORESHELL;
+
+    bool with_coupling = measure == "coupling";
+
+    if (!with_coupling && !coreshell_measures.count(measure) && !coreshell_coefficients.count(measure))
+        throw std::invalid_argument("Invalid measure: " + measure);
+
+    // Each row holds the indices of a point along the source, coreshell and, for the coupling, detector axes.
+    std::vector<size_t> shape = with_coupling ? concatenate_vector(sourceSet.shape, coreshellSet.shape, detectorSet.shape) : concatenate_vector(sourceSet.shape, coreshellSet.shape);
+
+    std::vector<std::vector<size_t>> points = get_point_indices(indices, shape);
+
+    std::vector<size_t> detector_index;
+    std::vector<DETECTOR::Detector> detectors = with_coupling ? get_point_detectors(points, 9, detector_index) : std::vector<DETECTOR::Detector>{};
+
+    double (CORESHELL::Scatterer::*function)() const = coreshell_measures.count(measure) ? coreshell_measures.at(measure) : nullptr;
+
+    std::pair<std::vector<complex128> (CORESHELL::Scatterer::*)() const, size_t> coefficient = coreshell_coefficients.count(measure) ? coreshell_coefficients.at(measure) : decltype(coefficient){nullptr, 0};
+
+    std::vector<double> output_array(coefficient.first ? 0 : points.size());
+    std::vector<complex128> coefficient_array(coefficient.first ? points.size() : 0);
+
+    LoopMonitor monitor = get_monitor(points.size());
+
+    {
+        pybind11::gil_scoped_release release;
+
+        apply_schedule();
+
+        #pragma omp parallel for schedule(runtime) num_threads(get_num_threads())
+        for (size_t p=0; p<points.size(); ++p)
+        {
+            if (monitor.is_stopped()) continue;
+
+            const std::vector<size_t> &point = points[p];
+
+            SOURCE::Gaussian source = sourceSet.to_object(point[0], point[1], point[2], point[3]);
+
+            CORESHELL::Scatterer scatterer = coreshellSet.to_object(point[0], point[4], point[5], point[6], point[7], point[8], source, series_tolerance);
+
+            if (with_coupling)
+                output_array[p] = abs(detectors[detector_index[p]].get_coupling(scatterer));
+            else if (coefficient.first)
+                coefficient_array[p] = (scatterer.*coefficient.first)()[coefficient.second];
+            else
+                output_array[p] = (scatterer.*function)();
+
+            monitor.update(1);
+        }
+    }
+
+    monitor.finish();
+
+    if (coefficient.first)
+        return vector_to_numpy(std::move(coefficient_array), {points.size()});
+
+    return vector_to_numpy(std::move(output_array), {points.size()});
+}
@@ -48,6 +48,18 @@ void FibonacciMesh::compute_projections(){
     vertical_perpendicular_projection = perpendicular_vector.get_scalar_product(vertical_vector_field);
 }
 
+// Bytes held by the coordinates, vector fields, projections and weights of the points.
+size_t FibonacciMesh::get_memory_size() const {
+    size_t n_values =
+        3 * cartesian_coordinates.x.size() + 3 * base_cartesian_coordinates.x.size() + 3 * spherical_coordinates.r.size() +
+        parallel_vector.data.size() + perpendicular_vector.data.size() +
+        horizontal_parallel_projection.size() + vertical_parallel_projection.size() +
+        horizontal_perpendicular_projection.size() + vertical_perpendicular_projection.size() +
+        weights.size();
+
+    return sizeof(double) * n_values + sizeof(FibonacciMesh);
+}
+
 double FibonacciMesh::NA2Angle(double NA) const {
     if (NA <= 1.0)
         return asin(NA);
@@ -79,6 +91,49 @@ void FibonacciMesh::compute_mesh(){
     }
 }
 
+// Product quadrature of the cap: Gauss-Legendre nodes in the cosine of the polar angle times equally spaced azimuths,
+// which integrates smooth far-fields far faster than the equal-weight Fibonacci points.
+void FibonacciMesh::compute_gauss_mesh(){
+    size_t
+        polar_sampling = std::max<size_t>(1, (size_t) std::round(sqrt(sampling / 2.0))),
+        azimuthal_sampling = 2 * polar_sampling;
+
+    auto [mu, polar_weights] = compute_gauss_legendre(polar_sampling, cos(max_angle), 1.0);
+
+    sampling = polar_sampling * azimuthal_sampling;
+    true_number_of_sample = sampling;
+    Omega = 2. * PI * (1. - cos(max_angle));
+    dOmega = Omega / sampling;
+
+    cartesian_coordinates = Cartesian(sampling);
+    weights.resize(sampling);
+
+    double azimuthal_weight = 2. * PI / azimuthal_sampling;
+
+    for (size_t p = 0; p < polar_sampling; p++){
+        double radius = sqrt(1 - mu[p] * mu[p]);
+
+        for (size_t a = 0; a < azimuthal_sampling; a++){
+            size_t i = p * azimuthal_sampling + a;
+            double theta = azimuthal_weight * (a + 0.5);
+
+            cartesian_coordinates.x[i] = cos(theta) * radius;
+            cartesian_coordinates.y[i] = sin(theta) * radius;
+            cartesian_coordinates.z[i] = mu[p];
+            weights[i] = polar_weights[p] * azimuthal_weight / dOmega;
+        }
+    }
+}
+
+py::array_t<double> FibonacciMesh::get_weights_py() const {
+    std::vector<double> d_omegas(sampling, dOmega);
+
+    for (size_t i = 0; i < weights.size(); i++)
+        d_omegas[i] *= weights[i];
+
+    return vector_to_numpy_copy(d_omegas);
+}
+
 void FibonacciMesh::compute_properties(){
     double
         solid_angle = abs( 2. * PI * ( cos(max_angle) - 1. ) ),   //cos(0) =1
@@ -92,13 +147,20 @@ void FibonacciMesh::compute_properties(){
 }
 
 std::vector<double> FibonacciMesh::get_principal_axis() const {
-    std::vector<double> principal_axis = {
-        cartesian_coordinates.x[0],
-        cartesian_coordinates.y[0],
-        cartesian_coordinates.z[0]
-    };
+    // The first Fibonacci point sits on the axis of the cap, which no point of the Gauss quadrature does.
+    if (quadrature == "fibonacci")
+        return {cartesian_coordinates.x[0], cartesian_coordinates.y[0], cartesian_coordinates.z[0]};
+
+    Cartesian axis(1);
+    axis.z[0] = 1.0;
+
+    if (gamma_offset != 0.0)
+        axis.rotate_about_axis('x', gamma_offset);
+
+    if (phi_offset != 0.0)
+        axis.rotate_about_axis('y', phi_offset);
 
-    return principal_axis;
+    return {axis.x[0], axis.y[0], axis.z[0]};
 }
 
 void FibonacciMesh::rotate_around_axis(double angle) {
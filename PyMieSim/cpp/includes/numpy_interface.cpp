@@ -27,25 +27,18 @@ template <typename T>
 pybind11::array_t<T>
 vector_to_numpy(const std::vector<T> &vector, const std::vector<size_t> &dimension)
 {
-    pybind11::array_t<T>  numpy_array;
-
-    std::vector<T> * output_vector = new std::vector<T>;
-    (*output_vector) = vector;
+    auto* ptr = new std::vector<T>(vector);
 
-    std::vector<size_t> stride = get_stride<T>(dimension);
-
-    pybind11::capsule free_when_done(
-        output_vector->data(), [](void *f) {T *foo = reinterpret_cast<T *>(f); delete []foo; }
+    const pybind11::capsule freeWhenDone(
+        ptr, [](void *toFree) { delete static_cast<std::vector<T> *>(toFree); }
     );
 
-    numpy_array = pybind11::array_t<T>(
+    return pybind11::array_t<T>(
         dimension,
-        stride,
-        output_vector->data(),
-        free_when_done
-      );
-
-    return numpy_array;
+        get_stride<T>(dimension),
+        ptr->data(),
+        freeWhenDone
+    );
 }
 
 
@@ -146,14 +139,12 @@ vector_to_numpy_copy(std::vector<T> passthrough, const std::vector<size_t> &shap
     );
 
     auto numpy_array = pybind11::array_t<T>(
-        {ptr->size()},
-        {sizeof(T)},
+        shape,
+        get_stride<T>(shape),
         ptr->data(),
         freeWhenDone
     );
 
-    numpy_array.resize(shape);
-
     return numpy_array;
 }
 
@@ -169,14 +160,65 @@ vector_to_numpy(std::vector<T>&& passthrough, const std::vector<size_t> &shape)
     );
 
     auto numpy_array = pybind11::array_t<T>(
-        {ptr->size()},
-        {sizeof(T)},
+        shape,
+        get_stride<T>(shape),
         ptr->data(),
         freeWhenDone
     );
 
-    numpy_array.resize(shape);
+    return numpy_array;
+}
+
+// Wraps data computed on a reduced grid into a read-only numpy view of the full grid. Every axis of size 1
+// in reduced_shape that is larger in full_shape gets a zero stride, so the values are broadcast without copy.
+template<typename T>
+inline pybind11::array_t<T>
+vector_to_broadcast_numpy(std::vector<T>&& passthrough, const std::vector<size_t> &reduced_shape, const std::vector<size_t> &full_shape)
+{
+    auto* ptr = new std::vector<T>(std::move(passthrough));
+
+    const pybind11::capsule freeWhenDone(
+        ptr, [](void *toFree) { delete static_cast<std::vector<T> *>(toFree); }
+    );
+
+    std::vector<size_t> stride = get_stride<T>(reduced_shape);
+
+    for (size_t i = 0; i < full_shape.size(); ++i)
+        if (reduced_shape[i] != full_shape[i])
+            stride[i] = 0;
+
+    auto numpy_array = pybind11::array_t<T>(
+        full_shape,
+        stride,
+        ptr->data(),
+        freeWhenDone
+    );
+
+    pybind11::detail::array_proxy(numpy_array.ptr())->flags &= ~pybind11::detail::npy_api::NPY_ARRAY_WRITEABLE_;
 
     return numpy_array;
 }
 
+
+// Returns the array a result of the given shape is written into: the caller-provided out array, which must be
+// a writeable C-contiguous array of the right dtype and shape as it is never converted, or a newly allocated one.
+template<typename T>
+inline pybind11::array_t<T>
+get_output_array(const std::vector<size_t> &shape, const pybind11::object &out)
+{
+    if (out.is_none())
+        return pybind11::array_t<T>(shape);
+
+    if (!pybind11::isinstance<pybind11::array_t<T, pybind11::array::c_style>>(out))
+        throw std::invalid_argument("out must be a C-contiguous numpy array of dtype " + std::string(pybind11::str(pybind11::dtype::of<T>())));
+
+    pybind11::array_t<T> numpy_array = out.cast<pybind11::array_t<T>>();
+
+    if (!numpy_array.writeable())
+        throw std::invalid_argument("out must be a writeable numpy array");
+
+    if (std::vector<size_t>(numpy_array.shape(), numpy_array.shape() + numpy_array.ndim()) != shape)
+        throw std::invalid_argument("out does not have the shape of the result");
+
+    return numpy_array;
+}
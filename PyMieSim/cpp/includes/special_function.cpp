@@ -5,6 +5,7 @@
 #include <math.h>
 #include <tuple>
 #include "../../../libraries/complex_bessel.cpp"
+#include "utils.cpp"
 
 typedef std::complex<double> complex128;
 
@@ -50,4 +51,115 @@ template<typename T> inline complex128 compute_H1_p(int order, T x){ return sp_b
 template<typename T> inline complex128 compute_H2_p(int order, T x){ return sp_bessel::hankelH2p(order, x); }
 
 
+//---------------------------------BATCHED_RECURRENCES--------------------------------------
+// Cylindrical Bessel functions J_n(z) and their derivatives for orders 0 to max_order (Miller's algorithm).
+// The downward recurrence is normalized on whichever of J_0, J_1 is the largest, the only two AMOS calls.
+template<typename T>
+std::tuple<std::vector<complex128>, std::vector<complex128>> compute_Jn_and_derivative(size_t max_order, T z)
+{
+    size_t nmx = std::max(max_order, static_cast<size_t>(std::abs(z))) + 16 + static_cast<size_t>(std::sqrt(std::abs(z)));
+
+    std::vector<complex128> Jn(nmx + 2, 0.0), Jn_p(max_order + 1);
+
+    Jn[nmx] = 1e-30;
+
+    for (size_t order = nmx; order > 0; --order)
+    {
+        Jn[order - 1] = 2. * (double) order / z * Jn[order] - Jn[order + 1];
+
+        if (std::abs(Jn[order - 1]) > 1e250)  // Rescales the part of the ladder already computed to avoid overflow
+            for (size_t n = order - 1; n < nmx + 1; ++n)
+                Jn[n] *= 1e-250;
+    }
+
+    complex128
+        J0 = compute_Jn(0, z),
+        J1 = compute_Jn(1, z),
+        scale = (std::abs(J0) > std::abs(J1)) ? J0 / Jn[0] : J1 / Jn[1];
+
+    Jn.resize(max_order + 1);
+
+    for (complex128 &value : Jn)
+        value *= scale;
+
+    Jn[0] = J0;
+
+    if (max_order > 0)
+        Jn[1] = J1;
+
+    // https://dlmf.nist.gov/10.6
+    Jn_p[0] = -J1;
+    for (size_t order = 1; order < max_order + 1; ++order)
+        Jn_p[order] = Jn[order - 1] - (double) order / z * Jn[order];
+
+    return std::make_tuple(Jn, Jn_p);
+}
+
+// Cylindrical Bessel functions Y_n(x) and their derivatives for orders 0 to max_order and a real argument,
+// Y_n being the dominant solution the upward recurrence from AMOS Y_0 and Y_1 is stable.
+inline std::tuple<std::vector<complex128>, std::vector<complex128>> compute_Yn_and_derivative(size_t max_order, double x)
+{
+    std::vector<complex128> Yn(std::max<size_t>(max_order + 1, 2)), Yn_p(max_order + 1);
+
+    Yn[0] = compute_Yn(0, x);
+    Yn[1] = compute_Yn(1, x);
+
+    for (size_t order = 1; order < max_order; ++order)
+        Yn[order + 1] = 2. * (double) order / x * Yn[order] - Yn[order - 1];
+
+    Yn_p[0] = -Yn[1];
+    for (size_t order = 1; order < max_order + 1; ++order)
+        Yn_p[order] = Yn[order - 1] - (double) order / x * Yn[order];
+
+    Yn.resize(max_order + 1);
+
+    return std::make_tuple(Yn, Yn_p);
+}
+
+// Nodes and weights of the n-point Gauss-Legendre quadrature on [lower, upper], exact for the polynomials of degree up to
+// 2n - 1. The roots of P_n are refined by Newton iterations from the asymptotic estimate cos(pi (i + 3/4) / (n + 1/2)).
+inline std::tuple<std::vector<double>, std::vector<double>> compute_gauss_legendre(size_t n, double lower, double upper)
+{
+    std::vector<double> nodes(n), weights(n);
+
+    double
+        center = 0.5 * (upper + lower),
+        half_width = 0.5 * (upper - lower);
+
+    for (size_t i = 0; i < (n + 1) / 2; ++i)
+    {
+        double x = std::cos(PI * (i + 0.75) / (n + 0.5)), derivative = 0;
+
+        for (size_t iteration = 0; iteration < 100; ++iteration)
+        {
+            // P_n(x) and its derivative from the three-term recurrence
+            double p0 = 1.0, p1 = x;
+
+            for (size_t order = 2; order <= n; ++order)
+            {
+                double p2 = ((2.0 * order - 1.0) * x * p1 - (order - 1.0) * p0) / order;
+                p0 = p1;
+                p1 = p2;
+            }
+
+            derivative = n * (x * p1 - p0) / (x * x - 1.0);
+
+            double step = p1 / derivative;
+            x -= step;
+
+            if (std::abs(step) < 1e-15)
+                break;
+        }
+
+        double weight = 2.0 / ((1.0 - x * x) * derivative * derivative);
+
+        nodes[i] = center + half_width * x;
+        nodes[n - 1 - i] = center - half_width * x;
+        weights[i] = weights[n - 1 - i] = half_width * weight;
+    }
+
+    return std::make_tuple(nodes, weights);
+}
+
+
 // -
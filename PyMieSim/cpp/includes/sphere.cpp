@@ -7,14 +7,19 @@ typedef std::complex<double> complex128;
 namespace SPHERE
 {
     void Scatterer::compute_an_bn(){
+        // Riccati-Bessel functions psi and chi for all orders in a single recurrence
+        this->compute_an_bn(VSH::SPHERICAL::compute_riccati_bessel(max_order, size_parameter));
+    }
+
+    void Scatterer::compute_an_bn(const RiccatiBessel &riccati_bessel){
+        const auto &[psi, chi] = riccati_bessel;
+
+        this->reset_sums();
+
         an.resize(max_order);
         bn.resize(max_order);
 
         complex128
-            psi_n,
-            chi_n,
-            psi_1,
-            chi_1,
             xi_n,
             xi_nm1,
             m = this->index / this->medium_index,
@@ -25,29 +30,19 @@ namespace SPHERE
 
         std::vector<complex128> Dn = VSH::SPHERICAL::compute_dn(nmx, mx);
 
-        psi_1  = sin(size_parameter);
-        chi_1 = cos(size_parameter);
-
         for (size_t order = 1; order < max_order + 1; ++order)
         {
-            // Calculate psi and chi (Riccati-Bessel functions)
-            psi_n = +size_parameter * compute_jn(order, size_parameter);
-            chi_n = -size_parameter * compute_yn(order, size_parameter);
-
             // Complex Riccati-Bessel functions
-            xi_n = psi_n - 1.0 * complex128(0, 1) * chi_n;
-            xi_nm1 = psi_1 - 1.0 * complex128(0, 1) * chi_1;
+            xi_n = psi[order] - 1.0 * complex128(0, 1) * chi[order];
+            xi_nm1 = psi[order - 1] - 1.0 * complex128(0, 1) * chi[order - 1];
 
             // Derivative of the Riccati-Bessel functions
             derivative_a = Dn[order] / m + order / size_parameter;
             derivative_b = Dn[order] * m + order / size_parameter;
 
             // Computation of the electric and magnetic multipole coefficients
-            an[order - 1] = (derivative_a * psi_n - psi_1) / (derivative_a * xi_n - xi_nm1);
-            bn[order - 1] = (derivative_b * psi_n - psi_1) / (derivative_b * xi_n - xi_nm1);
-
-            psi_1 = psi_n;
-            chi_1 = chi_n;
+            an[order - 1] = (derivative_a * psi[order] - psi[order - 1]) / (derivative_a * xi_n - xi_nm1);
+            bn[order - 1] = (derivative_b * psi[order] - psi[order - 1]) / (derivative_b * xi_n - xi_nm1);
         }
     }
 
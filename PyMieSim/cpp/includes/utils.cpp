@@ -1,7 +1,11 @@
 #pragma once
 
 #include <algorithm>
+#include <array>
+#include <numeric>
 #include <vector>
+#include <variant>
+#include <stdexcept>
 #include <cmath>
 
 typedef std::complex<double> complex128;
@@ -45,6 +49,72 @@ T get_vector_sigma(const std::vector<T> &vector)
     return sigma;
 }
 
+template <typename T>
+std::vector<T> slice_vector(const std::vector<T> &vector, size_t start, size_t stop)
+{
+    if (start >= stop || stop > vector.size())
+        throw std::invalid_argument("Invalid slice [" + std::to_string(start) + ", " + std::to_string(stop) + ") of an axis of size " + std::to_string(vector.size()));
+
+    return std::vector<T>(vector.begin() + start, vector.begin() + stop);
+}
+
+// Slices the values of a set parameter given either as constant values or as materials tabulated per wavelength.
+template <typename T>
+std::variant<std::vector<T>, std::vector<std::vector<T>>> slice_vector(const std::variant<std::vector<T>, std::vector<std::vector<T>>> &values, size_t start, size_t stop)
+{
+    return std::visit([&](const auto &vector) -> std::variant<std::vector<T>, std::vector<std::vector<T>>> { return slice_vector(vector, start, stop); }, values);
+}
+
+// Restricts materials tabulated per wavelength to the wavelengths [start, stop), constant values are left as is.
+template <typename T>
+void slice_wavelength(std::variant<std::vector<T>, std::vector<std::vector<T>>> &values, size_t start, size_t stop)
+{
+    if (std::holds_alternative<std::vector<std::vector<T>>>(values))
+        for (std::vector<T> &material : std::get<std::vector<std::vector<T>>>(values))
+            material = slice_vector(material, start, stop);
+}
+
+// Axis of a set driving each of its axes when the parameters of some axes vary together, as a 1D list of tuples, instead of
+// forming their outer product. The zipped axes follow the first of them, the others keeping a size of 1 in the grid.
+inline std::vector<size_t> get_zip_map(const std::vector<size_t> &shape, std::vector<size_t> axes)
+{
+    std::vector<size_t> zip_map(shape.size());
+    std::iota(zip_map.begin(), zip_map.end(), 0);
+
+    if (axes.empty())
+        return zip_map;
+
+    std::sort(axes.begin(), axes.end());
+
+    if (axes.size() < 2 || std::adjacent_find(axes.begin(), axes.end()) != axes.end() || axes.back() >= shape.size())
+        throw std::invalid_argument("Zipped axes must be at least two distinct axes of the set.");
+
+    for (size_t axis : axes)
+    {
+        if (shape[axis] != shape[axes[0]])
+            throw std::invalid_argument("Zipped axes must have the same number of values, got " + std::to_string(shape[axis]) + " and " + std::to_string(shape[axes[0]]));
+
+        zip_map[axis] = axes[0];
+    }
+
+    return zip_map;
+}
+
+// Indices of the parameters of a point of a set grid, the zipped axes taking the index of the axis they follow.
+template <size_t N>
+std::array<size_t, N> unzip_index(const std::array<size_t, N> &index, const std::vector<size_t> &zip_map)
+{
+    if (zip_map.empty())
+        return index;
+
+    std::array<size_t, N> output;
+
+    for (size_t axis = 0; axis < N; ++axis)
+        output[axis] = index[zip_map[axis]];
+
+    return output;
+}
+
 template <class T>
 T Sum(const std::vector<T>& vector)
 {
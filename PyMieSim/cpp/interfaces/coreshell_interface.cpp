@@ -10,13 +10,15 @@ PYBIND11_MODULE(CoreShellInterface, module) {
     module.doc() = "Lorenz-Mie Theory (LMT) C++ binding module for PyMieSim Python package.";
 
     py::class_<Scatterer>(module, "CORESHELL")
-        .def(py::init<double, double, std::complex<double>, std::complex<double>, double, SOURCE::BaseSource&>(),
+        .def(py::init<double, double, std::complex<double>, std::complex<double>, double, SOURCE::BaseSource&, size_t, double>(),
              py::arg("core_diameter"),
              py::arg("shell_width"),
              py::arg("core_index"),
              py::arg("shell_index"),
              py::arg("medium_index"),
              py::arg("source"),
+             py::arg("max_order") = 0,
+             py::arg("tolerance") = 0.0,
              "Constructor for CORESHELL, initializing it with physical and optical properties.")
 
         .def("get_s1s2", &Scatterer::get_s1s2_py, py::arg("phi"), "Calculates and returns the S1 and S2 scattering parameters for a core-shell.")
@@ -45,6 +47,7 @@ PYBIND11_MODULE(CoreShellInterface, module) {
         .def_property_readonly("Cpr", &Scatterer::get_Cpr, "Radiation pressure cross-section of the core-shell.")
         // Note: Downward are the extra parameters
         .def_property_readonly("g", &Scatterer::get_g, "Asymmetry parameter of the core-shell.")
+        .def_readonly("max_order", &Scatterer::max_order, "Number of orders of the Mie series, after the truncation at the tolerance.")
         .def_readwrite("area", &Scatterer::area, "Physical cross-sectional area of the core-shell.")
         .def_readwrite("size_parameter", &Scatterer::size_parameter, "Size parameter of the core-shell scatterer.");
 }
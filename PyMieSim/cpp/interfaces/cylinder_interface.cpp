@@ -11,11 +11,13 @@ PYBIND11_MODULE(CylinderInterface, module) {
 
     py::class_<Scatterer>(module, "CYLINDER")
         .def(
-            py::init<double, complex128, double, SOURCE::BaseSource&>(),
+            py::init<double, complex128, double, SOURCE::BaseSource&, size_t, double>(),
             py::arg("diameter"),
             py::arg("index"),
             py::arg("medium_index"),
             py::arg("source"),
+            py::arg("max_order") = 0,
+            py::arg("tolerance") = 0.0,
             "Constructor for CYLINDER, initializing it with physical and optical properties.")
 
         .def("get_s1s2", &Scatterer::get_s1s2_py, py::arg("phi"), "Calculates and returns the S1 and S2 scattering parameters for a cylinder.")
@@ -36,6 +38,7 @@ PYBIND11_MODULE(CylinderInterface, module) {
         .def_property_readonly("Cabs", &Scatterer::get_Cabs, "Absorption cross-section of the cylinder.")
         // Note: Downward are the extra parameters
         .def_property_readonly("g", &Scatterer::get_g, "Asymmetry parameter of the cylinder.")
+        .def_readonly("max_order", &Scatterer::max_order, "Number of orders of the Mie series, after the truncation at the tolerance.")
         .def_readwrite("area", &Scatterer::area, "Physical cross-sectional area of the cylinder.")
         .def_readwrite("size_parameter", &Scatterer::size_parameter, "Size parameter of the cylinder scatterer.");
 }
@@ -12,7 +12,7 @@ PYBIND11_MODULE(DetectorInterface, module) {
     module.doc() = "Lorenz-Mie Theory (LMT) C++ binding module for PyMieSim Python package.";
 
     py::class_<Detector>(module, "BindedDetector")
-        .def(py::init<std::string, size_t, double, double, double, double, double, bool, bool>(),
+        .def(py::init<std::string, size_t, double, double, double, double, double, bool, bool, const std::string&>(),
              py::arg("mode_number"),
              py::arg("sampling"),
              py::arg("NA"),
@@ -22,7 +22,8 @@ PYBIND11_MODULE(DetectorInterface, module) {
              py::arg("rotation"),
              py::arg("coherent"),
              py::arg("mean_coupling"),
-             "Constructs a Detector with given parameters. The `mean_coupling` parameter determines the coupling type (true for point, false for mean).")
+             py::arg("quadrature") = "fibonacci",
+             "Constructs a Detector with given parameters. The `mean_coupling` parameter determines the coupling type (true for point, false for mean) and `quadrature` the mesh, either 'fibonacci' or 'gauss'.")
 
         .def("CouplingSphere", &Detector::get_coupling<SPHERE::Scatterer>, py::arg("scatterer"), "Calculates the coupling of the detector with a sphere scatterer.")
         .def("CouplingCylinder", &Detector::get_coupling<CYLINDER::Scatterer>, py::arg("scatterer"), "Calculates the coupling of the detector with a cylinder scatterer.")
@@ -34,6 +35,12 @@ PYBIND11_MODULE(DetectorInterface, module) {
         .def_readonly("phi_offset", &Detector::phi_offset, "Offset in the azimuthal angle (phi) used to calibrate the detector orientation.")
         .def_readonly("gamma_offset", &Detector::gamma_offset, "Offset in the polar angle (gamma) used for angular calibration of the detector.")
         .def_readonly("polarization_filter", &Detector::polarization_filter, "Indicates the presence and characteristics of any polarization filter in the detector.")
+        .def_readonly("quadrature", &Detector::quadrature, "Quadrature of the mesh over which the coupling is integrated, either 'fibonacci' or 'gauss'.")
         .def_readonly("rotation", &Detector::rotation, "The rotation angle of the detector's field of view, typically used in alignment procedures.")
-        .def_readonly("mesh", &Detector::fibonacci_mesh, "The Fibonacci mesh used by the detector.");
+        .def_property_readonly("mesh", [](const Detector &detector) { return FibonacciMesh(*detector.fibonacci_mesh); }, "Copy of the Fibonacci mesh used by the detector, whose cached mesh is shared with the other detectors of same mesh parameters.");
+
+    module.def("set_cache_budget", [](size_t budget) { Cache::get_instance().set_budget(budget); }, py::arg("budget"), "Sets the budget in bytes of the cache of the detector meshes and mode fields, the least recently used entries being evicted beyond it. 0 disables the cache.");
+    module.def("get_cache_budget", []() { return Cache::get_instance().get_budget(); }, "Returns the budget in bytes of the cache of the detector meshes and mode fields.");
+    module.def("get_cache_size", []() { return Cache::get_instance().get_size(); }, "Returns the size in bytes of the detector meshes and mode fields held by the cache.");
+    module.def("clear_cache", []() { Cache::get_instance().clear(); }, "Clears the cache of the detector meshes and mode fields.");
 }
@@ -8,6 +8,16 @@ PYBIND11_MODULE(Experiment, module) {
 
     py::class_<Experiment>(module, "CppExperiment")
         .def(py::init<>(), "Constructs an Experiment object.")
+        .def("set_num_threads", &Experiment::set_num_threads, py::arg("n_threads"), "Sets the number of OpenMP threads used by the computations, 0 restores the OpenMP default.")
+        .def("get_num_threads", &Experiment::get_num_threads, "Returns the number of OpenMP threads used by the computations.")
+        .def("set_schedule", &Experiment::set_schedule, py::arg("schedule"), py::arg("chunk") = 0, "Sets the OpenMP schedule of the computations: static, dynamic, guided or cost (dynamic, the most expensive scatterer sizes and detector samplings first), with a chunk size of 0 for the OpenMP default.")
+        .def_readonly("schedule", &Experiment::schedule, "OpenMP schedule of the computations.")
+        .def("set_series_tolerance", &Experiment::set_series_tolerance, py::arg("tolerance"), "Sets the relative magnitude below which the trailing orders of the Mie coefficients are dropped, 0 keeps every order of the Wiscombe criterion.")
+        .def("copy", &Experiment::copy, "Returns a copy of the experiment with its own cancellation flag.")
+        .def("cancel", &Experiment::cancel, "Cancels the computations running on this experiment, which then raise a RuntimeError.")
+        .def("is_cancelled", &Experiment::is_cancelled, "Returns whether the experiment was cancelled.")
+        .def("set_progress", &Experiment::set_progress, py::arg("callback"), py::arg("interval") = 0.1, "Sets the callable called as callback(completed, total) with the number of grid points computed, at most once per interval in seconds, None disables it.")
+        .def("set_reduction", &Experiment::set_reduction, py::arg("axis"), py::arg("weights"), "Reduces the results along one of their scatterer or detector axes to the mean and variance weighted by weights, held by that axis with a size of 2. Empty weights disable the reduction.")
 
         // Setup methods
         .def("set_detector", &Experiment::set_detector, "Configures the detector for the experiment.")
@@ -15,98 +25,112 @@ PYBIND11_MODULE(Experiment, module) {
         .def("set_sphere", &Experiment::set_sphere, "Defines a spherical scatterer for the experiment.")
         .def("set_cylinder", &Experiment::set_cylinder, "Defines a cylindrical scatterer for the experiment.")
         .def("set_coreshell", &Experiment::set_coreshell, "Defines a core-shell scatterer for the experiment.")
+        .def("get_slice", &Experiment::get_slice, py::arg("component"), py::arg("axis"), py::arg("start"), py::arg("stop"), "Returns the experiment restricted to the indices [start, stop) of one axis of a component set (source, sphere, cylinder, coreshell or detector).")
 
         // Sphere metrics
         // Downward are the sphere efficiencies
-        .def("get_sphere_Qsca", &Experiment::get_sphere_Qsca, "Retrieves the scattering efficiency (Qsca) for a sphere.")
-        .def("get_sphere_Qext", &Experiment::get_sphere_Qext, "Retrieves the extinction efficiency (Qext) for a sphere.")
-        .def("get_sphere_Qabs", &Experiment::get_sphere_Qabs, "Retrieves the absorption efficiency (Qabs) for a sphere.")
-        .def("get_sphere_Qpr", &Experiment::get_sphere_Qpr, "Retrieves the radiation pressure efficiency (Qpr) for a sphere.")
-        .def("get_sphere_Qforward", &Experiment::get_sphere_Qforward, "Retrieves the forward scattering efficiency (Qforward) for a sphere.")
-        .def("get_sphere_Qback", &Experiment::get_sphere_Qback, "Retrieves the backscattering efficiency (Qback) for a sphere.")
-        .def("get_sphere_Qratio", &Experiment::get_sphere_Qratio, "Retrieves the ratio between forward and backward efficiencies for a sphere.")
+        .def("get_sphere_Qsca", &Experiment::get_sphere_Qsca, py::arg("out") = py::none(), "Retrieves the scattering efficiency (Qsca) for a sphere, written into out if given.")
+        .def("get_sphere_Qext", &Experiment::get_sphere_Qext, py::arg("out") = py::none(), "Retrieves the extinction efficiency (Qext) for a sphere, written into out if given.")
+        .def("get_sphere_Qabs", &Experiment::get_sphere_Qabs, py::arg("out") = py::none(), "Retrieves the absorption efficiency (Qabs) for a sphere, written into out if given.")
+        .def("get_sphere_Qpr", &Experiment::get_sphere_Qpr, py::arg("out") = py::none(), "Retrieves the radiation pressure efficiency (Qpr) for a sphere, written into out if given.")
+        .def("get_sphere_Qforward", &Experiment::get_sphere_Qforward, py::arg("out") = py::none(), "Retrieves the forward scattering efficiency (Qforward) for a sphere, written into out if given.")
+        .def("get_sphere_Qback", &Experiment::get_sphere_Qback, py::arg("out") = py::none(), "Retrieves the backscattering efficiency (Qback) for a sphere, written into out if given.")
+        .def("get_sphere_Qratio", &Experiment::get_sphere_Qratio, py::arg("out") = py::none(), "Retrieves the ratio between forward and backward efficiencies for a sphere, written into out if given.")
         // Downward are the sphere cross-sections
-        .def("get_sphere_Csca", &Experiment::get_sphere_Csca, "Retrieves the scattering cross-section (Csca) for a sphere.")
-        .def("get_sphere_Cext", &Experiment::get_sphere_Cext, "Retrieves the extinction cross-section (Cext) for a sphere.")
-        .def("get_sphere_Cabs", &Experiment::get_sphere_Cabs, "Retrieves the absorption cross-section (Cabs) for a sphere.")
-        .def("get_sphere_Cpr", &Experiment::get_sphere_Cpr, "Retrieves the radiation pressure cross-section (Cpr) for a sphere.")
-        .def("get_sphere_Cforward", &Experiment::get_sphere_Cforward, "Retrieves the forward scattering cross-section (Cforward) for a sphere.")
-        .def("get_sphere_Cback", &Experiment::get_sphere_Cback, "Retrieves the backscattering cross-section (Cback) for a sphere.")
-        .def("get_sphere_Cratio", &Experiment::get_sphere_Cratio, "Retrieves the ratio between forward and backward cross-section for a sphere.")
+        .def("get_sphere_Csca", &Experiment::get_sphere_Csca, py::arg("out") = py::none(), "Retrieves the scattering cross-section (Csca) for a sphere, written into out if given.")
+        .def("get_sphere_Cext", &Experiment::get_sphere_Cext, py::arg("out") = py::none(), "Retrieves the extinction cross-section (Cext) for a sphere, written into out if given.")
+        .def("get_sphere_Cabs", &Experiment::get_sphere_Cabs, py::arg("out") = py::none(), "Retrieves the absorption cross-section (Cabs) for a sphere, written into out if given.")
+        .def("get_sphere_Cpr", &Experiment::get_sphere_Cpr, py::arg("out") = py::none(), "Retrieves the radiation pressure cross-section (Cpr) for a sphere, written into out if given.")
+        .def("get_sphere_Cforward", &Experiment::get_sphere_Cforward, py::arg("out") = py::none(), "Retrieves the forward scattering cross-section (Cforward) for a sphere, written into out if given.")
+        .def("get_sphere_Cback", &Experiment::get_sphere_Cback, py::arg("out") = py::none(), "Retrieves the backscattering cross-section (Cback) for a sphere, written into out if given.")
+        .def("get_sphere_Cratio", &Experiment::get_sphere_Cratio, py::arg("out") = py::none(), "Retrieves the ratio between forward and backward cross-section for a sphere, written into out if given.")
         // Downward are the sphere extra parameters
-        .def("get_sphere_g", &Experiment::get_sphere_g, "Retrieves the asymmetry parameter (g) for a sphere.")
-        .def("get_sphere_coupling", &Experiment::get_sphere_coupling, "Retrieves the coupling efficiency for a sphere.")
+        .def("get_sphere_g", &Experiment::get_sphere_g, py::arg("out") = py::none(), "Retrieves the asymmetry parameter (g) for a sphere, written into out if given.")
+        .def("get_sphere_max_order", &Experiment::get_sphere_max_order, py::arg("out") = py::none(), "Retrieves the number of orders of the Mie series used for a sphere, written into out if given.")
+        .def("get_sphere_coupling", &Experiment::get_sphere_coupling, py::arg("out") = py::none(), "Retrieves the coupling efficiency for a sphere, written into out if given.")
+        .def("get_sphere_many", &Experiment::get_sphere_many, py::arg("measures"), "Retrieves several measures for a sphere in a single pass over the parameter grid, returned as a dict keyed by measure.")
+        .def("get_sphere_points", &Experiment::get_sphere_points, py::arg("measure"), py::arg("indices"), "Retrieves a measure for a sphere at a list of points, given as a 2D array holding the indices of each point along the source, sphere and, for the coupling, detector axes.")
         // Sphere coefficient retrievals
         .def("get_sphere_an", &Experiment::get_sphere_an, "Retrieves the an coefficient for a sphere.")
         .def("get_sphere_bn", &Experiment::get_sphere_bn, "Retrieves the bn coefficient for a sphere.")
-        .def("get_sphere_a1", &Experiment::get_sphere_a1, "Retrieves the a1 coefficient for a sphere.")
-        .def("get_sphere_b1", &Experiment::get_sphere_b1, "Retrieves the b1 coefficient for a sphere.")
-        .def("get_sphere_a2", &Experiment::get_sphere_a2, "Retrieves the a2 coefficient for a sphere.")
-        .def("get_sphere_b2", &Experiment::get_sphere_b2, "Retrieves the b2 coefficient for a sphere.")
-        .def("get_sphere_a3", &Experiment::get_sphere_a3, "Retrieves the a3 coefficient for a sphere.")
-        .def("get_sphere_b3", &Experiment::get_sphere_b3, "Retrieves the b3 coefficient for a sphere.")
+        .def("get_sphere_a1", &Experiment::get_sphere_a1, py::arg("out") = py::none(), "Retrieves the a1 coefficient for a sphere, written into out if given.")
+        .def("get_sphere_b1", &Experiment::get_sphere_b1, py::arg("out") = py::none(), "Retrieves the b1 coefficient for a sphere, written into out if given.")
+        .def("get_sphere_a2", &Experiment::get_sphere_a2, py::arg("out") = py::none(), "Retrieves the a2 coefficient for a sphere, written into out if given.")
+        .def("get_sphere_b2", &Experiment::get_sphere_b2, py::arg("out") = py::none(), "Retrieves the b2 coefficient for a sphere, written into out if given.")
+        .def("get_sphere_a3", &Experiment::get_sphere_a3, py::arg("out") = py::none(), "Retrieves the a3 coefficient for a sphere, written into out if given.")
+        .def("get_sphere_b3", &Experiment::get_sphere_b3, py::arg("out") = py::none(), "Retrieves the b3 coefficient for a sphere, written into out if given.")
 
         // Cylinder metrics
         // Downward are the cylinder efficiencies
-        .def("get_cylinder_Qsca", &Experiment::get_cylinder_Qsca, "Retrieves the scattering efficiency (Qsca) for a cylinder.")
-        .def("get_cylinder_Qext", &Experiment::get_cylinder_Qext, "Retrieves the extinction efficiency (Qext) for a cylinder.")
-        .def("get_cylinder_Qabs", &Experiment::get_cylinder_Qabs, "Retrieves the absorption efficiency (Qabs) for a cylinder.")
+        .def("get_cylinder_Qsca", &Experiment::get_cylinder_Qsca, py::arg("out") = py::none(), "Retrieves the scattering efficiency (Qsca) for a cylinder, written into out if given.")
+        .def("get_cylinder_Qext", &Experiment::get_cylinder_Qext, py::arg("out") = py::none(), "Retrieves the extinction efficiency (Qext) for a cylinder, written into out if given.")
+        .def("get_cylinder_Qabs", &Experiment::get_cylinder_Qabs, py::arg("out") = py::none(), "Retrieves the absorption efficiency (Qabs) for a cylinder, written into out if given.")
         // Downward are the cylinder cross-sections
-        .def("get_cylinder_Csca", &Experiment::get_cylinder_Csca, "Retrieves the scattering cross-section (Csca) for a cylinder.")
-        .def("get_cylinder_Cext", &Experiment::get_cylinder_Cext, "Retrieves the extinction cross-section (Cext) for a cylinder.")
-        .def("get_cylinder_Cabs", &Experiment::get_cylinder_Cabs, "Retrieves the absorption cross-section (Cabs) for a cylinder.")
+        .def("get_cylinder_Csca", &Experiment::get_cylinder_Csca, py::arg("out") = py::none(), "Retrieves the scattering cross-section (Csca) for a cylinder, written into out if given.")
+        .def("get_cylinder_Cext", &Experiment::get_cylinder_Cext, py::arg("out") = py::none(), "Retrieves the extinction cross-section (Cext) for a cylinder, written into out if given.")
+        .def("get_cylinder_Cabs", &Experiment::get_cylinder_Cabs, py::arg("out") = py::none(), "Retrieves the absorption cross-section (Cabs) for a cylinder, written into out if given.")
         // Downward are the cylinder extra parameters
-        .def("get_cylinder_g", &Experiment::get_cylinder_g, "Retrieves the asymmetry parameter (g) for a cylinder.")
-        .def("get_cylinder_coupling", &Experiment::get_cylinder_coupling, "Retrieves the coupling efficiency for a cylinder.")
+        .def("get_cylinder_g", &Experiment::get_cylinder_g, py::arg("out") = py::none(), "Retrieves the asymmetry parameter (g) for a cylinder, written into out if given.")
+        .def("get_cylinder_max_order", &Experiment::get_cylinder_max_order, py::arg("out") = py::none(), "Retrieves the number of orders of the Mie series used for a cylinder, written into out if given.")
+        .def("get_cylinder_coupling", &Experiment::get_cylinder_coupling, py::arg("out") = py::none(), "Retrieves the coupling efficiency for a cylinder, written into out if given.")
+        .def("get_cylinder_many", &Experiment::get_cylinder_many, py::arg("measures"), "Retrieves several measures for a cylinder in a single pass over the parameter grid, returned as a dict keyed by measure.")
+        .def("get_cylinder_points", &Experiment::get_cylinder_points, py::arg("measure"), py::arg("indices"), "Retrieves a measure for a cylinder at a list of points, given as a 2D array holding the indices of each point along the source, cylinder and, for the coupling, detector axes.")
 
         // Cylinder coefficient retrievals
         .def("get_cylinder_a1n", &Experiment::get_cylinder_a1n, "Retrieves the a1n coefficient for a cylinder.")
         .def("get_cylinder_a2n", &Experiment::get_cylinder_a2n, "Retrieves the a2n coefficient for a cylinder.")
         .def("get_cylinder_b1n", &Experiment::get_cylinder_b1n, "Retrieves the b1n coefficient for a cylinder.")
         .def("get_cylinder_b2n", &Experiment::get_cylinder_b2n, "Retrieves the b2n coefficient for a cylinder.")
-        .def("get_cylinder_a11", &Experiment::get_cylinder_a11, "Retrieves the a11 coefficient for a cylinder.")
-        .def("get_cylinder_a21", &Experiment::get_cylinder_a21, "Retrieves the a21 coefficient for a cylinder.")
-        .def("get_cylinder_b11", &Experiment::get_cylinder_b11, "Retrieves the b11 coefficient for a cylinder.")
-        .def("get_cylinder_b21", &Experiment::get_cylinder_b21, "Retrieves the b21 coefficient for a cylinder.")
-        .def("get_cylinder_a12", &Experiment::get_cylinder_a12, "Retrieves the a12 coefficient for a cylinder.")
-        .def("get_cylinder_a22", &Experiment::get_cylinder_a22, "Retrieves the a22 coefficient for a cylinder.")
-        .def("get_cylinder_b12", &Experiment::get_cylinder_b12, "Retrieves the b12 coefficient for a cylinder.")
-        .def("get_cylinder_b22", &Experiment::get_cylinder_b22, "Retrieves the b22 coefficient for a cylinder.")
-        .def("get_cylinder_a13", &Experiment::get_cylinder_a13, "Retrieves the a13 coefficient for a cylinder.")
-        .def("get_cylinder_a23", &Experiment::get_cylinder_a23, "Retrieves the a23 coefficient for a cylinder.")
-        .def("get_cylinder_b13", &Experiment::get_cylinder_b13, "Retrieves the b13 coefficient for a cylinder.")
-        .def("get_cylinder_b23", &Experiment::get_cylinder_b23, "Retrieves the b23 coefficient for a cylinder.")
+        .def("get_cylinder_a11", &Experiment::get_cylinder_a11, py::arg("out") = py::none(), "Retrieves the a11 coefficient for a cylinder, written into out if given.")
+        .def("get_cylinder_a21", &Experiment::get_cylinder_a21, py::arg("out") = py::none(), "Retrieves the a21 coefficient for a cylinder, written into out if given.")
+        .def("get_cylinder_b11", &Experiment::get_cylinder_b11, py::arg("out") = py::none(), "Retrieves the b11 coefficient for a cylinder, written into out if given.")
+        .def("get_cylinder_b21", &Experiment::get_cylinder_b21, py::arg("out") = py::none(), "Retrieves the b21 coefficient for a cylinder, written into out if given.")
+        .def("get_cylinder_a12", &Experiment::get_cylinder_a12, py::arg("out") = py::none(), "Retrieves the a12 coefficient for a cylinder, written into out if given.")
+        .def("get_cylinder_a22", &Experiment::get_cylinder_a22, py::arg("out") = py::none(), "Retrieves the a22 coefficient for a cylinder, written into out if given.")
+        .def("get_cylinder_b12", &Experiment::get_cylinder_b12, py::arg("out") = py::none(), "Retrieves the b12 coefficient for a cylinder, written into out if given.")
+        .def("get_cylinder_b22", &Experiment::get_cylinder_b22, py::arg("out") = py::none(), "Retrieves the b22 coefficient for a cylinder, written into out if given.")
+        .def("get_cylinder_a13", &Experiment::get_cylinder_a13, py::arg("out") = py::none(), "Retrieves the a13 coefficient for a cylinder, written into out if given.")
+        .def("get_cylinder_a23", &Experiment::get_cylinder_a23, py::arg("out") = py::none(), "Retrieves the a23 coefficient for a cylinder, written into out if given.")
+        .def("get_cylinder_b13", &Experiment::get_cylinder_b13, py::arg("out") = py::none(), "Retrieves the b13 coefficient for a cylinder, written into out if given.")
+        .def("get_cylinder_b23", &Experiment::get_cylinder_b23, py::arg("out") = py::none(), "Retrieves the b23 coefficient for a cylinder, written into out if given.")
 
         // Coreshell metrics
         // Downward are the core/shell efficiencies
-        .def("get_coreshell_Qsca", &Experiment::get_coreshell_Qsca, "Retrieves the scattering efficiency (Qsca) for a coreshell.")
-        .def("get_coreshell_Qext", &Experiment::get_coreshell_Qext, "Retrieves the extinction efficiency (Qext) for a coreshell.")
-        .def("get_coreshell_Qabs", &Experiment::get_coreshell_Qabs, "Retrieves the absorption efficiency (Qabs) for a coreshell.")
-        .def("get_coreshell_Qpr", &Experiment::get_coreshell_Qpr, "Retrieves the radiation pressure efficiency (Qpr) for a coreshell.")
-        .def("get_coreshell_Qforward", &Experiment::get_coreshell_Qforward, "Retrieves the forward scattering efficiency (Qforward) for a coreshell.")
-        .def("get_coreshell_Qback", &Experiment::get_coreshell_Qback, "Retrieves the backscattering efficiency (Qback) for a coreshell.")
-        .def("get_coreshell_Qratio", &Experiment::get_coreshell_Qratio, "Retrieves the ratio between forward and backward efficiencies for a coreshell.")
+        .def("get_coreshell_Qsca", &Experiment::get_coreshell_Qsca, py::arg("out") = py::none(), "Retrieves the scattering efficiency (Qsca) for a coreshell, written into out if given.")
+        .def("get_coreshell_Qext", &Experiment::get_coreshell_Qext, py::arg("out") = py::none(), "Retrieves the extinction efficiency (Qext) for a coreshell, written into out if given.")
+        .def("get_coreshell_Qabs", &Experiment::get_coreshell_Qabs, py::arg("out") = py::none(), "Retrieves the absorption efficiency (Qabs) for a coreshell, written into out if given.")
+        .def("get_coreshell_Qpr", &Experiment::get_coreshell_Qpr, py::arg("out") = py::none(), "Retrieves the radiation pressure efficiency (Qpr) for a coreshell, written into out if given.")
+        .def("get_coreshell_Qforward", &Experiment::get_coreshell_Qforward, py::arg("out") = py::none(), "Retrieves the forward scattering efficiency (Qforward) for a coreshell, written into out if given.")
+        .def("get_coreshell_Qback", &Experiment::get_coreshell_Qback, py::arg("out") = py::none(), "Retrieves the backscattering efficiency (Qback) for a coreshell, written into out if given.")
+        .def("get_coreshell_Qratio", &Experiment::get_coreshell_Qratio, py::arg("out") = py::none(), "Retrieves the ratio between forward and backward efficiencies for a coreshell, written into out if given.")
         // Downward are the core/shell cross-sections
-        .def("get_coreshell_Csca", &Experiment::get_coreshell_Csca, "Retrieves the scattering cross-section (Csca) for a coreshell.")
-        .def("get_coreshell_Cext", &Experiment::get_coreshell_Cext, "Retrieves the extinction cross-section (Cext) for a coreshell.")
-        .def("get_coreshell_Cabs", &Experiment::get_coreshell_Cabs, "Retrieves the absorption cross-section (Cabs) for a coreshell.")
-        .def("get_coreshell_Cpr", &Experiment::get_coreshell_Cpr, "Retrieves the radiation pressure cross-section (Cpr) for a coreshell.")
-        .def("get_coreshell_Cforward", &Experiment::get_coreshell_Cforward, "Retrieves the forward scattering cross-section (Cforward) for a coreshell.")
-        .def("get_coreshell_Cback", &Experiment::get_coreshell_Cback, "Retrieves the backscattering cross-section (Cback) for a coreshell.")
-        .def("get_coreshell_Cratio", &Experiment::get_coreshell_Cratio, "Retrieves the ratio between forward and backward cross-section for a coreshell.")
+        .def("get_coreshell_Csca", &Experiment::get_coreshell_Csca, py::arg("out") = py::none(), "Retrieves the scattering cross-section (Csca) for a coreshell, written into out if given.")
+        .def("get_coreshell_Cext", &Experiment::get_coreshell_Cext, py::arg("out") = py::none(), "Retrieves the extinction cross-section (Cext) for a coreshell, written into out if given.")
+        .def("get_coreshell_Cabs", &Experiment::get_coreshell_Cabs, py::arg("out") = py::none(), "Retrieves the absorption cross-section (Cabs) for a coreshell, written into out if given.")
+        .def("get_coreshell_Cpr", &Experiment::get_coreshell_Cpr, py::arg("out") = py::none(), "Retrieves the radiation pressure cross-section (Cpr) for a coreshell, written into out if given.")
+        .def("get_coreshell_Cforward", &Experiment::get_coreshell_Cforward, py::arg("out") = py::none(), "Retrieves the forward scattering cross-section (Cforward) for a coreshell, written into out if given.")
+        .def("get_coreshell_Cback", &Experiment::get_coreshell_Cback, py::arg("out") = py::none(), "Retrieves the backscattering cross-section (Cback) for a coreshell, written into out if given.")
+        .def("get_coreshell_Cratio", &Experiment::get_coreshell_Cratio, py::arg("out") = py::none(), "Retrieves the ratio between forward and backward cross-section for a coreshell, written into out if given.")
         // Downward are the core/shell extra parameters
-        .def("get_coreshell_g", &Experiment::get_coreshell_g, "Retrieves the asymmetry parameter (g) for a coreshell.")
-        .def("get_coreshell_coupling", &Experiment::get_coreshell_coupling, "Retrieves the coupling efficiency for a coreshell.")
+        .def("get_coreshell_g", &Experiment::get_coreshell_g, py::arg("out") = py::none(), "Retrieves the asymmetry parameter (g) for a coreshell, written into out if given.")
+        .def("get_coreshell_max_order", &Experiment::get_coreshell_max_order, py::arg("out") = py::none(), "Retrieves the number of orders of the Mie series used for a coreshell, written into out if given.")
+        .def("get_coreshell_coupling", &Experiment::get_coreshell_coupling, py::arg("out") = py::none(), "Retrieves the coupling efficiency for a coreshell, written into out if given.")
+        .def("get_coreshell_many", &Experiment::get_coreshell_many, py::arg("measures"), "Retrieves several measures for a coreshell in a single pass over the parameter grid, returned as a dict keyed by measure.")
+        .def("get_coreshell_points", &Experiment::get_coreshell_points, py::arg("measure"), py::arg("indices"), "Retrieves a measure for a coreshell at a list of points, given as a 2D array holding the indices of each point along the source, coreshell and, for the coupling, detector axes.")
 
         // Coreshell coefficient retrievals
         .def("get_coreshell_an", &Experiment::get_coreshell_an, "Retrieves the an coefficient for a coreshell.")
         .def("get_coreshell_bn", &Experiment::get_coreshell_bn, "Retrieves the bn coefficient for a coreshell.")
-        .def("get_coreshell_a1", &Experiment::get_coreshell_a1, "Retrieves the a1 coefficient for a coreshell.")
-        .def("get_coreshell_b1", &Experiment::get_coreshell_b1, "Retrieves the b1 coefficient for a coreshell.")
-        .def("get_coreshell_a2", &Experiment::get_coreshell_a2, "Retrieves the a2 coefficient for a coreshell.")
-        .def("get_coreshell_b2", &Experiment::get_coreshell_b2, "Retrieves the b2 coefficient for a coreshell.")
-        .def("get_coreshell_a3", &Experiment::get_coreshell_a3, "Retrieves the a3 coefficient for a coreshell.")
-        .def("get_coreshell_b3", &Experiment::get_coreshell_b3, "Retrieves the b3 coefficient for a coreshell.");
+        .def("get_coreshell_a1", &Experiment::get_coreshell_a1, py::arg("out") = py::none(), "Retrieves the a1 coefficient for a coreshell, written into out if given.")
+        .def("get_coreshell_b1", &Experiment::get_coreshell_b1, py::arg("out") = py::none(), "Retrieves the b1 coefficient for a coreshell, written into out if given.")
+        .def("get_coreshell_a2", &Experiment::get_coreshell_a2, py::arg("out") = py::none(), "Retrieves the a2 coefficient for a coreshell, written into out if given.")
+        .def("get_coreshell_b2", &Experiment::get_coreshell_b2, py::arg("out") = py::none(), "Retrieves the b2 coefficient for a coreshell, written into out if given.")
+        .def("get_coreshell_a3", &Experiment::get_coreshell_a3, py::arg("out") = py::none(), "Retrieves the a3 coefficient for a coreshell, written into out if given.")
+        .def("get_coreshell_b3", &Experiment::get_coreshell_b3, py::arg("out") = py::none(), "Retrieves the b3 coefficient for a coreshell, written into out if given.");
 
+    module.def("set_cache_budget", [](size_t budget) { DETECTOR::Cache::get_instance().set_budget(budget); }, py::arg("budget"), "Sets the budget in bytes of the cache of the detector meshes and mode fields, the least recently used entries being evicted beyond it. 0 disables the cache.");
+    module.def("get_cache_budget", []() { return DETECTOR::Cache::get_instance().get_budget(); }, "Returns the budget in bytes of the cache of the detector meshes and mode fields.");
+    module.def("get_cache_size", []() { return DETECTOR::Cache::get_instance().get_size(); }, "Returns the size in bytes of the detector meshes and mode fields held by the cache.");
+    module.def("clear_cache", []() { DETECTOR::Cache::get_instance().clear(); }, "Clears the cache of the detector meshes and mode fields.");
 }
 
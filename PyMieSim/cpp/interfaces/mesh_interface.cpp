@@ -1,4 +1,5 @@
 #include <pybind11/pybind11.h>
+#include <pybind11/stl.h>
 #include "fibonacci_mesh.cpp"
 
 namespace py = pybind11;
@@ -7,13 +8,14 @@ PYBIND11_MODULE(Fibonacci, module) {
     module.doc() = "Generalized Lorenz-Mie Theory (GLMT) C++ binding module for light scattering from a spherical scatterer";
 
     py::class_<FibonacciMesh>(module, "FibonacciMesh")
-        .def(py::init<int, double, double, double, double>(),
+        .def(py::init<int, double, double, double, double, const std::string&>(),
              py::arg("sampling"),
              py::arg("max_angle"),
              py::arg("phi_offset"),
              py::arg("rotation_angle"),
              py::arg("gamma_offset"),
-             "Initializes a Fibonacci mesh with specified parameters.")
+             py::arg("quadrature") = "fibonacci",
+             "Initializes a Fibonacci mesh with specified parameters, or a product Gauss-Legendre mesh of the same cap with quadrature='gauss'.")
 
         // Properties for coordinates
         .def_property_readonly("x", &FibonacciMesh::get_x_py, "X coordinates of points on the Fibonacci mesh.")
@@ -32,6 +34,8 @@ PYBIND11_MODULE(Fibonacci, module) {
         // Differential solid angle and total solid angle
         .def_readwrite("d_omega", &FibonacciMesh::dOmega, "Differential solid angle covered by each point.")
         .def_readwrite("omega", &FibonacciMesh::Omega, "Total solid angle covered by the mesh.")
+        .def_property_readonly("weights", &FibonacciMesh::get_weights_py, "Solid angle covered by each point.")
+        .def_readonly("quadrature", &FibonacciMesh::quadrature, "Quadrature of the mesh, either 'fibonacci' or 'gauss'.")
 
         // Methods for rotation and field computation
         .def("rotate_around_axis", &FibonacciMesh::rotate_around_axis, py::arg("angle"), "Rotates the mesh around a specified axis by a given angle.")
@@ -39,7 +39,10 @@ PYBIND11_MODULE(SetsInterface, module) {
             py::arg("diameter"),
             py::arg("material"),
             py::arg("medium_material"),
-            "Initializes a set of spheres with given diameters, material indices (for each wavelength), and medium material.");
+            "Initializes a set of spheres with given diameters, material indices (for each wavelength), and medium material.")
+
+        .def("zip_axes", &SPHERE::Set::zip_axes, py::arg("axes"), "Makes the parameters of the given axes vary together instead of forming their outer product, the axes following the first of them then have a size of 1.")
+        .def_readonly("shape", &SPHERE::Set::shape, "Number of values along each axis of the set.");
 
 // Binding for CYLINDER::Set
     py::class_<CYLINDER::Set>(module, "CppCylinderSet")
@@ -65,7 +68,10 @@ PYBIND11_MODULE(SetsInterface, module) {
             py::arg("diameter"),
             py::arg("material"),
             py::arg("medium_material"),
-            "Initializes a set of spheres with given diameters, material indices (for each wavelength), and medium material.");
+            "Initializes a set of spheres with given diameters, material indices (for each wavelength), and medium material.")
+
+        .def("zip_axes", &CYLINDER::Set::zip_axes, py::arg("axes"), "Makes the parameters of the given axes vary together instead of forming their outer product, the axes following the first of them then have a size of 1.")
+        .def_readonly("shape", &CYLINDER::Set::shape, "Number of values along each axis of the set.");
 
 // Binding for CORESHELL::Set
     py::class_<CORESHELL::Set>(module, "CppCoreShellSet")
@@ -131,7 +137,10 @@ PYBIND11_MODULE(SetsInterface, module) {
             pybind11::arg("core_material"),
             pybind11::arg("shell_material"),
             pybind11::arg("medium_material"),
-            "Initializes a core-shell set with specific core diameters, shell widths, core indices, shell indices, and medium refractive index.");
+            "Initializes a core-shell set with specific core diameters, shell widths, core indices, shell indices, and medium refractive index.")
+
+        .def("zip_axes", &CORESHELL::Set::zip_axes, py::arg("axes"), "Makes the parameters of the given axes vary together instead of forming their outer product, the axes following the first of them then have a size of 1.")
+        .def_readonly("shape", &CORESHELL::Set::shape, "Number of values along each axis of the set.");
 
 // Binding for SOURCE::Set
     py::class_<SOURCE::Set>(module, "CppSourceSet")
@@ -140,11 +149,13 @@ PYBIND11_MODULE(SetsInterface, module) {
             py::arg("jones_vector"),
             py::arg("NA"),
             py::arg("optical_power"),
-            "Initializes a source set with specific wavelengths, Jones vectors, and amplitudes.");
+            "Initializes a source set with specific wavelengths, Jones vectors, and amplitudes.")
+
+        .def_readonly("shape", &SOURCE::Set::shape, "Number of values along each axis of the set.");
 
 // Binding for DETECTOR::Set
     py::class_<DETECTOR::Set>(module, "CppDetectorSet")
-        .def(py::init<std::vector<std::string>, std::vector<unsigned>, std::vector<double>, std::vector<double>, std::vector<double>, std::vector<double>, std::vector<double>, bool, bool>(),
+        .def(py::init<std::vector<std::string>, std::vector<unsigned>, std::vector<double>, std::vector<double>, std::vector<double>, std::vector<double>, std::vector<double>, bool, bool, std::string>(),
              py::arg("mode_number"),
              py::arg("sampling"),
              py::arg("NA"),
@@ -154,7 +165,10 @@ PYBIND11_MODULE(SetsInterface, module) {
              py::arg("rotation"),
              py::arg("coherent"),
              py::arg("mean_coupling"),
-             "Initializes a detector set with scalar fields, numerical aperture, offsets, filters, angle, coherence, and coupling type.");
+             py::arg("quadrature") = "fibonacci",
+             "Initializes a detector set with scalar fields, numerical aperture, offsets, filters, angle, coherence, coupling type and mesh quadrature.")
+
+        .def_readonly("shape", &DETECTOR::Set::shape, "Number of values along each axis of the set.");
 }
 
 // -
@@ -14,12 +14,13 @@ PYBIND11_MODULE(SphereInterface, module) {
     // Binding for SPHERE::Scatterer class
     py::class_<Scatterer>(module, "SPHERE")
         .def(
-            py::init<const double, const complex128, const double, const SOURCE::BaseSource&, size_t>(),
+            py::init<const double, const complex128, const double, const SOURCE::BaseSource&, size_t, const double>(),
             py::arg("diameter"),
             py::arg("index"),
             py::arg("medium_index"),
             py::arg("source"),
             py::arg("max_order") = 0,
+            py::arg("tolerance") = 0.0,
             "Constructor for SPHERE, initializing it with physical and optical properties.")
         .def("get_s1s2", &Scatterer::get_s1s2_py, py::arg("phi"), "Calculates and returns the S1 and S2 scattering parameters for a sphere.")
         .def("get_fields", &Scatterer::get_unstructured_fields_py, py::arg("phi"), py::arg("theta"), py::arg("r"), py::return_value_policy::move, "Returns the unstructured electromagnetic fields around the sphere.")
@@ -47,6 +48,7 @@ PYBIND11_MODULE(SphereInterface, module) {
         .def_property_readonly("Cpr", &Scatterer::get_Cpr, "Radiation pressure cross-section of the sphere.")
         // Note: Downward are the extra parameters
         .def_property_readonly("g", &Scatterer::get_g, "Asymmetry parameter of the sphere.")
+        .def_readonly("max_order", &Scatterer::max_order, "Number of orders of the Mie series, after the truncation at the tolerance.")
         .def_readwrite("area", &Scatterer::area, "Physical cross-sectional area of the sphere.")
         .def_readwrite("size_parameter", &Scatterer::size_parameter, "Size parameter of the sphere scatterer.");
 }
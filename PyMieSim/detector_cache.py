@@ -0,0 +1,54 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from PyMieSim.binary import DetectorInterface, Experiment
+from PyMieSim.experiment import setup
+
+# Each binary module builds its detectors from its own cache: the single detectors from the one of DetectorInterface and
+# the detectors of the experiments from the one of Experiment.
+cache_modules = (DetectorInterface, Experiment)
+
+
+def set_budget(budget: int) -> None:
+    """
+    Set the memory budget of the caches of the detector meshes and mode fields, beyond which their least recently used
+    entries are evicted.
+
+    Parameters:
+        - budget: int, the budget in bytes of each cache, 0 disables the caches.
+    """
+    if budget < 0:
+        raise ValueError(f'The cache budget must be positive, got {budget}.')
+
+    for module in cache_modules:
+        module.set_cache_budget(int(budget))
+
+
+def get_budget() -> int:
+    """
+    Return the memory budget of the caches of the detector meshes and mode fields.
+
+    Returns:
+        - int, the budget in bytes of each cache.
+    """
+    return DetectorInterface.get_cache_budget()
+
+
+def get_size() -> int:
+    """
+    Return the memory held by the caches of the detector meshes and mode fields.
+
+    Returns:
+        - int, the size in bytes of the cached entries.
+    """
+    return sum(module.get_cache_size() for module in cache_modules)
+
+
+def clear() -> None:
+    """
+    Clear the caches of the detector meshes and mode fields, and the samplings chosen by sampling='auto'.
+    """
+    for module in cache_modules:
+        module.clear_cache()
+
+    setup._auto_sampling_cache.clear()
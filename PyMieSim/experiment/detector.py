@@ -10,6 +10,14 @@ from PyMieSim.experiment import parameters
 from typing import List, Union, NoReturn
 
 
+# Smallest and largest sampling tried by sampling='auto', which is doubled until the coupling converges.
+auto_sampling_start = 100
+auto_sampling_stop = 25600
+
+# Number of scatterers, from the smallest to the largest number of multipole orders, on which sampling='auto' checks
+# the convergence of the coupling.
+auto_sampling_points = 5
+
 config_dict = ConfigDict(
     kw_only=True,
     slots=True,
@@ -30,7 +38,11 @@ class BaseDetector():
         gamma_offset (List[float]): Specifies the angular offset perpendicular to polarization (in degrees).
         phi_offset (List[float]): Specifies the angular offset parallel to polarization (in degrees).
         polarization_filter (List[float]): Sets the angle of the polarization filter (in degrees).
-        sampling (List[int]): Dictates the resolution for field sampling.
+        sampling (List[int] | str): Dictates the resolution for field sampling, or 'auto' to let the experiment choose the
+            smallest one reaching the tolerance.
+        tolerance (float): Relative accuracy of the coupling targeted by sampling='auto'.
+        quadrature (str): Mesh over which the coupling is integrated, either 'fibonacci' for equal-weight points or 'gauss'
+            for a product Gauss-Legendre mesh of about the same number of points, which converges much faster.
 
     This class is not intended for direct instantiation.
     """
@@ -41,6 +53,19 @@ class BaseDetector():
         field arrays, setting up rotation angles, and initializing visualization and C++ bindings.
         """
         self.mode_number = numpy.atleast_1d(self.mode_number).astype(str)
+
+        self.auto_sampling = isinstance(self.sampling, str)
+
+        if self.auto_sampling:
+            if self.sampling != 'auto':
+                raise ValueError(f"Invalid sampling: {self.sampling}, must be integers or 'auto'")
+
+            if self.tolerance <= 0:
+                raise ValueError(f"The tolerance of sampling='auto' must be positive, got {self.tolerance}")
+
+            # Placeholder until the experiment chooses the sampling
+            self.sampling = auto_sampling_start
+
         self.sampling = numpy.atleast_1d(self.sampling).astype(int)
         self.NA = numpy.atleast_1d(self.NA).astype(float)
         self.phi_offset = numpy.deg2rad(numpy.atleast_1d(self.phi_offset).astype(float))
@@ -83,11 +108,22 @@ class BaseDetector():
             polarization_filter=self.polarization_filter,
             rotation=self.rotation,
             mean_coupling=self.mean_coupling,
-            coherent=self.coherent
+            coherent=self.coherent,
+            quadrature=self.quadrature
         )
 
         self.binding = CppDetectorSet(**self.binding_kwargs)
 
+    def _set_sampling(self, sampling: int) -> NoReturn:
+        """
+        Sets the sampling chosen by the experiment for sampling='auto' and rebuilds the C++ bindings.
+
+        Parameters:
+            sampling (int): The sampling of the detector mesh.
+        """
+        self.sampling = numpy.atleast_1d(sampling).astype(int)
+        self._initialize_binding()
+
     def _get_datavisual_table(self) -> NoReturn:
         """
         Compiles the detector's properties into a table format for data visualization.
@@ -114,21 +150,27 @@ class Photodiode(BaseDetector):
         gamma_offset (Union[List[float], float]): Gamma offset(s) for the detector.
         phi_offset (Union[List[float], float]): Phi offset(s) for the detector.
         polarization_filter (Union[List[Optional[float]], Optional[float]]): Polarization filter(s) for the detector.
-        sampling (Union[List[int], int]): Sampling rate(s) for the detector.
+        sampling (Union[List[int], int, str]): Sampling rate(s) for the detector, or 'auto'.
+        tolerance (float): Relative accuracy of the coupling targeted by sampling='auto'. Defaults to 1e-3.
         mean_coupling (bool): Specifies if mean coupling is used. Defaults to True.
+        quadrature (str): Quadrature of the detector mesh, either 'fibonacci' or 'gauss'. Defaults to 'fibonacci'.
         rotation (Union[List[float], float]): Rotation angle(s) for the detector. Initialized to 0.
         coherent (bool): Indicates if the detection is coherent. Initialized to False.
         mode_number (str): Mode number of the detector. Initialized to 'NC00'.
 
     Notes:
         This class is specifically configured to simulate a photodiode detector within a Mie scattering experiment.
+        With no phi and gamma offset, the coupling is integrated exactly over the polar angle with a Gauss-Legendre
+        quadrature and no longer depends on the sampling nor on the quadrature.
     """
     NA: Union[numpy.ndarray, List[float], float]
     gamma_offset: Union[numpy.ndarray, List[float], float]
     phi_offset: Union[numpy.ndarray, List[float], float]
     polarization_filter: Union[numpy.ndarray, List[float | None], float | None]
-    sampling: Union[numpy.ndarray, List[int], int]
+    sampling: Union[numpy.ndarray, List[int], int, str]
+    tolerance: float = 1e-3
     mean_coupling: bool = True
+    quadrature: str = 'fibonacci'
     rotation: Union[numpy.ndarray, List[float] | float] = field(default=0, init=False)
     coherent: bool = field(default=False, init=False)
     mode_number: str = field(default='NC00', init=False)
@@ -143,7 +185,10 @@ class CoherentMode(BaseDetector):
 
     Attributes:
         mode_number (List[str] | str): Designates the mode numbers involved in the detection.
+        sampling (List[int] | int | str): Sampling rate(s) of the detector mesh, or 'auto'.
+        tolerance (float): Relative accuracy of the coupling targeted by sampling='auto'. Defaults to 1e-3.
         mean_coupling (bool): Indicates whether to use average coupling for calculations. Defaults to False.
+        quadrature (str): Quadrature of the detector mesh, either 'fibonacci' or 'gauss'. Defaults to 'fibonacci'.
         coherent (bool): Specifies if the detection is inherently coherent. Defaults to True.
 
     Note:
@@ -155,8 +200,10 @@ class CoherentMode(BaseDetector):
     gamma_offset: Union[numpy.ndarray, List[float], float]
     phi_offset: Union[numpy.ndarray, List[float], float]
     polarization_filter: Union[numpy.ndarray, List[float | None], float | None]
-    sampling: Union[numpy.ndarray, List[int], int]
+    sampling: Union[numpy.ndarray, List[int], int, str]
+    tolerance: float = 1e-3
     mean_coupling: bool = False
+    quadrature: str = 'fibonacci'
     coherent: bool = field(default=True, init=False)
 
     def __post_init__(self):
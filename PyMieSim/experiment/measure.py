@@ -47,6 +47,7 @@ b23 = units.Custom(short_label='b23', long_label='Magnetic octopole coeffcient')
 
 # Extra
 g = units.Custom(short_label='g', long_label='Anisotropy coefficient')
+max_order = units.Custom(short_label='max_order', long_label='Number of multipole orders')
 coupling = units.Power(short_label='coupling', long_label='Coupling')
 
 
@@ -72,6 +73,7 @@ __sphere__ = __coreshell__ = {
     'b2': b2,
     'b3': b3,
     'g': g,
+    'max_order': max_order,
     'coupling': coupling,
 }
 
@@ -94,7 +96,14 @@ __cylinder__ = {
     'b22': b22,
     'b13': b13,
     'b23': b23,
+    'max_order': max_order,
     'coupling': coupling,
 }
 
+# Multipole coefficients, the measures of complex values.
+__coefficient__ = {
+    'a1', 'a2', 'a3', 'b1', 'b2', 'b3',
+    'a11', 'a21', 'a12', 'a22', 'a13', 'a23', 'b11', 'b21', 'b12', 'b22', 'b13', 'b23'
+}
+
 # -
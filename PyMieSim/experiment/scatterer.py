@@ -3,7 +3,7 @@
 
 from pydantic.dataclasses import dataclass
 from pydantic import ConfigDict
-from typing import List, Union, NoReturn, Any
+from typing import List, Union, NoReturn, Any, Optional
 
 import numpy
 from PyMieSim.binary.SetsInterface import CppCoreShellSet, CppCylinderSet, CppSphereSet
@@ -38,6 +38,28 @@ class BaseScatterer():
         """
         self._build_binding_kwargs()
 
+        self._zip_binding_axes()
+
+    def _zip_binding_axes(self) -> NoReturn:
+        """
+        Makes the parameters listed in zip_axes vary together in the C++ binding, so that the set iterates over the
+        tuples of their values instead of forming their outer product. The zipped parameters must have the same number
+        of values, the dimensions of the results along the parameters following the first one then have a size of 1.
+
+        Raises:
+            ValueError: If a zipped parameter is not a parameter of the scatterer or the parameters differ in size.
+        """
+        if self.zip_axes is None:
+            return
+
+        names = list(self.binding_kwargs.keys())
+
+        for name in self.zip_axes:
+            if name not in names:
+                raise ValueError(f"Cannot zip {name}, the parameters of the {self.__class__.__name__.lower()} are {names}")
+
+        self.binding.zip_axes([names.index(name) for name in self.zip_axes])
+
     def _add_material_index_to_mapping(self, name: str, indexes: numpy.ndarray, materials: numpy.ndarray, data_type: type = object) -> NoReturn:
         """
         Adds material or refractive index details to a mapping dictionary.
@@ -117,6 +139,8 @@ class Sphere(BaseScatterer):
         medium_material (List, optional): Material(s) defining the medium, used if `medium_index` is not provided.
         index (List, optional): Refractive index or indices of the spherical scatterers themselves.
         material (List, optional): Material(s) of the scatterers, used if `index` is not provided.
+        zip_axes (List[str], optional): Parameters varying together, e.g. ['diameter', 'index'] for a measured population,
+            iterated as a list of tuples instead of their outer product.
         name (str): Name identifier for the scatterer type, defaulted to 'sphere' and not intended for initialization.
     """
     source: Union[source.Gaussian, source.PlaneWave]
@@ -125,6 +149,7 @@ class Sphere(BaseScatterer):
     medium_material: Union[List[Sellmeier | DataMeasurement], Sellmeier | DataMeasurement, None] = None
     index: Union[numpy.ndarray, List[Any], Any] = None
     material: Union[List[Sellmeier | DataMeasurement], Sellmeier | DataMeasurement, None] = None
+    zip_axes: Optional[List[str]] = None
 
     available_measure_list = measure.__sphere__
 
@@ -208,6 +233,8 @@ class CoreShell(BaseScatterer):
         shell_index (List, optional): Refractive index or indices of the shell.
         core_material (List, optional): Material(s) of the core, used if `core_index` is not provided.
         shell_material (List, optional): Material(s) of the shell, used if `shell_index` is not provided.
+        zip_axes (List[str], optional): Parameters varying together, e.g. ['core_diameter', 'shell_width'], iterated as a
+            list of tuples instead of their outer product.
         name (str): An identifier for the scatterer type, defaulted to 'coreshell' and not intended for initialization.
     """
     source: Union[source.Gaussian, source.PlaneWave]
@@ -219,6 +246,7 @@ class CoreShell(BaseScatterer):
     core_material: Union[List[Sellmeier | DataMeasurement], Sellmeier | DataMeasurement, None] = None
     core_index: Union[numpy.ndarray, List[Any], Any, None] = None
     shell_material: Union[List[Sellmeier | DataMeasurement], Sellmeier | DataMeasurement, None] = None
+    zip_axes: Optional[List[str]] = None
 
     available_measure_list = measure.__coreshell__
 
@@ -315,6 +343,8 @@ class Cylinder(BaseScatterer):
         height (List): Height(s) of the cylinder in meters.
         index (List, optional): Refractive index of the cylinder.
         material (List, optional): Material(s) of the cylinder, used if `index` is not provided.
+        zip_axes (List[str], optional): Parameters varying together, e.g. ['diameter', 'index'], iterated as a list of
+            tuples instead of their outer product.
     """
     source: Union[source.Gaussian, source.PlaneWave]
     diameter: Union[numpy.ndarray, List[float], float]
@@ -322,6 +352,7 @@ class Cylinder(BaseScatterer):
     medium_material: Union[List[Sellmeier | DataMeasurement], Sellmeier | DataMeasurement, None] = None
     index: Union[numpy.ndarray, List[Any], Any, None] = None
     material: Union[List[Sellmeier | DataMeasurement], Sellmeier | DataMeasurement, None] = None
+    zip_axes: Optional[List[str]] = None
 
     available_measure_list = measure.__cylinder__
 
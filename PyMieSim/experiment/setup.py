@@ -2,15 +2,30 @@
 # -*- coding: utf-8 -*-
 
 import numpy
+import asyncio
+import logging
+import pathlib
+import collections
 from pydantic.dataclasses import dataclass
 
 from DataVisual import Array, Table
 from PyMieSim.binary.Experiment import CppExperiment
+from PyMieSim.binary.SetsInterface import CppSourceSet, CppDetectorSet
 
-from typing import Union, NoReturn, Optional
+from typing import Union, NoReturn, Optional, List, Dict, Tuple, Iterator, Callable
 from PyMieSim.experiment.scatterer import Sphere, Cylinder, CoreShell
-from PyMieSim.experiment.detector import Photodiode, CoherentMode
+from PyMieSim.experiment.detector import Photodiode, CoherentMode, auto_sampling_start, auto_sampling_stop, auto_sampling_points
 from PyMieSim.experiment.source import Gaussian, PlaneWave
+from PyMieSim.experiment import measure as pms_measure
+
+# Parameters of the source and detector sets, in the order of the dimensions of the results.
+source_axes = ['wavelength', 'jones_vector', 'NA', 'optical_power']
+detector_axes = ['mode_number', 'sampling', 'rotation', 'NA', 'phi_offset', 'gamma_offset', 'polarization_filter']
+
+# Sampling chosen by sampling='auto', keyed by the detector configuration and the representative scatterer, the least
+# recently used entries being evicted beyond auto_sampling_cache_size. It is cleared along with the detector caches.
+auto_sampling_cache_size = 128
+_auto_sampling_cache = collections.OrderedDict()
 
 
 @dataclass
@@ -25,6 +40,14 @@ class Setup(object):
             of the light (e.g., wavelength, polarization) illuminating the scatterer.
         detector (Union[Photodiode, CoherentMode, None], optional): Configuration for the detector, if any. Details the
             method of detection for scattered light, including positional and analytical parameters. Defaults to None.
+        n_threads (int, optional): Number of OpenMP threads used by the simulation, 0 falls back to the OpenMP default
+            (OMP_NUM_THREADS). The GIL is released during the computation, so other Python threads keep running. Defaults to 0.
+        schedule (str, optional): OpenMP schedule of the parameter grid, 'static', 'dynamic', 'guided' or 'cost'. The cost
+            of a point grows with the scatterer size and the detector sampling, 'cost' visits them by decreasing value with
+            a dynamic schedule to balance sweeps mixing small and large scatterers. Defaults to 'static'.
+        series_tolerance (float, optional): Relative magnitude below which the trailing orders of the Mie coefficients are
+            dropped, the Wiscombe criterion padding the series well past convergence for small scatterers. The number of
+            orders used is returned by the max_order measure. 0 keeps every order. Defaults to 0.
 
     Methods provide functionality for initializing bindings, generating parameter tables for visualization,
     and executing the simulation to compute and retrieve specified measures.
@@ -32,6 +55,9 @@ class Setup(object):
     scatterer: Union[Sphere, Cylinder, CoreShell]
     source: Union[Gaussian, PlaneWave]
     detector: Optional[Union[Photodiode, CoherentMode]] = None
+    n_threads: int = 0
+    schedule: str = 'static'
+    series_tolerance: float = 0
 
     def __post_init__(self):
         """
@@ -40,6 +66,7 @@ class Setup(object):
         """
         self._initialize_experiment()
         self._bind_components()
+        self._set_auto_sampling()
 
     def _initialize_experiment(self) -> NoReturn:
         """
@@ -49,6 +76,14 @@ class Setup(object):
 
         self.binding = CppExperiment()
 
+        self.binding.set_num_threads(self.n_threads)
+
+        self.binding.set_schedule(self.schedule)
+
+        self.binding.set_series_tolerance(self.series_tolerance)
+
+        self._running_bindings = set()
+
     def _bind_components(self):
         """Binds the experiment components to the CppExperiment instance."""
 
@@ -61,6 +96,73 @@ class Setup(object):
         if self.detector is not None:
             self.binding.set_detector(self.detector.binding)
 
+    def _set_auto_sampling(self) -> NoReturn:
+        """
+        Chooses the sampling of a detector given with sampling='auto'. The coupling is evaluated at a few points of the
+        source and scatterer grid, spread from the smallest to the largest number of multipole orders, over meshes whose
+        sampling is doubled at each step. The smallest sampling whose coupling differs from the one of the next mesh by
+        less than the tolerance of the detector, relative to the largest coupling, is used for the whole grid. The choice
+        is cached per detector configuration and representative scatterers.
+        """
+        if self.detector is None or not self.detector.auto_sampling:
+            return
+
+        scatterer_name = self.scatterer.__class__.__name__.lower()
+
+        max_order = numpy.asarray(getattr(self.binding, f'get_{scatterer_name}_max_order')())
+
+        order = numpy.argsort(max_order, axis=None, kind='stable')
+        flat_points = numpy.unique(order[numpy.linspace(0, order.size - 1, auto_sampling_points).astype(int)])
+        points = numpy.stack(numpy.unravel_index(flat_points, max_order.shape), axis=1)
+
+        components = {'source': self.source}
+
+        key = (
+            type(self.source).__name__, scatterer_name, self.series_tolerance, self.detector.tolerance,
+            *(numpy.asarray(components.get(component, self.scatterer).binding_kwargs[name])[points[:, axis]].tobytes()
+              for axis, (component, name, _) in enumerate(self._get_result_axes(pms_measure.max_order))),
+            *((name, numpy.asarray(value).tobytes()) for name, value in self.detector.binding_kwargs.items() if name != 'sampling')
+        )
+
+        if key not in _auto_sampling_cache:
+            # Every detector configuration at each representative point
+            detector_indices = numpy.indices(self.detector.binding.shape).reshape(len(self.detector.binding.shape), -1).T
+            indices = numpy.column_stack([
+                numpy.repeat(points, len(detector_indices), axis=0),
+                numpy.tile(detector_indices, (len(points), 1))
+            ]).astype(numpy.uint64)
+
+            def get_coupling(sampling: int) -> numpy.ndarray:
+                binding = self.binding.copy()
+                binding.set_detector(CppDetectorSet(**dict(self.detector.binding_kwargs, sampling=numpy.atleast_1d(sampling))))
+                return getattr(binding, f'get_{scatterer_name}_points')('coupling', indices)
+
+            sampling = auto_sampling_start
+            coupling = get_coupling(sampling)
+
+            while True:
+                if 2 * sampling > auto_sampling_stop:
+                    logging.warning(f"The coupling did not converge to a tolerance of {self.detector.tolerance} with sampling='auto', using {sampling} points.")
+                    break
+
+                next_coupling = get_coupling(2 * sampling)
+
+                if numpy.max(numpy.abs(next_coupling - coupling)) <= self.detector.tolerance * numpy.max(numpy.abs(next_coupling)):
+                    break
+
+                sampling, coupling = 2 * sampling, next_coupling
+
+            _auto_sampling_cache[key] = sampling
+
+            while len(_auto_sampling_cache) > auto_sampling_cache_size:
+                _auto_sampling_cache.popitem(last=False)
+
+        _auto_sampling_cache.move_to_end(key)
+
+        self.detector._set_sampling(_auto_sampling_cache[key])
+
+        self.binding.set_detector(self.detector.binding)
+
     def _generate_datavisual_table(self) -> NoReturn:
         """
         Generates and populates the 'x_table' with parameters from the source, scatterer, and detector sets.
@@ -76,7 +178,13 @@ class Setup(object):
         if self.detector:
             self.x_table.extend(self.detector._get_datavisual_table())
 
-    def get(self, measure: Table, export_as_numpy: bool = False) -> Union[numpy.ndarray, Array]:
+    def get(
+            self,
+            measure: Table,
+            export_as_numpy: bool = False,
+            out: Optional[numpy.ndarray] = None,
+            out_path: Optional[Union[str, pathlib.Path]] = None,
+            progress: Optional[Union[Callable[[int, int], None], object]] = None) -> Union[numpy.ndarray, Array]:
         """
         Executes the simulation to compute and retrieve the specified measure.
 
@@ -84,23 +192,473 @@ class Setup(object):
             measure (Table): The measure to be computed by the simulation, defined by the user.
             export_as_numpy (bool): Determines the format of the returned data. If True, returns a numpy array,
                                     otherwise returns a Array object for enhanced visualization capabilities.
+            out (Optional[numpy.ndarray]): Pre-allocated array the result is written into, it must be a writeable
+                                    C-contiguous array with the shape and dtype of the result, complex for the multipole
+                                    coefficients. The result is computed directly into it, without an intermediate
+                                    result buffer, the values being written at every point they are broadcast to.
+            out_path (Optional[Union[str, pathlib.Path]]): Path of a .npy file the result is written into through a
+                                    memory map instead of RAM, it can be reopened with numpy.load(out_path, mmap_mode='r').
+                                    The values of the parameters along each axis are saved alongside in a .axes.npz file.
+            progress (Optional[Union[Callable[[int, int], None], object]]): Callable called as progress(completed, total)
+                                    with the number of grid points computed, or a tqdm-compatible progress bar. It is
+                                    called from the calling thread, at most every 0.1 second. An exception raised by it
+                                    (e.g. a KeyboardInterrupt) aborts the computation.
 
         Returns:
             Union[numpy.ndarray, Array]: The computed data in the specified format, either as raw numerical
                                               values in a numpy array or structured for visualization with Array.
+
+        Note:
+            Measures are only computed over the source parameters they depend on (e.g. the efficiencies of a sphere
+            do not depend on the source polarization, NA or optical power) and broadcast over the others. The numpy
+            arrays returned are then read-only views, use numpy.copy to obtain a writable array.
         """
         if measure.short_label not in self.scatterer.available_measure_list:
             raise ValueError(f"Cannot compute {measure.short_label} for {self.scatterer.__class__.__name__.lower()}")
 
+        if out is not None and out_path is not None:
+            raise ValueError("out and out_path cannot be given together")
+
         measure_string = f'get_{self.scatterer.__class__.__name__.lower()}_{measure.short_label}'
 
-        array = getattr(self.binding, measure_string)()
+        binding = self.binding if progress is None else self._get_progress_binding(progress)
+
+        if out_path is not None:
+            shape = [size for _, _, size in self._get_result_axes(measure)]
+            dtype = numpy.complex128 if measure.short_label in pms_measure.__coefficient__ else numpy.float64
+            out = numpy.lib.format.open_memmap(out_path, mode='w+', dtype=dtype, shape=tuple(shape))
+
+        array = getattr(binding, measure_string)() if out is None else getattr(binding, measure_string)(out=out)
+
+        if out_path is not None:
+            out.flush()
+            self._save_result_axes(measure, out_path)
 
         if export_as_numpy:
             return self._export_as_numpy(array)
 
         return self._export_as_data_visual(measure, array)
 
+    async def get_async(self, measure: Table, export_as_numpy: bool = False) -> Union[numpy.ndarray, Array]:
+        """
+        Executes the simulation on a worker thread of the running event loop, the GIL being released by the engine
+        during the computation. Cancelling the awaiting task aborts the computation, which is checked cooperatively
+        by the engine loops, as does Setup.cancel for every running asynchronous computation.
+
+        Parameters:
+            measure (Table): The measure to be computed by the simulation.
+            export_as_numpy (bool): Determines the format of the returned data. If True, returns a numpy array,
+                                    otherwise returns a Array object for enhanced visualization capabilities.
+
+        Returns:
+            Union[numpy.ndarray, Array]: The computed data in the specified format.
+
+        Raises:
+            asyncio.CancelledError: If the computation was cancelled.
+        """
+        if measure.short_label not in self.scatterer.available_measure_list:
+            raise ValueError(f"Cannot compute {measure.short_label} for {self.scatterer.__class__.__name__.lower()}")
+
+        measure_string = f'get_{self.scatterer.__class__.__name__.lower()}_{measure.short_label}'
+
+        # Each computation runs on its own copy of the bindings, so that it can be cancelled independently.
+        binding = self.binding.copy()
+
+        self._running_bindings.add(binding)
+
+        try:
+            array = await asyncio.get_running_loop().run_in_executor(None, getattr(binding, measure_string))
+
+        except asyncio.CancelledError:
+            binding.cancel()
+            raise
+
+        except RuntimeError:
+            if binding.is_cancelled():
+                raise asyncio.CancelledError()
+            raise
+
+        finally:
+            self._running_bindings.discard(binding)
+
+        if export_as_numpy:
+            return self._export_as_numpy(array)
+
+        return self._export_as_data_visual(measure, array)
+
+    def cancel(self) -> NoReturn:
+        """
+        Cancels every computation running through get_async on this setup.
+        """
+        for binding in list(self._running_bindings):
+            binding.cancel()
+
+    def get_many(self, measures: List[Table], export_as_numpy: bool = False) -> Dict[str, Union[numpy.ndarray, Array]]:
+        """
+        Executes the simulation once for several measures. Each scatterer of the parameter grid is computed
+        a single time and every requested measure is evaluated from the same multipole coefficients.
+
+        Parameters:
+            measures (List[Table]): The measures to be computed by the simulation.
+            export_as_numpy (bool): Determines the format of the returned data. If True, returns numpy arrays,
+                                    otherwise returns Array objects for enhanced visualization capabilities.
+
+        Returns:
+            Dict[str, Union[numpy.ndarray, Array]]: The computed data keyed by the measure short label.
+        """
+        for measure in measures:
+            if measure.short_label not in self.scatterer.available_measure_list:
+                raise ValueError(f"Cannot compute {measure.short_label} for {self.scatterer.__class__.__name__.lower()}")
+
+        measure_string = f'get_{self.scatterer.__class__.__name__.lower()}_many'
+
+        arrays = getattr(self.binding, measure_string)([measure.short_label for measure in measures])
+
+        if export_as_numpy:
+            return {measure.short_label: self._export_as_numpy(arrays[measure.short_label]) for measure in measures}
+
+        return {measure.short_label: self._export_as_data_visual(measure, arrays[measure.short_label]) for measure in measures}
+
+    def iter_chunks(self, measure: Table, chunk_size: int = 1, axis: int = 0) -> Iterator[Tuple[tuple, numpy.ndarray]]:
+        """
+        Evaluates the parameter grid slab by slab along one axis, so that only one chunk of the result is
+        held in memory at a time. Each chunk is computed with the full parallelism of the engine.
+
+        Parameters:
+            measure (Table): The measure to be computed by the simulation.
+            chunk_size (int): Number of values of the chunked axis evaluated at once.
+            axis (int): Axis of the result along which it is chunked, following the order of the result dimensions:
+                        source, scatterer, then detector parameters for the coupling.
+
+        Returns:
+            Iterator[Tuple[tuple, numpy.ndarray]]: Pairs of the index of the chunk in the full result, usable as
+                                                   ``full_array[index] = array``, and the computed chunk.
+        """
+        if measure.short_label not in self.scatterer.available_measure_list:
+            raise ValueError(f"Cannot compute {measure.short_label} for {self.scatterer.__class__.__name__.lower()}")
+
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
+
+        axes = self._get_result_axes(measure)
+
+        if not 0 <= axis < len(axes):
+            raise ValueError(f"Invalid axis {axis} for a result with {len(axes)} dimensions")
+
+        component, _, _ = axes[axis]
+
+        local_axis = [axis_component for axis_component, _, _ in axes[:axis]].count(component)
+
+        shape = [size for _, _, size in axes]
+
+        measure_string = f'get_{self.scatterer.__class__.__name__.lower()}_{measure.short_label}'
+
+        for start in range(0, shape[axis], chunk_size):
+            stop = min(start + chunk_size, shape[axis])
+
+            binding = self.binding.get_slice(component=component, axis=local_axis, start=start, stop=stop)
+
+            index = tuple(slice(start, stop) if dimension == axis else slice(None) for dimension in range(len(shape)))
+
+            yield index, getattr(binding, measure_string)()
+
+    def evaluate_points(self, measure: Table, table: Union[numpy.ndarray, Dict[str, numpy.ndarray]]) -> numpy.ndarray:
+        """
+        Evaluates a measure at a list of points instead of a parameter grid, e.g. for Monte-Carlo sampling, optimisers
+        or inverse solvers. The distinct values of each parameter are bound once and the points are evaluated in parallel.
+
+        Parameters:
+            measure (Table): The measure to be computed by the simulation.
+            table (Union[numpy.ndarray, Dict[str, numpy.ndarray]]): Structured array, or mapping of arrays, holding one row
+                                    per point. Its fields are named '<component>_<parameter>' as the axes saved with
+                                    out_path, e.g. 'source_wavelength', 'source_jones_vector', 'sphere_diameter',
+                                    'sphere_index' or 'detector_NA'. Refractive indices are given in place of materials.
+                                    A parameter missing from the table takes its value in the setup, which must be unique.
+
+        Returns:
+            numpy.ndarray: The value of the measure at each point.
+
+        Raises:
+            ValueError: If a field is not a parameter of the setup, or a parameter with several values in the setup is
+                        missing from the table.
+        """
+        if measure.short_label not in self.scatterer.available_measure_list:
+            raise ValueError(f"Cannot compute {measure.short_label} for {self.scatterer.__class__.__name__.lower()}")
+
+        names = table.dtype.names if isinstance(table, numpy.ndarray) else list(table.keys())
+
+        columns = {name: numpy.asarray(table[name]) for name in names or []}
+
+        n_points = {len(column) for column in columns.values()}
+
+        if len(n_points) != 1:
+            raise ValueError("The table of points must hold at least one parameter, with the same number of rows for each")
+
+        n_points, = n_points
+
+        components = {'source': self.source, 'detector': self.detector}
+
+        axes = self._get_result_axes(measure)
+
+        # Materials are tabulated at the wavelengths of the setup, a point is given its refractive index instead.
+        keys = [f"{component}_{name.replace('material', 'index')}" for component, name, _ in axes]
+
+        for name in columns:
+            if name not in keys:
+                raise ValueError(f"Invalid parameter {name}, the parameters of the points are {keys}")
+
+        binding_kwargs = {component: dict(components.get(component, self.scatterer).binding_kwargs) for component, _, _ in axes}
+
+        indices = []
+        for key, (component, name, _) in zip(keys, axes):
+            values = binding_kwargs[component].pop(name)
+
+            if key in columns:
+                column = columns[key]
+                values, inverse = numpy.unique(column, axis=0 if column.ndim > 1 else None, return_inverse=True)
+                name = name.replace('material', 'index')
+
+            elif len(values) == 1 and not ('material' in name and 'source_wavelength' in columns):
+                inverse = numpy.zeros(n_points, dtype=int)
+
+            else:
+                raise ValueError(f"{key} has several values in the setup, its value at each point must be given in the table")
+
+            binding_kwargs[component][name] = values
+            indices.append(inverse.ravel())
+
+        scatterer_name = self.scatterer.__class__.__name__.lower()
+
+        binding = self.binding.copy()
+
+        binding.set_source(CppSourceSet(**binding_kwargs['source']))
+
+        getattr(binding, f'set_{scatterer_name}')(type(self.scatterer.binding)(**binding_kwargs[scatterer_name]))
+
+        if 'detector' in binding_kwargs:
+            binding.set_detector(CppDetectorSet(**binding_kwargs['detector']))
+
+        return getattr(binding, f'get_{scatterer_name}_points')(measure.short_label, numpy.stack(indices, axis=1).astype(numpy.uint64))
+
+    def get_adaptive(
+            self,
+            measure: Table,
+            parameter: str,
+            tolerance: float = 1e-3,
+            max_points: int = 5000,
+            max_depth: int = 16) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Sweeps a single parameter adaptively, e.g. a diameter or wavelength sweep across Mie resonances. The values of
+        the parameter in the setup form the coarse initial grid, whose intervals are recursively bisected wherever the
+        measure deviates from its linear interpolation by more than the tolerance. Each round of bisection is evaluated
+        in parallel through evaluate_points. Features narrower than the spacing of the initial grid may go unnoticed,
+        which should therefore resolve the spacing of the resonances.
+
+        Parameters:
+            measure (Table): The measure to be computed by the simulation.
+            parameter (str): The swept parameter, named as in evaluate_points, e.g. 'sphere_diameter' or 'source_wavelength'.
+                             The other parameters of the setup must have a single value.
+            tolerance (float): Interpolation error allowed at the midpoint of an interval, relative to the largest
+                               magnitude of the measure.
+            max_points (int): Maximum number of evaluated points, the intervals with the largest errors being refined first.
+            max_depth (int): Maximum number of bisections of an interval of the initial grid.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: The non-uniform values of the parameter, in increasing order, and the
+                                                 measure at each of them.
+        """
+        components = {'source': self.source, 'detector': self.detector}
+
+        values = {
+            f'{component}_{name}': components.get(component, self.scatterer).binding_kwargs[name]
+            for component, name, _ in self._get_result_axes(measure)
+        }
+
+        if parameter not in values:
+            raise ValueError(f"Invalid parameter {parameter}, the parameters of the setup are {list(values.keys())}")
+
+        x = numpy.unique(numpy.asarray(values[parameter]))
+
+        if x.size < 2 or x.ndim != 1 or numpy.iscomplexobj(x) or x.dtype.kind not in 'fiu':
+            raise ValueError(f"{parameter} must have at least two real values in the setup to be swept")
+
+        y = self.evaluate_points(measure, self._get_sweep_table(parameter, x))
+
+        # Intervals to bisect as (left, right, left value, right value, depth), along with the error of their parent.
+        candidates = [(x[i], x[i + 1], y[i], y[i + 1], 0) for i in range(x.size - 1)]
+        priorities = numpy.zeros(len(candidates))
+
+        while candidates and x.size < max_points:
+            order = numpy.argsort(-priorities, kind='stable')[:max_points - x.size]
+            candidates = [candidates[i] for i in order]
+
+            midpoints = numpy.asarray([(left + right) / 2 for left, right, *_ in candidates])
+
+            values = self.evaluate_points(measure, self._get_sweep_table(parameter, midpoints))
+
+            x, y = numpy.concatenate([x, midpoints]), numpy.concatenate([y, values])
+
+            scale = numpy.max(numpy.abs(y))
+
+            errors = [abs(value - (left_value + right_value) / 2) for value, (_, _, left_value, right_value, _) in zip(values, candidates)]
+
+            next_candidates, priorities = [], []
+            for midpoint, value, error, (left, right, left_value, right_value, depth) in zip(midpoints, values, errors, candidates):
+                if error > tolerance * scale and depth + 1 < max_depth:
+                    next_candidates += [(left, midpoint, left_value, value, depth + 1), (midpoint, right, value, right_value, depth + 1)]
+                    priorities += [error, error]
+
+            candidates, priorities = next_candidates, numpy.asarray(priorities)
+
+        order = numpy.argsort(x)
+
+        return x[order], y[order]
+
+    def get_weighted_average(
+            self,
+            measure: Table,
+            parameter: str,
+            weights: Union[numpy.ndarray, List[float]],
+            progress: Optional[Union[Callable[[int, int], None], object]] = None) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Computes the mean and variance of a measure over a distribution of one parameter, e.g. a log-normal distribution
+        of the diameters of a polydisperse sample. The engine accumulates the weighted moments of the measure while it
+        sweeps the parameter grid, so that the results along the distributed parameter are never stored.
+
+        Parameters:
+            measure (Table): The measure to be averaged, an efficiency, a cross-section, g or the coupling.
+            parameter (str): The distributed parameter, named as in evaluate_points, e.g. 'sphere_diameter'. Only the
+                             scatterer and detector parameters can be distributed.
+            weights (Union[numpy.ndarray, List[float]]): Weight of each value of the parameter in the setup, they are
+                                                        normalized to a unit sum.
+            progress (Optional[Union[Callable[[int, int], None], object]]): Progress hook, as in Setup.get.
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: The weighted mean and variance of the measure, whose dimension along the
+                                                 distributed parameter has a size of 1.
+        """
+        if measure.short_label not in self.scatterer.available_measure_list:
+            raise ValueError(f"Cannot compute {measure.short_label} for {self.scatterer.__class__.__name__.lower()}")
+
+        keys = [f'{component}_{name}' for component, name, _ in self._get_result_axes(measure)]
+
+        if parameter not in keys:
+            raise ValueError(f"Invalid parameter {parameter}, the parameters of the setup are {keys}")
+
+        axis = keys.index(parameter)
+
+        binding = self.binding.copy() if progress is None else self._get_progress_binding(progress)
+
+        binding.set_reduction(axis, numpy.asarray(weights, dtype=float).ravel())
+
+        array = getattr(binding, f'get_{self.scatterer.__class__.__name__.lower()}_{measure.short_label}')()
+
+        return numpy.take(array, [0], axis=axis), numpy.take(array, [1], axis=axis)
+
+    def _get_sweep_table(self, parameter: str, values: numpy.ndarray) -> Dict[str, numpy.ndarray]:
+        """
+        Table of points of a single parameter sweep for evaluate_points. The refractive index of the materials is
+        computed at each point of a wavelength sweep, the materials being tabulated at the wavelengths of the setup.
+
+        Parameters:
+            parameter (str): The swept parameter, named as in evaluate_points.
+            values (numpy.ndarray): The values of the parameter at each point.
+
+        Returns:
+            Dict[str, numpy.ndarray]: The table of points.
+        """
+        table = {parameter: values}
+
+        if parameter != 'source_wavelength':
+            return table
+
+        scatterer_name = self.scatterer.__class__.__name__.lower()
+
+        for name in self.scatterer.binding_kwargs:
+            if 'material' not in name:
+                continue
+
+            materials = numpy.atleast_1d(getattr(self.scatterer, name))
+
+            if materials.size != 1:
+                raise ValueError(f"The {name} of the scatterer must be unique to sweep the wavelength")
+
+            index = numpy.asarray(materials[0].get_refractive_index(values))
+
+            table[f"{scatterer_name}_{name.replace('material', 'index')}"] = index.real if name.startswith('medium') else index
+
+        return table
+
+    def _get_progress_binding(self, progress: Union[Callable[[int, int], None], object]) -> CppExperiment:
+        """
+        Returns a copy of the bindings reporting the progress of its computations.
+
+        Parameters:
+            progress (Union[Callable[[int, int], None], object]): Callable called as progress(completed, total), or a
+                                                                 tqdm-compatible progress bar.
+
+        Returns:
+            CppExperiment: The bindings calling progress during the computations.
+        """
+        if not callable(progress):
+            progress_bar = progress
+
+            def progress(completed: int, total: int) -> NoReturn:
+                progress_bar.total = total
+                progress_bar.update(completed - progress_bar.n)
+
+        binding = self.binding.copy()
+
+        binding.set_progress(progress)
+
+        return binding
+
+    def _get_result_axes(self, measure: Table) -> List[Tuple[str, str, int]]:
+        """
+        Describes the dimensions of the result of a measure: source, scatterer, then detector parameters for the coupling.
+
+        Parameters:
+            measure (Table): The measure to be computed by the simulation.
+
+        Returns:
+            List[Tuple[str, str, int]]: The component, parameter name and size of each dimension.
+        """
+        scatterer_name = self.scatterer.__class__.__name__.lower()
+
+        components = [
+            ('source', source_axes, self.source.binding.shape),
+            (scatterer_name, list(self.scatterer.binding_kwargs.keys()), self.scatterer.binding.shape)
+        ]
+
+        if measure.short_label == 'coupling':
+            components.append(('detector', detector_axes, self.detector.binding.shape))
+
+        return [
+            (component, name, size) for component, names, shape in components for name, size in zip(names, shape)
+        ]
+
+    def _save_result_axes(self, measure: Table, out_path: Union[str, pathlib.Path]) -> NoReturn:
+        """
+        Saves the values of the parameters along each dimension of a result written in out_path, in a sidecar
+        .axes.npz file whose 'axes' entry lists the '<component>_<parameter>' keys in the order of the dimensions.
+
+        Parameters:
+            measure (Table): The measure written in out_path.
+            out_path (Union[str, pathlib.Path]): Path of the .npy file of the result.
+        """
+        components = {'source': self.source, 'detector': self.detector}
+
+        values = {}
+        for component, name, _ in self._get_result_axes(measure):
+            binding_kwargs = components.get(component, self.scatterer).binding_kwargs
+            values[f'{component}_{name}'] = numpy.asarray(binding_kwargs[name])
+
+        numpy.savez(
+            pathlib.Path(out_path).with_suffix('.axes.npz'),
+            axes=numpy.asarray(list(values.keys())),
+            **values
+        )
+
     def _export_as_numpy(self, array: numpy.array) -> numpy.array:
         for k, v in self.source.binding_kwargs.items():
             setattr(self.source, k, v)
@@ -113,6 +671,9 @@ class Setup(object):
         return array
 
     def _export_as_data_visual(self, measure: Table, array: numpy.array) -> Array:
+        if self.scatterer.zip_axes is not None:
+            raise ValueError("Results of a scatterer with zipped parameters can only be exported as numpy arrays, use export_as_numpy=True")
+
         self._generate_datavisual_table()
         measure.set_base_values(array)
 
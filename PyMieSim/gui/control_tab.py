@@ -1,7 +1,7 @@
 #!/usr/bin/env python
 # -*- coding: utf-8 -*-
 
-from tkinter.ttk import Frame
+from tkinter.ttk import Frame, Progressbar
 from tkinter import messagebox, filedialog
 import tkinter
 import numpy
@@ -22,6 +22,7 @@ class ControlTab:
         -save_button: used to save the data from the graph as a csv fils
         -export_button: used to export the graph
         -reset_std_button: used to undo the std axis selection on the gui
+        -progress_bar: shows the progress of the computation
 
     Other attributes:
     -frame (ttk.Frame)
@@ -65,6 +66,17 @@ class ControlTab:
         for widget in self.widget_collection.widgets:
             setattr(self, widget.component_label, widget)
 
+        self.progress_bar = Progressbar(self.frame, mode='determinate')
+        self.progress_bar.grid(row=1, column=0, columnspan=len(self.button_config), sticky='ew')
+
+    def update_progress(self, completed: int, total: int) -> NoReturn:
+        """
+        Progress hook of the experiment, updates the progress bar with the number of grid points computed.
+        """
+        self.progress_bar['maximum'] = total
+        self.progress_bar['value'] = completed
+        self.frame.update_idletasks()
+
     def save_data_as_csv(self) -> NoReturn:
         """
         Triggered by the "Save as CSV" button. Opens a file dialog to save the computed data as a CSV file.
@@ -162,7 +174,7 @@ class ControlTab:
 
         self.setup_experiment()
 
-        datashelf.data = self.experiment.get(y_axis)
+        datashelf.data = self.experiment.get(y_axis, progress=self.update_progress)
 
         self.x_axis_component = self.axis_mapping[self.x_axis]
 
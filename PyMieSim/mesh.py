@@ -28,6 +28,7 @@ class FibonacciMesh:
     phi_offset: float  # Angle offset in the parallel direction of incident light polarization in degrees.
     gamma_offset: float  # Angle offset in the perpendicular direction of incident light polarization in degrees.
     rotation_angle: Optional[float] = 0.  # Rotation of the mesh around its principal axis in degrees.
+    quadrature: Optional[str] = 'fibonacci'  # Either 'fibonacci' or 'gauss' for a product Gauss-Legendre mesh.
 
     def __post_init__(self):
         self.structured = False
@@ -56,7 +57,8 @@ class FibonacciMesh:
             max_angle=self.max_angle,
             phi_offset=numpy.deg2rad(self.phi_offset),
             gamma_offset=numpy.deg2rad(self.gamma_offset),
-            rotation_angle=self.rotation_angle
+            rotation_angle=self.rotation_angle,
+            quadrature=self.quadrature
         )
 
         self.initialize_properties()
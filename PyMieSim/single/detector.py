@@ -154,7 +154,7 @@ class GenericDetector():
 
         poynting = self.get_poynting_vector(scatterer=scatterer)
 
-        total_power = 0.5 * numpy.sum(poynting) * self.binding.mesh.d_omega
+        total_power = 0.5 * numpy.sum(poynting * self.binding.mesh.weights)
 
         return total_power
 
@@ -169,11 +169,14 @@ class Photodiode(GenericDetector):
         NA (float): Numerical aperture of the imaging system.
         gamma_offset (float): Angle [Degree] offset of the detector in the direction perpendicular to polarization.
         phi_offset (float): Angle [Degree] offset of the detector in the direction parallel to polarization.
-        sampling (int): Sampling rate of the far-field distribution. Default is 200.
+        sampling (int): Sampling rate of the far-field distribution, unused by the coupling of a detector with no phi and
+            gamma offset which is integrated exactly over the polar angle. Default is 200.
         polarization_filter (Union[float, None]): Angle [Degree] of the polarization filter in front of the detector.
         coherent (bool): Indicates if the coupling mechanism is coherent. Default is False.
         mean_coupling (bool): Indicates if the coupling mechanism is point-wise or mean-wise. Default is False.
         rotation (float): Rotation angle of the field along the axis of propagation. Default is 0.
+        quadrature (str): Mesh over which the coupling is integrated, either 'fibonacci' or 'gauss' for a product
+            Gauss-Legendre mesh which needs far fewer points for the same accuracy. Default is 'fibonacci'.
     """
 
     NA: float
@@ -181,6 +184,7 @@ class Photodiode(GenericDetector):
     phi_offset: float
     sampling: int = 200
     polarization_filter: Union[float, None] = None
+    quadrature: str = 'fibonacci'
     coherent: bool = field(default=False, init=False)
     mean_coupling: bool = field(default=False, init=False)
     rotation: float = field(default=0, init=False)
@@ -197,7 +201,8 @@ class Photodiode(GenericDetector):
             polarization_filter=numpy.deg2rad(self.polarization_filter),
             rotation=numpy.deg2rad(self.rotation),
             coherent=self.coherent,
-            mean_coupling=self.mean_coupling
+            mean_coupling=self.mean_coupling,
+            quadrature=self.quadrature
         )
 
     def get_structured_scalarfield(self, sampling: Optional[int] = 100) -> numpy.ndarray:
@@ -228,6 +233,7 @@ class IntegratingSphere(Photodiode):
         coherent (bool): Indicates if the coupling mechanism is coherent. Default is False.
         mean_coupling (bool): Indicates if the coupling mechanism is point-wise or mean-wise. Default is False.
         rotation (float): Rotation angle of the field along the axis of propagation. Default is 0.
+        quadrature (str): Mesh over which the coupling is integrated, either 'fibonacci' or 'gauss'. Default is 'fibonacci'.
     """
 
     sampling: int = 200
@@ -271,6 +277,8 @@ class CoherentMode(GenericDetector):
         mean_coupling (bool): Indicates if the coupling mechanism is point-wise (True) or mean-wise (False). Default is False.
         coherent (bool): Indicates if the coupling mechanism is coherent. Default is True.
         rotation (float): Rotation angle of the field along the axis of propagation. Default is 90.
+        quadrature (str): Mesh over which the coupling is integrated, either 'fibonacci' or 'gauss' for a product
+            Gauss-Legendre mesh which needs far fewer points for the same accuracy. Default is 'fibonacci'.
     """
 
     mode_number: str
@@ -280,6 +288,7 @@ class CoherentMode(GenericDetector):
     sampling: int = 200
     polarization_filter: Union[float, None] = None
     mean_coupling: bool = False
+    quadrature: str = 'fibonacci'
     coherent: bool = field(default=True, init=False)
     rotation: float = 90
 
@@ -319,7 +328,8 @@ class CoherentMode(GenericDetector):
             polarization_filter=numpy.deg2rad(self.polarization_filter),
             rotation=numpy.deg2rad(self.rotation),
             coherent=self.coherent,
-            mean_coupling=self.mean_coupling
+            mean_coupling=self.mean_coupling,
+            quadrature=self.quadrature
         )
 
     def get_structured_scalarfield(self, sampling: Optional[int] = 100) -> numpy.ndarray:
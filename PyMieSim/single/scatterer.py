@@ -26,7 +26,7 @@ class GenericScatterer():
 
     def print_properties(self) -> None:
         property_names = [
-            "size_parameter", "area", "index", "g",
+            "size_parameter", "area", "index", "max_order", "g",
             "Qsca", "Qext", "Qabs", "Qback", "Qratio", "Qpr",
             "Csca", "Cext", "Cabs", "Cback", "Cratio", "Cpr"
         ]
@@ -46,6 +46,11 @@ class GenericScatterer():
     def area(self) -> float:
         return self.binding.area
 
+    @property
+    def max_order(self) -> int:
+        """ Number of orders of the Mie series, after the truncation at series_tolerance. """
+        return self.binding.max_order
+
     @property
     def Qsca(self) -> float:
         """ Scattering efficiency. """
@@ -278,6 +283,7 @@ class Sphere(GenericScatterer):
         index (Optional[Any]): Refractive index of scatterer. Default is None.
         medium_index (float): Refractive index of scatterer medium. Default is 1.0.
         material (Union[DataMeasurement, Sellmeier, None]): Material of which the scatterer is made, if index is not specified. Default is None.
+        series_tolerance (float): Relative magnitude below which the trailing orders of the Mie coefficients are dropped, 0 keeps every order. Default is 0.
     """
     diameter: float
     source: Union[source.PlaneWave, source.Gaussian]
@@ -285,6 +291,7 @@ class Sphere(GenericScatterer):
     medium_index: Optional[float] = None
     medium_material: Optional[Union[Sellmeier, DataMeasurement]] = None
     material: Optional[Union[Sellmeier, DataMeasurement]] = None
+    series_tolerance: float = 0
 
     def __post_init__(self):
         self.index, self.material = self._assign_index_or_material(self.index, self.material)
@@ -302,7 +309,8 @@ class Sphere(GenericScatterer):
             diameter=self.diameter,
             index=self.index,
             medium_index=self.medium_index,
-            source=self.source.binding
+            source=self.source.binding,
+            tolerance=self.series_tolerance
         )
 
     def an(self, max_order: Optional[int] = 0) -> numpy.ndarray:
@@ -412,6 +420,7 @@ class CoreShell(GenericScatterer):
         core_material (Union[DataMeasurement, Sellmeier, None]): Core material of which the scatterer is made of, if core_index is not specified. Default is None.
         shell_material (Union[DataMeasurement, Sellmeier, None]): Shell material of which the scatterer is made of, if shell_index is not specified. Default is None.
         medium_index (float): Refractive index of the scatterer medium. Default is 1.0.
+        series_tolerance (float): Relative magnitude below which the trailing orders of the Mie coefficients are dropped, 0 keeps every order. Default is 0.
     """
 
     core_diameter: float
@@ -423,6 +432,7 @@ class CoreShell(GenericScatterer):
     shell_material: Optional[Union[Sellmeier, DataMeasurement]] = None
     medium_index: Optional[float] = None
     medium_material: Optional[Union[Sellmeier, DataMeasurement]] = None
+    series_tolerance: float = 0
 
     def __post_init__(self):
         self.core_index, self.core_material = self._assign_index_or_material(self.core_index, self.core_material)
@@ -443,7 +453,8 @@ class CoreShell(GenericScatterer):
             shell_width=self.shell_width,
             core_diameter=self.core_diameter,
             medium_index=self.medium_index,
-            source=self.source.binding
+            source=self.source.binding,
+            tolerance=self.series_tolerance
         )
 
     def an(self, max_order: Optional[int] = 0) -> numpy.ndarray:
@@ -486,6 +497,7 @@ class Cylinder(GenericScatterer):
         index (Optional[Any]): Refractive index of scatterer. Default is None.
         medium_index (float): Refractive index of scatterer medium. Default is 1.0.
         material (Union[DataMeasurement, Sellmeier, None]): Material of which the scatterer is made, if index is not specified. Default is None.
+        series_tolerance (float): Relative magnitude below which the trailing orders of the Mie coefficients are dropped, 0 keeps every order. Default is 0.
     """
 
     diameter: float
@@ -494,6 +506,7 @@ class Cylinder(GenericScatterer):
     medium_index: Optional[float] = None
     medium_material: Optional[Union[Sellmeier, DataMeasurement]] = None
     material: Union[DataMeasurement, Sellmeier, None] = None
+    series_tolerance: float = 0
 
     def __post_init__(self):
         self.index, self.material = self._assign_index_or_material(index=self.index, material=self.material)
@@ -510,7 +523,8 @@ class Cylinder(GenericScatterer):
             index=self.index,
             diameter=self.diameter,
             medium_index=self.medium_index,
-            source=self.source.binding
+            source=self.source.binding,
+            tolerance=self.series_tolerance
         )
 
     def a1n(self, max_order: Optional[int] = 0) -> numpy.array:
@@ -0,0 +1,59 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from PyMieSim.experiment.detector import Photodiode
+from PyMieSim.experiment.scatterer import Sphere
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+
+
+def get_setup(diameter) -> Setup:
+    source = Gaussian(wavelength=1e-6, polarization=0, optical_power=1e-3, NA=0.2)
+
+    scatterer = Sphere(diameter=diameter, index=1.5, medium_index=1.0, source=source)
+
+    detector = Photodiode(NA=0.2, polarization_filter=None, gamma_offset=0, phi_offset=0, sampling=100)
+
+    return Setup(scatterer=scatterer, source=source, detector=detector)
+
+
+@pytest.mark.parametrize('measure', [pms_measure.Qsca, pms_measure.coupling], ids=['Qsca', 'coupling'])
+def test_adaptive_sweep(measure):
+    experiment = get_setup(diameter=np.linspace(100e-9, 3000e-9, 100))
+
+    tolerance = 1e-3
+
+    diameter, array = experiment.get_adaptive(measure, 'sphere_diameter', tolerance=tolerance)
+
+    if not np.all(np.diff(diameter) > 0) or not np.all(np.isin(experiment.scatterer.diameter, diameter)):
+        raise ValueError('The adaptive sweep must refine the initial grid in increasing order.')
+
+    if not np.array_equal(array, experiment.evaluate_points(measure, {'sphere_diameter': diameter})):
+        raise ValueError('Mismatch of the adaptive sweep with the measure at its points.')
+
+    dense_diameter = np.linspace(100e-9, 3000e-9, 20000)
+
+    reference = experiment.evaluate_points(measure, {'sphere_diameter': dense_diameter})
+
+    error = np.max(np.abs(np.interp(dense_diameter, diameter, array) - reference)) / np.max(np.abs(reference))
+
+    if error > 2 * tolerance or diameter.size > dense_diameter.size / 10:
+        raise ValueError(f'Adaptive sweep of {diameter.size} points with a relative interpolation error of {error}.')
+
+
+def test_invalid_adaptive_sweep():
+    experiment = get_setup(diameter=np.linspace(100e-9, 3000e-9, 10))
+
+    with pytest.raises(ValueError):
+        experiment.get_adaptive(pms_measure.Qsca, 'source_wavelength')
+
+    with pytest.raises(ValueError):
+        experiment.get_adaptive(pms_measure.Qsca, 'sphere_radius')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from PyMieSim.experiment.detector import Photodiode, CoherentMode, auto_sampling_start
+from PyMieSim.experiment.scatterer import Sphere
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup, setup
+from PyMieSim import detector_cache
+import PyMieSim.experiment.measure as pms_measure
+
+source = Gaussian(wavelength=1e-6, polarization=[0, 90], optical_power=1e-3, NA=0.2)
+
+scatterer = Sphere(source=source, diameter=np.linspace(100e-9, 3000e-9, 10), index=[1.4, 1.5], medium_index=1.0)
+
+detector_cases = [
+    (Photodiode, dict(NA=[0.2, 0.6], polarization_filter=None, gamma_offset=10, phi_offset=30)),
+    (CoherentMode, dict(mode_number=['LP01', 'LP11'], NA=[0.1, 0.3], rotation=0, polarization_filter=None, gamma_offset=10, phi_offset=30)),
+]
+
+
+@pytest.mark.parametrize('detector_class, parameters', detector_cases, ids=['Photodiode', 'CoherentMode'])
+def test_auto_sampling(detector_class, parameters):
+    tolerance = 1e-3
+
+    detector = detector_class(**parameters, sampling='auto', tolerance=tolerance)
+
+    experiment = Setup(scatterer=scatterer, source=source, detector=detector)
+
+    if detector.sampling[0] <= auto_sampling_start:
+        raise ValueError('The off-axis Fibonacci mesh must be refined past the initial sampling.')
+
+    coupling = experiment.get(pms_measure.coupling, export_as_numpy=True)
+
+    reference_detector = detector_class(**parameters, sampling=3000, quadrature='gauss')
+
+    reference = Setup(scatterer=scatterer, source=source, detector=reference_detector).get(pms_measure.coupling, export_as_numpy=True)
+
+    # The tolerance bounds the change of the coupling with the next mesh, not its exact error.
+    if not np.allclose(coupling, reference, rtol=0, atol=2 * tolerance * np.max(reference)):
+        raise ValueError('The coupling with sampling="auto" does not reach the tolerance.')
+
+    detector = detector_class(**parameters, sampling='auto', tolerance=tolerance, quadrature='gauss')
+
+    Setup(scatterer=scatterer, source=source, detector=detector)
+
+    if detector.sampling[0] != auto_sampling_start:
+        raise ValueError('The Gauss quadrature must converge with the initial sampling.')
+
+
+def test_on_axis_auto_sampling():
+    detector = Photodiode(NA=[0.2, 0.6], polarization_filter=[None, 30], gamma_offset=0, phi_offset=0, sampling='auto', tolerance=1e-6)
+
+    Setup(scatterer=scatterer, source=source, detector=detector)
+
+    # The on-axis coupling of a photodiode does not depend on the mesh.
+    if detector.sampling[0] != auto_sampling_start:
+        raise ValueError('The on-axis photodiode must keep the initial sampling.')
+
+
+def test_auto_sampling_cache(monkeypatch):
+    monkeypatch.setattr(setup, 'auto_sampling_cache_size', 2)
+
+    for gamma_offset in [0, 10, 20]:
+        detector = Photodiode(NA=0.2, polarization_filter=None, gamma_offset=gamma_offset, phi_offset=30, sampling='auto', tolerance=1e-3)
+
+        Setup(scatterer=scatterer, source=source, detector=detector)
+
+    if len(setup._auto_sampling_cache) != 2:
+        raise ValueError('The samplings chosen by sampling="auto" must be bounded by the cache size.')
+
+    detector_cache.clear()
+
+    if len(setup._auto_sampling_cache) != 0:
+        raise ValueError('Clearing the detector caches must clear the samplings chosen by sampling="auto".')
+
+
+def test_invalid_auto_sampling():
+    with pytest.raises(ValueError):
+        Photodiode(NA=0.2, polarization_filter=None, gamma_offset=0, phi_offset=0, sampling='fine')
+
+    with pytest.raises(ValueError):
+        Photodiode(NA=0.2, polarization_filter=None, gamma_offset=0, phi_offset=0, sampling='auto', tolerance=0)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from PyMieSim.experiment.detector import Photodiode
+from PyMieSim.experiment.scatterer import Sphere, Cylinder, CoreShell
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+
+
+def get_source():
+    return Gaussian(
+        wavelength=np.linspace(400e-9, 1800e-9, 3),
+        polarization=[0, 45, 90],
+        optical_power=[1e-3, 2e-3],
+        NA=[0.1, 0.2]
+    )
+
+
+@pytest.mark.parametrize('measure', [pms_measure.Qsca, pms_measure.Csca, pms_measure.a1, pms_measure.g, pms_measure.Qpr, pms_measure.Cpr], ids=['Qsca', 'Csca', 'a1', 'g', 'Qpr', 'Cpr'])
+@pytest.mark.parametrize('scatterer_class, parameters', [
+    (Sphere, dict(diameter=np.linspace(400e-9, 1400e-9, 10), index=1.4, medium_index=1.0)),
+    (CoreShell, dict(core_diameter=np.linspace(400e-9, 1400e-9, 10), shell_width=100e-9, core_index=1.5, shell_index=1.4, medium_index=1.0)),
+], ids=['Sphere', 'CoreShell'])
+def test_spherical_broadcast_over_source(scatterer_class, parameters, measure):
+    source = get_source()
+
+    scatterer = scatterer_class(source=source, **parameters)
+
+    experiment = Setup(scatterer=scatterer, source=source)
+
+    array = experiment.get(measure, export_as_numpy=True)
+
+    reference = np.broadcast_to(array[:, :1, :1, :1], array.shape)
+
+    if not np.array_equal(array, reference):
+        raise ValueError(f'{scatterer_class.__name__} {measure.short_label} should not depend on the polarization, NA or optical power of the source.')
+
+
+def test_cylinder_depends_on_polarization():
+    source = get_source()
+
+    scatterer = Cylinder(diameter=np.linspace(400e-9, 1400e-9, 10), index=1.4, medium_index=1.0, source=source)
+
+    experiment = Setup(scatterer=scatterer, source=source)
+
+    array = experiment.get(pms_measure.Qsca, export_as_numpy=True)
+
+    if np.allclose(array[:, 0], array[:, 2]):
+        raise ValueError('Cylinder Qsca should depend on the polarization of the source.')
+
+    if not np.array_equal(array, np.broadcast_to(array[:, :, :1, :1], array.shape)):
+        raise ValueError('Cylinder Qsca should not depend on the NA or optical power of the source.')
+
+
+def test_coupling_scales_with_optical_power():
+    source = get_source()
+
+    scatterer = Sphere(diameter=np.linspace(400e-9, 1400e-9, 10), index=1.4, medium_index=1.0, source=source)
+
+    detector = Photodiode(NA=0.2, polarization_filter=None, gamma_offset=0, phi_offset=0, sampling=100)
+
+    experiment = Setup(scatterer=scatterer, source=source, detector=detector)
+
+    array = experiment.get(pms_measure.coupling, export_as_numpy=True)
+
+    if not np.allclose(array[:, :, :, 1], 2 * array[:, :, :, 0], atol=0, rtol=1e-12):
+        raise ValueError('Coupling should scale linearly with the optical power of the source.')
+
+
+@pytest.mark.parametrize('source_kwargs', [dict(optical_power=[0, 1e-3], NA=0.2), dict(optical_power=1e-3, NA=[0, 0.2])], ids=['optical_power', 'NA'])
+def test_coupling_sweep_from_zero(source_kwargs):
+    scatterer_kwargs = dict(diameter=np.linspace(400e-9, 1400e-9, 10), index=1.4, medium_index=1.0)
+
+    detector = Photodiode(NA=0.2, polarization_filter=None, gamma_offset=0, phi_offset=0, sampling=100)
+
+    source = Gaussian(wavelength=[500e-9, 1000e-9], polarization=[0, 90], **source_kwargs)
+
+    experiment = Setup(scatterer=Sphere(source=source, **scatterer_kwargs), source=source, detector=detector)
+
+    reference_source = Gaussian(wavelength=[500e-9, 1000e-9], polarization=[0, 90], optical_power=1e-3, NA=0.2)
+
+    reference = Setup(scatterer=Sphere(source=reference_source, **scatterer_kwargs), source=reference_source, detector=detector).get(pms_measure.coupling, export_as_numpy=True)
+
+    for array in [experiment.get(pms_measure.coupling, export_as_numpy=True), experiment.get_many([pms_measure.coupling, pms_measure.Qsca], export_as_numpy=True)['coupling']]:
+        array = array.reshape(2, 2, 2, *reference.shape[3:])
+
+        if not np.array_equal(array[:, :, 0], np.zeros_like(reference[:, :, 0])):
+            raise ValueError('The coupling of a source of zero amplitude must vanish.')
+
+        if not np.allclose(array[:, :, 1], reference[:, :, 0], atol=0, rtol=1e-12):
+            raise ValueError('Mismatch of the coupling over a source sweep starting at zero amplitude.')
+
+
+if __name__ == "__main__":
+    pytest.main()
+
+# -
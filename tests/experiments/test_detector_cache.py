@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from PyMieSim.experiment.detector import Photodiode, CoherentMode
+from PyMieSim.experiment.scatterer import Sphere
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+from PyMieSim import detector_cache
+from PyMieSim.binary.Fibonacci import FibonacciMesh  # noqa: F401, registers the type of the detector meshes
+from PyMieSim.binary.DetectorInterface import BindedDetector
+
+detector_cases = [
+    (Photodiode, dict(NA=[0.1, 0.3], polarization_filter=[None, 0], gamma_offset=[0, 10], phi_offset=0, sampling=[100, 200])),
+    (CoherentMode, dict(mode_number=['LP01', 'HG11'], NA=[0.1, 0.3], rotation=[0, 30], polarization_filter=None, gamma_offset=0, phi_offset=[0, 20], sampling=200)),
+]
+
+
+def get_coupling(detector_class, parameters: dict) -> np.ndarray:
+    source = Gaussian(wavelength=[500e-9, 1000e-9], polarization=[0, 90], optical_power=1e-3, NA=0.2)
+
+    scatterer = Sphere(source=source, diameter=np.linspace(100e-9, 2000e-9, 5), index=1.5, medium_index=1.0)
+
+    detector = detector_class(**parameters)
+
+    return Setup(scatterer=scatterer, source=source, detector=detector).get(pms_measure.coupling, export_as_numpy=True)
+
+
+@pytest.mark.parametrize('detector_class, parameters', detector_cases, ids=['Photodiode', 'CoherentMode'])
+def test_detector_cache(detector_class, parameters):
+    budget = detector_cache.get_budget()
+
+    try:
+        detector_cache.clear()
+
+        reference = get_coupling(detector_class, parameters)
+
+        if detector_cache.get_size() == 0:
+            raise ValueError('The meshes and mode fields of the detectors must be cached.')
+
+        cached = get_coupling(detector_class, parameters)
+
+        if not np.array_equal(reference, cached):
+            raise ValueError('Mismatch of the coupling computed from the cached detectors.')
+
+        detector_cache.set_budget(0)
+
+        if detector_cache.get_size() != 0:
+            raise ValueError('A budget of 0 must evict every entry of the cache.')
+
+        uncached = get_coupling(detector_class, parameters)
+
+        if not np.array_equal(reference, uncached) or detector_cache.get_size() != 0:
+            raise ValueError('Mismatch of the coupling computed with the cache disabled.')
+
+    finally:
+        detector_cache.set_budget(budget)
+
+
+def test_cached_mesh_is_not_mutable():
+    detector_kwargs = dict(mode_number='NC00', sampling=200, NA=0.3, phi_offset=0, gamma_offset=0, polarization_filter=np.nan, rotation=0, coherent=False, mean_coupling=False)
+
+    detector = BindedDetector(**detector_kwargs)
+
+    reference = detector.mesh
+
+    mesh = detector.mesh
+    mesh.d_omega *= 10
+    mesh.rotate_around_axis(1.0)
+
+    for other in [detector, BindedDetector(**detector_kwargs)]:
+        if other.mesh.d_omega != reference.d_omega or not np.array_equal(other.mesh.x, reference.x):
+            raise ValueError('Modifying the mesh of a detector must not modify the cached mesh.')
+
+
+def test_invalid_cache_budget():
+    with pytest.raises(ValueError):
+        detector_cache.set_budget(-1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
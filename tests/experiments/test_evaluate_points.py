@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from PyMieSim.experiment.detector import Photodiode
+from PyMieSim.experiment.scatterer import Sphere, Cylinder, CoreShell
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+
+diameter = np.linspace(300e-9, 1500e-9, 3)
+index = np.linspace(1.3, 1.7, 3) + 0.01j
+medium_index = [1.0, 1.33]
+
+scatterer_cases = [
+    (Sphere, dict(diameter=diameter, index=index, medium_index=medium_index), ['Qsca', 'a1', 'coupling']),
+    (Cylinder, dict(diameter=diameter, index=index, medium_index=medium_index), ['Qsca', 'a11', 'coupling']),
+    (CoreShell, dict(core_diameter=diameter, shell_width=diameter / 5, core_index=index, shell_index=index + 0.1, medium_index=medium_index), ['Qext', 'b1', 'coupling']),
+]
+
+
+def get_setup(scatterer_class, parameters: dict) -> Setup:
+    source = Gaussian(wavelength=[500e-9, 800e-9], polarization=[0, 90], optical_power=[1e-3, 2e-3], NA=0.2)
+
+    scatterer = scatterer_class(source=source, **parameters)
+
+    detector = Photodiode(NA=[0.1, 0.3], polarization_filter=[None, 30], gamma_offset=0, phi_offset=0, sampling=[100, 200])
+
+    return Setup(scatterer=scatterer, source=source, detector=detector)
+
+
+@pytest.mark.parametrize('scatterer_class, parameters, measures', scatterer_cases, ids=['Sphere', 'Cylinder', 'CoreShell'])
+def test_evaluate_points(scatterer_class, parameters, measures):
+    experiment = get_setup(scatterer_class, parameters)
+
+    components = {'source': experiment.source, 'detector': experiment.detector}
+
+    generator = np.random.default_rng(0)
+
+    for label in measures:
+        measure = getattr(pms_measure, label)
+
+        axes = experiment._get_result_axes(measure)
+
+        grid_index = tuple(generator.integers(0, size, 20) for _, _, size in axes)
+
+        table = {}
+        for (component, name, _), index in zip(axes, grid_index):
+            values = np.asarray(components.get(component, experiment.scatterer).binding_kwargs[name])
+            table[f'{component}_{name}'] = values[index]
+
+        array = experiment.evaluate_points(measure, table)
+
+        if not np.allclose(array, experiment.get(measure, export_as_numpy=True)[grid_index], rtol=1e-10, atol=0):
+            raise ValueError(f'Mismatch of {label} at the points with the parameter grid.')
+
+
+def test_structured_table():
+    source = Gaussian(wavelength=500e-9, polarization=0, optical_power=1e-3, NA=0.2)
+
+    experiment = Setup(scatterer=Sphere(source=source, diameter=diameter[0], index=index[0], medium_index=1.0), source=source)
+
+    table = np.zeros(3, dtype=[('source_wavelength', float), ('source_jones_vector', complex, (2,)), ('sphere_diameter', float)])
+    table['source_wavelength'] = [500e-9, 650e-9, 800e-9]
+    table['source_jones_vector'] = [[1, 0], [0, 1], [1, 0]]
+    table['sphere_diameter'] = [400e-9, 900e-9, 1200e-9]
+
+    array = experiment.evaluate_points(pms_measure.Qsca, table)
+
+    for point, row in enumerate(table):
+        source = Gaussian(wavelength=row['source_wavelength'], polarization=0, optical_power=1e-3, NA=0.2)
+
+        scatterer = Sphere(source=source, diameter=row['sphere_diameter'], index=index[0], medium_index=1.0)
+
+        reference = Setup(scatterer=scatterer, source=source).get(pms_measure.Qsca, export_as_numpy=True).squeeze()
+
+        if not np.isclose(array[point], reference, rtol=1e-12, atol=0):
+            raise ValueError('Mismatch of the points given as a structured array.')
+
+
+def test_invalid_table():
+    experiment = get_setup(*scatterer_cases[0][:2])
+
+    with pytest.raises(ValueError):
+        experiment.evaluate_points(pms_measure.Qsca, {'sphere_diameter': [1e-6]})
+
+    with pytest.raises(ValueError):
+        experiment.evaluate_points(pms_measure.Qsca, {'sphere_radius': [1e-6]})
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import asyncio
+import numpy as np
+
+from PyMieSim.experiment.detector import Photodiode
+from PyMieSim.experiment.scatterer import Sphere
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+
+
+def get_setup(n_diameter: int) -> Setup:
+    source = Gaussian(wavelength=np.linspace(400e-9, 1800e-9, 10), polarization=[0, 90], optical_power=1e-3, NA=0.2)
+
+    scatterer = Sphere(diameter=np.linspace(400e-9, 8000e-9, n_diameter), index=1.4, medium_index=1.0, source=source)
+
+    detector = Photodiode(NA=0.2, polarization_filter=None, gamma_offset=0, phi_offset=0, sampling=300)
+
+    return Setup(scatterer=scatterer, source=source, detector=detector)
+
+
+@pytest.mark.parametrize('measure', [pms_measure.Qsca, pms_measure.coupling], ids=['Qsca', 'coupling'])
+def test_get_async(measure):
+    experiment = get_setup(n_diameter=10)
+
+    array = asyncio.run(experiment.get_async(measure, export_as_numpy=True))
+
+    if not np.array_equal(array, experiment.get(measure, export_as_numpy=True)):
+        raise ValueError(f'Mismatch between get_async and get for measure: {measure.short_label}')
+
+
+@pytest.mark.parametrize('cancel_with', ['task', 'setup'])
+def test_get_async_cancel(cancel_with):
+    experiment = get_setup(n_diameter=2000)
+
+    async def run():
+        task = asyncio.create_task(experiment.get_async(pms_measure.coupling, export_as_numpy=True))
+
+        await asyncio.sleep(0.1)
+
+        if cancel_with == 'task':
+            task.cancel()
+        else:
+            experiment.cancel()
+
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(run())
+
+    if experiment.binding.is_cancelled():
+        raise ValueError('Cancelling an asynchronous computation should not cancel the experiment itself.')
+
+
+if __name__ == "__main__":
+    pytest.main()
+
+# -
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from PyMieSim.experiment.detector import Photodiode
+from PyMieSim.experiment.scatterer import Sphere, Cylinder, CoreShell
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+
+scatterer_options = [
+    {'name': 'Sphere', 'class': Sphere, 'properties': {'diameter': np.linspace(400e-9, 1400e-9, 10), 'index': 1.4, 'medium_index': 1.0}},
+    {'name': 'Cylinder', 'class': Cylinder, 'properties': {'diameter': np.linspace(400e-9, 1400e-9, 10), 'index': 1.4, 'medium_index': 1.0}},
+    {'name': 'CoreShell', 'class': CoreShell, 'properties': {'core_diameter': np.linspace(400e-9, 1400e-9, 10), 'shell_width': 300e-9, 'core_index': 1.4, 'shell_index': 1.6, 'medium_index': 1.0}},
+]
+
+
+@pytest.mark.parametrize('scatterer_config', scatterer_options, ids=[s['name'] for s in scatterer_options])
+def test_get_many_matches_get(scatterer_config):
+    source = Gaussian(
+        wavelength=np.linspace(400e-9, 1800e-9, 5),
+        polarization=[0, 45],
+        optical_power=1e-3,
+        NA=0.2
+    )
+
+    scatterer = scatterer_config['class'](source=source, **scatterer_config['properties'])
+
+    detector = Photodiode(
+        NA=0.2,
+        polarization_filter=None,
+        gamma_offset=0,
+        phi_offset=0,
+        sampling=100
+    )
+
+    experiment = Setup(scatterer=scatterer, source=source, detector=detector)
+
+    measures = [pms_measure.Qsca, pms_measure.Qext, pms_measure.Qabs, pms_measure.coupling]
+
+    arrays = experiment.get_many(measures, export_as_numpy=True)
+
+    for measure in measures:
+        reference = experiment.get(measure, export_as_numpy=True)
+
+        if not np.allclose(arrays[measure.short_label], reference, atol=0, rtol=1e-10):
+            raise ValueError(f'Mismatch between get_many and get for measure: {measure.short_label}')
+
+
+if __name__ == "__main__":
+    pytest.main()
+
+# -
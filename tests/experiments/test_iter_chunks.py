@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from PyMieSim.experiment.detector import Photodiode
+from PyMieSim.experiment.scatterer import Sphere
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+
+
+def get_experiment():
+    source = Gaussian(wavelength=np.linspace(400e-9, 1200e-9, 5), polarization=[0, 90], optical_power=1e-3, NA=0.2)
+
+    scatterer = Sphere(diameter=np.linspace(400e-9, 1400e-9, 7), index=[1.4, 1.5], medium_index=1.0, source=source)
+
+    detector = Photodiode(NA=[0.1, 0.2], polarization_filter=None, gamma_offset=0, phi_offset=0, sampling=100)
+
+    return Setup(scatterer=scatterer, source=source, detector=detector)
+
+
+@pytest.mark.parametrize('axis', [0, 4, 8], ids=['wavelength', 'diameter', 'detector_NA'])
+def test_iter_chunks_coupling(axis):
+    experiment = get_experiment()
+
+    reference = experiment.get(pms_measure.coupling, export_as_numpy=True)
+
+    array = np.full(reference.shape, np.nan)
+
+    for index, chunk in experiment.iter_chunks(pms_measure.coupling, chunk_size=2, axis=axis):
+        array[index] = chunk
+
+    if not np.allclose(array, reference, atol=0, rtol=1e-12):
+        raise ValueError(f'Mismatch between the chunked and the full coupling along axis {axis}.')
+
+
+def test_iter_chunks_invalid_axis():
+    experiment = get_experiment()
+
+    with pytest.raises(ValueError):
+        next(experiment.iter_chunks(pms_measure.Qsca, chunk_size=2, axis=7))
+
+
+if __name__ == "__main__":
+    pytest.main()
+
+# -
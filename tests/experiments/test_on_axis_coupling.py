@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from PyMieSim.experiment.detector import Photodiode
+from PyMieSim.experiment.scatterer import Sphere, CoreShell
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+
+diameter = np.linspace(100e-9, 5000e-9, 10)
+
+scatterer_cases = [
+    (Sphere, dict(diameter=diameter, index=[1.4, 1.5 + 0.1j], medium_index=1.0)),
+    (CoreShell, dict(core_diameter=diameter, shell_width=200e-9, core_index=1.5, shell_index=1.4, medium_index=1.0)),
+]
+
+
+@pytest.mark.parametrize('scatterer_class, parameters', scatterer_cases, ids=['Sphere', 'CoreShell'])
+def test_full_sphere_coupling(scatterer_class, parameters):
+    source = Gaussian(wavelength=[500e-9, 1000e-9], polarization=[0, 45], optical_power=1e-3, NA=0.2)
+
+    scatterer = scatterer_class(source=source, **parameters)
+
+    detector = Photodiode(NA=2.0, polarization_filter=None, gamma_offset=0, phi_offset=0, sampling=100)
+
+    experiment = Setup(scatterer=scatterer, source=source, detector=detector)
+
+    coupling = experiment.get(pms_measure.coupling, export_as_numpy=True).squeeze()
+
+    Csca = experiment.get(pms_measure.Csca, export_as_numpy=True).squeeze()
+
+    # The power scattered over the whole sphere is the scattering cross-section times the incident intensity, which only
+    # depends on the source.
+    intensity = (coupling / Csca).reshape(*coupling.shape[:2], -1)
+
+    if not np.allclose(intensity, intensity[..., :1], rtol=1e-9, atol=0):
+        raise ValueError('Mismatch of the full-sphere coupling with the scattering cross-section.')
+
+
+def test_on_axis_coupling_sampling():
+    source = Gaussian(wavelength=1e-6, polarization=[0, 90], optical_power=1e-3, NA=0.2)
+
+    scatterer = Sphere(source=source, **scatterer_cases[0][1])
+
+    arrays = []
+    for sampling in [100, 1000]:
+        detector = Photodiode(NA=[0.1, 0.5, 1.0], polarization_filter=[None, 30], gamma_offset=0, phi_offset=0, sampling=sampling)
+
+        arrays.append(Setup(scatterer=scatterer, source=source, detector=detector).get(pms_measure.coupling, export_as_numpy=True))
+
+    # The azimuthal integral over an on-axis cap is exact and no longer depends on the mesh.
+    if not np.allclose(arrays[0], arrays[1], rtol=1e-10, atol=0):
+        raise ValueError('The on-axis coupling of a photodiode must not depend on the sampling.')
+
+    detector = Photodiode(NA=[0.1, 0.5, 1.0], polarization_filter=[None, 30], gamma_offset=0, phi_offset=1e-6, sampling=20000)
+
+    mesh_array = Setup(scatterer=scatterer, source=source, detector=detector).get(pms_measure.coupling, export_as_numpy=True)
+
+    # The sum over the mesh converges to the integral as 1 / sampling.
+    if not np.allclose(arrays[0], mesh_array, rtol=1e-2, atol=0):
+        raise ValueError('Mismatch of the on-axis coupling with its integral over a dense mesh.')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
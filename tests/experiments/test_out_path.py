@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from PyMieSim.experiment.detector import Photodiode
+from PyMieSim.experiment.scatterer import Sphere
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+
+
+@pytest.mark.parametrize('measure', [pms_measure.coupling, pms_measure.Qsca, pms_measure.a1], ids=['coupling', 'Qsca', 'a1'])
+def test_out_path(measure, tmp_path):
+    source = Gaussian(wavelength=[800e-9, 1200e-9], polarization=[0, 90], optical_power=1e-3, NA=0.2)
+
+    scatterer = Sphere(diameter=np.linspace(400e-9, 1400e-9, 10), index=1.4, medium_index=1.0, source=source)
+
+    detector = Photodiode(NA=[0.1, 0.2], polarization_filter=None, gamma_offset=0, phi_offset=0, sampling=100)
+
+    experiment = Setup(scatterer=scatterer, source=source, detector=detector)
+
+    reference = experiment.get(measure, export_as_numpy=True)
+
+    out_path = tmp_path / 'result.npy'
+
+    experiment.get(measure, export_as_numpy=True, out_path=out_path)
+
+    array = np.load(out_path, mmap_mode='r')
+
+    if not np.array_equal(array, reference):
+        raise ValueError(f'Mismatch between the memory-mapped and the returned {measure.short_label}.')
+
+    axes = np.load(tmp_path / 'result.axes.npz')
+
+    if [axes[key].shape[0] for key in axes['axes']] != list(array.shape):
+        raise ValueError('The sidecar axes do not match the dimensions of the result.')
+
+    if not np.array_equal(axes['sphere_diameter'], scatterer.diameter):
+        raise ValueError('The sidecar axes do not hold the diameters of the scatterer.')
+
+
+if __name__ == "__main__":
+    pytest.main()
+
+# -
@@ -0,0 +1,68 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from PyMieSim.experiment.detector import Photodiode
+from PyMieSim.experiment.scatterer import Sphere
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+
+
+def get_experiment(optical_power=[1e-3, 2e-3]):
+    source = Gaussian(wavelength=[800e-9, 1200e-9], polarization=[0, 90], optical_power=optical_power, NA=0.2)
+
+    scatterer = Sphere(diameter=np.linspace(400e-9, 1400e-9, 10), index=1.4, medium_index=1.0, source=source)
+
+    detector = Photodiode(NA=[0.1, 0.2], polarization_filter=None, gamma_offset=0, phi_offset=0, sampling=100)
+
+    return Setup(scatterer=scatterer, source=source, detector=detector)
+
+
+@pytest.mark.parametrize('measure', [pms_measure.coupling, pms_measure.Qsca, pms_measure.a1], ids=['coupling', 'Qsca', 'a1'])
+def test_out_buffer(measure):
+    experiment = get_experiment()
+
+    reference = experiment.get(measure, export_as_numpy=True)
+
+    out = np.full(reference.shape, np.nan, dtype=reference.dtype)
+
+    array = experiment.get(measure, export_as_numpy=True, out=out)
+
+    if not np.shares_memory(array, out):
+        raise ValueError('The result should be written into the out array.')
+
+    if not np.array_equal(out, reference):
+        raise ValueError(f'Mismatch between the out array and the returned {measure.short_label}.')
+
+
+def test_out_buffer_single_source():
+    reference = get_experiment().get(pms_measure.coupling, export_as_numpy=True)[:, :, :, :1]
+
+    experiment = get_experiment(optical_power=1e-3)
+
+    out = np.full(reference.shape, np.nan)
+
+    experiment.get(pms_measure.coupling, export_as_numpy=True, out=out)
+
+    # Without NA or optical power to scale to, the coupling is written at the amplitude of the source.
+    if not np.allclose(out, reference, rtol=1e-12, atol=0):
+        raise ValueError('Mismatch of the coupling written at the amplitude of a single source.')
+
+    if not np.array_equal(experiment.get_many([pms_measure.coupling], export_as_numpy=True)['coupling'], out):
+        raise ValueError('Mismatch between the coupling of get_many and of the out array.')
+
+
+def test_out_buffer_invalid_shape():
+    experiment = get_experiment()
+
+    with pytest.raises(ValueError):
+        experiment.get(pms_measure.coupling, export_as_numpy=True, out=np.empty(3))
+
+
+if __name__ == "__main__":
+    pytest.main()
+
+# -
@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from PyMieSim.experiment.detector import Photodiode
+from PyMieSim.experiment.scatterer import Sphere, Cylinder, CoreShell
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+
+scatterer_options = [
+    {'name': 'Sphere', 'class': Sphere, 'properties': {'diameter': np.linspace(400e-9, 1400e-9, 10), 'index': [1.4, 1.5], 'medium_index': 1.0}},
+    {'name': 'Cylinder', 'class': Cylinder, 'properties': {'diameter': np.linspace(400e-9, 1400e-9, 10), 'index': [1.4, 1.5], 'medium_index': 1.0}},
+    {'name': 'CoreShell', 'class': CoreShell, 'properties': {'core_diameter': np.linspace(400e-9, 1400e-9, 10), 'shell_width': 300e-9, 'core_index': 1.4, 'shell_index': 1.6, 'medium_index': 1.0}},
+]
+
+
+class ProgressBar:
+    """Minimal tqdm-compatible progress bar."""
+    def __init__(self):
+        self.n = 0
+        self.total = None
+
+    def update(self, n: int):
+        self.n += n
+
+
+def get_setup(scatterer_config: dict) -> Setup:
+    source = Gaussian(wavelength=[800e-9, 1200e-9], polarization=[0, 90], optical_power=1e-3, NA=0.2)
+
+    scatterer = scatterer_config['class'](source=source, **scatterer_config['properties'])
+
+    detector = Photodiode(NA=[0.1, 0.2], polarization_filter=None, gamma_offset=0, phi_offset=0, sampling=100)
+
+    return Setup(scatterer=scatterer, source=source, detector=detector)
+
+
+@pytest.mark.parametrize('measure', [pms_measure.Qsca, pms_measure.coupling], ids=['Qsca', 'coupling'])
+@pytest.mark.parametrize('scatterer_config', scatterer_options, ids=[s['name'] for s in scatterer_options])
+def test_progress(scatterer_config, measure):
+    experiment = get_setup(scatterer_config)
+
+    calls = []
+
+    array = experiment.get(measure, export_as_numpy=True, progress=lambda completed, total: calls.append((completed, total)))
+
+    if not np.array_equal(array, experiment.get(measure, export_as_numpy=True)):
+        raise ValueError('The progress hook modified the result.')
+
+    completed, total = calls[-1]
+
+    if completed != total or [completed for completed, _ in calls] != sorted(completed for completed, _ in calls):
+        raise ValueError(f'Progress should increase up to the total number of grid points, got {calls}.')
+
+    progress_bar = ProgressBar()
+
+    experiment.get(measure, progress=progress_bar)
+
+    if progress_bar.n != progress_bar.total or progress_bar.total != total:
+        raise ValueError('The tqdm-compatible progress bar did not reach the total number of grid points.')
+
+
+def test_progress_error():
+    experiment = get_setup(scatterer_options[0])
+
+    def progress(completed, total):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        experiment.get(pms_measure.coupling, progress=progress)
+
+
+if __name__ == "__main__":
+    pytest.main()
+
+# -
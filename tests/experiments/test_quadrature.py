@@ -0,0 +1,53 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from PyMieSim.experiment.detector import Photodiode, CoherentMode
+from PyMieSim.experiment.scatterer import Sphere
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+
+source = Gaussian(wavelength=1e-6, polarization=[0, 90], optical_power=1e-3, NA=0.2)
+
+scatterer = Sphere(source=source, diameter=np.linspace(100e-9, 3000e-9, 10), index=[1.4, 1.5 + 0.01j], medium_index=1.0)
+
+detector_cases = [
+    (Photodiode, dict(NA=[0.2, 0.6], polarization_filter=None, gamma_offset=10, phi_offset=30)),
+    (CoherentMode, dict(mode_number=['LP01', 'LP11', 'HG11'], NA=[0.1, 0.3], rotation=0, polarization_filter=None, gamma_offset=10, phi_offset=30)),
+]
+
+
+def get_coupling(detector_class, parameters: dict, sampling: int, quadrature: str) -> np.ndarray:
+    detector = detector_class(**parameters, sampling=sampling, quadrature=quadrature)
+
+    experiment = Setup(scatterer=scatterer, source=source, detector=detector)
+
+    return experiment.get(pms_measure.coupling, export_as_numpy=True)
+
+
+@pytest.mark.parametrize('detector_class, parameters', detector_cases, ids=['Photodiode', 'CoherentMode'])
+def test_gauss_quadrature(detector_class, parameters):
+    coupling = get_coupling(detector_class, parameters, sampling=300, quadrature='gauss')
+
+    reference = get_coupling(detector_class, parameters, sampling=3000, quadrature='gauss')
+
+    # The product Gauss-Legendre quadrature converges exponentially with the number of nodes.
+    if not np.allclose(coupling, reference, rtol=1e-6, atol=1e-6 * np.max(reference)):
+        raise ValueError('The coupling over the Gauss mesh did not converge.')
+
+    fibonacci_coupling = get_coupling(detector_class, parameters, sampling=20000, quadrature='fibonacci')
+
+    if not np.allclose(fibonacci_coupling, reference, rtol=1e-3, atol=1e-3 * np.max(reference)):
+        raise ValueError('Mismatch of the coupling over the Gauss mesh with the one over a dense Fibonacci mesh.')
+
+
+def test_invalid_quadrature():
+    with pytest.raises(ValueError):
+        Photodiode(NA=0.2, polarization_filter=None, gamma_offset=0, phi_offset=0, sampling=100, quadrature='lebedev')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from PyMieSim.experiment.detector import Photodiode
+from PyMieSim.experiment.scatterer import Sphere, Cylinder, CoreShell
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+
+diameter = np.linspace(50e-9, 2000e-9, 10)
+
+scatterer_cases = [
+    (Sphere, dict(diameter=diameter, index=[1.4, 1.5 + 0.01j], medium_index=1.0), ['Qsca', 'Qback', 'g', 'coupling']),
+    (Cylinder, dict(diameter=diameter, index=[1.4, 1.5 + 0.01j], medium_index=1.0), ['Qsca', 'Qext', 'coupling']),
+    (CoreShell, dict(core_diameter=diameter, shell_width=100e-9, core_index=1.5, shell_index=1.4, medium_index=1.0), ['Qsca', 'Qpr', 'coupling']),
+]
+
+
+def get_setup(scatterer_class, parameters: dict, series_tolerance: float) -> Setup:
+    source = Gaussian(wavelength=[500e-9, 800e-9], polarization=[0, 90], optical_power=1e-3, NA=0.2)
+
+    scatterer = scatterer_class(source=source, **parameters)
+
+    detector = Photodiode(NA=[0.1, 0.3], polarization_filter=None, gamma_offset=0, phi_offset=0, sampling=200)
+
+    return Setup(scatterer=scatterer, source=source, detector=detector, series_tolerance=series_tolerance)
+
+
+@pytest.mark.parametrize('scatterer_class, parameters, measures', scatterer_cases, ids=['Sphere', 'Cylinder', 'CoreShell'])
+def test_series_tolerance(scatterer_class, parameters, measures):
+    reference = get_setup(scatterer_class, parameters, series_tolerance=0)
+
+    experiment = get_setup(scatterer_class, parameters, series_tolerance=1e-12)
+
+    order = experiment.get(pms_measure.max_order, export_as_numpy=True)
+
+    reference_order = reference.get(pms_measure.max_order, export_as_numpy=True)
+
+    if not np.all(order <= reference_order) or not np.any(order < reference_order):
+        raise ValueError('The tolerance must drop the trailing orders of the series.')
+
+    for label in measures:
+        measure = getattr(pms_measure, label)
+
+        array = experiment.get(measure, export_as_numpy=True)
+
+        reference_array = reference.get(measure, export_as_numpy=True)
+
+        if not np.allclose(array, reference_array, rtol=1e-9, atol=1e-9 * np.max(np.abs(reference_array))):
+            raise ValueError(f'Mismatch of {label} computed with the truncated series.')
+
+
+@pytest.mark.parametrize('scatterer_class, parameters, measures', [
+    (Sphere, scatterer_cases[0][1], ['a1', 'b1', 'a3', 'b3']),
+    (Cylinder, scatterer_cases[1][1], ['a11', 'b21', 'a13', 'b23']),
+    (CoreShell, scatterer_cases[2][1], ['a1', 'b1', 'a3', 'b3']),
+], ids=['Sphere', 'Cylinder', 'CoreShell'])
+def test_series_tolerance_coefficients(scatterer_class, parameters, measures):
+    experiment = get_setup(scatterer_class, parameters, series_tolerance=1e-3)
+
+    reference = get_setup(scatterer_class, parameters, series_tolerance=0)
+
+    measures = [getattr(pms_measure, label) for label in measures]
+
+    arrays = experiment.get_many(measures + [pms_measure.Qsca, pms_measure.coupling], export_as_numpy=True)
+
+    for measure in measures:
+        array = experiment.get(measure, export_as_numpy=True)
+
+        if not np.array_equal(arrays[measure.short_label], array):
+            raise ValueError(f'Mismatch of {measure.short_label} between get_many and get with a series tolerance.')
+
+        # The truncation only drops trailing orders, past the ones read by the coefficient measures.
+        if not np.array_equal(array, reference.get(measure, export_as_numpy=True)):
+            raise ValueError(f'The series tolerance must not change {measure.short_label}.')
+
+
+def test_invalid_series_tolerance():
+    with pytest.raises(ValueError):
+        get_setup(*scatterer_cases[0][:2], series_tolerance=-1)
+
+    with pytest.raises(ValueError):
+        get_setup(*scatterer_cases[0][:2], series_tolerance=1)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from PyMieSim.experiment.detector import CoherentMode
+from PyMieSim.experiment.scatterer import Sphere, Cylinder, CoreShell
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+
+source = Gaussian(wavelength=[500e-9, 1000e-9], polarization=[0, 45], optical_power=1e-3, NA=0.2)
+
+scatterer_cases = [
+    (Sphere, dict(diameter=np.linspace(100e-9, 2000e-9, 4), index=1.5, medium_index=1.0)),
+    (Cylinder, dict(diameter=np.linspace(100e-9, 2000e-9, 4), index=1.5, medium_index=1.0)),
+    (CoreShell, dict(core_diameter=np.linspace(100e-9, 2000e-9, 4), shell_width=100e-9, core_index=1.5, shell_index=1.4, medium_index=1.0)),
+]
+
+mode_numbers = ['LP01', 'LP11', 'HG11']
+
+polarization_filters = [None, 0, 45]
+
+
+def get_detector(mode_number, polarization_filter) -> CoherentMode:
+    return CoherentMode(
+        mode_number=mode_number,
+        NA=[0.1, 0.3],
+        rotation=[0, 30],
+        polarization_filter=polarization_filter,
+        gamma_offset=[0, 10],
+        phi_offset=20,
+        sampling=100
+    )
+
+
+@pytest.mark.parametrize('scatterer_class, parameters', scatterer_cases, ids=['Sphere', 'Cylinder', 'CoreShell'])
+def test_shared_far_field(scatterer_class, parameters):
+    scatterer = scatterer_class(source=source, **parameters)
+
+    detector = get_detector(mode_numbers, polarization_filters)
+
+    experiment = Setup(scatterer=scatterer, source=source, detector=detector)
+
+    # The far-field is evaluated once per mesh and shared by every mode and polarization filter.
+    arrays = [experiment.get(pms_measure.coupling, export_as_numpy=True), experiment.get_many([pms_measure.coupling], export_as_numpy=True)['coupling']]
+
+    for i, mode_number in enumerate(mode_numbers):
+        for j, polarization_filter in enumerate(polarization_filters):
+            experiment = Setup(scatterer=scatterer, source=source, detector=get_detector(mode_number, polarization_filter))
+
+            reference = experiment.get(pms_measure.coupling, export_as_numpy=True)
+
+            for array in arrays:
+                if not np.array_equal(array[..., i:i + 1, :, :, :, :, :, j:j + 1], reference):
+                    raise ValueError(f'Mismatch of the coupling of mode {mode_number} with polarization filter {polarization_filter}.')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
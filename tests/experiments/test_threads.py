@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+
+from PyMieSim.experiment.detector import Photodiode
+from PyMieSim.experiment.scatterer import Sphere
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+
+
+def get_setup(n_threads: int, schedule: str = 'static') -> Setup:
+    source = Gaussian(wavelength=np.linspace(400e-9, 1800e-9, 5), polarization=[0, 90], optical_power=1e-3, NA=0.2)
+
+    scatterer = Sphere(diameter=np.linspace(400e-9, 1400e-9, 10), index=[1.4, 1.5], medium_index=1.0, source=source)
+
+    detector = Photodiode(NA=0.2, polarization_filter=None, gamma_offset=0, phi_offset=0, sampling=[100, 300])
+
+    return Setup(scatterer=scatterer, source=source, detector=detector, n_threads=n_threads, schedule=schedule)
+
+
+@pytest.mark.parametrize('n_threads', [1, 2], ids=['1 thread', '2 threads'])
+def test_n_threads(n_threads):
+    experiment = get_setup(n_threads=n_threads)
+
+    if experiment.binding.get_num_threads() != n_threads:
+        raise ValueError('The number of threads of the experiment was not set.')
+
+    reference = get_setup(n_threads=0)
+
+    for measure in [pms_measure.Qsca, pms_measure.coupling]:
+        if not np.array_equal(experiment.get(measure, export_as_numpy=True), reference.get(measure, export_as_numpy=True)):
+            raise ValueError(f'Mismatch of {measure.short_label} with the number of threads.')
+
+
+@pytest.mark.parametrize('schedule', ['dynamic', 'guided', 'cost'])
+def test_schedule(schedule):
+    experiment = get_setup(n_threads=2, schedule=schedule)
+
+    reference = get_setup(n_threads=2)
+
+    for measure in [pms_measure.Qsca, pms_measure.a1, pms_measure.coupling]:
+        if not np.array_equal(experiment.get(measure, export_as_numpy=True), reference.get(measure, export_as_numpy=True)):
+            raise ValueError(f'Mismatch of {measure.short_label} with the {schedule} schedule.')
+
+
+def test_invalid_schedule():
+    with pytest.raises(ValueError):
+        get_setup(n_threads=1, schedule='random')
+
+
+def test_concurrent_get():
+    experiment = get_setup(n_threads=1)
+
+    reference = experiment.get(pms_measure.coupling, export_as_numpy=True)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        arrays = list(executor.map(lambda _: experiment.get(pms_measure.coupling, export_as_numpy=True), range(4)))
+
+    for array in arrays:
+        if not np.array_equal(array, reference):
+            raise ValueError('Mismatch between the coupling computed concurrently and sequentially.')
+
+
+if __name__ == "__main__":
+    pytest.main()
+
+# -
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from PyMieSim.experiment.detector import Photodiode
+from PyMieSim.experiment.scatterer import Sphere, Cylinder, CoreShell
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+
+diameter = np.linspace(300e-9, 2000e-9, 15)
+
+scatterer_cases = [
+    (Sphere, dict(diameter=diameter, index=[1.4, 1.5], medium_index=1.0), 'sphere_diameter'),
+    (Cylinder, dict(diameter=diameter, index=[1.4, 1.5], medium_index=1.0), 'cylinder_diameter'),
+    (CoreShell, dict(core_diameter=diameter, shell_width=[100e-9, 200e-9], core_index=1.5, shell_index=1.4, medium_index=1.0), 'coreshell_core_diameter'),
+]
+
+
+def get_setup(scatterer_class, parameters: dict) -> Setup:
+    source = Gaussian(wavelength=[500e-9, 800e-9], polarization=[0, 90], optical_power=[1e-3, 2e-3], NA=0.2)
+
+    scatterer = scatterer_class(source=source, **parameters)
+
+    detector = Photodiode(NA=[0.1, 0.3], polarization_filter=None, gamma_offset=0, phi_offset=0, sampling=100)
+
+    return Setup(scatterer=scatterer, source=source, detector=detector)
+
+
+def get_log_normal_weights(values: np.ndarray, median: float, sigma: float) -> np.ndarray:
+    return np.exp(-np.log(values / median) ** 2 / (2 * sigma ** 2)) / values
+
+
+@pytest.mark.parametrize('scatterer_class, parameters, parameter', scatterer_cases, ids=['Sphere', 'Cylinder', 'CoreShell'])
+@pytest.mark.parametrize('measure', [pms_measure.Qsca, pms_measure.Csca, pms_measure.coupling], ids=['Qsca', 'Csca', 'coupling'])
+def test_weighted_average(scatterer_class, parameters, parameter, measure):
+    experiment = get_setup(scatterer_class, parameters)
+
+    weights = get_log_normal_weights(diameter, median=800e-9, sigma=0.3)
+
+    mean, variance = experiment.get_weighted_average(measure, parameter, weights)
+
+    array = experiment.get(measure, export_as_numpy=True)
+
+    reference_mean = np.average(array, axis=4, weights=weights)[:, :, :, :, None]
+
+    reference_variance = np.average((array - reference_mean) ** 2, axis=4, weights=weights)[:, :, :, :, None]
+
+    if not np.allclose(mean, reference_mean, rtol=1e-10, atol=0):
+        raise ValueError(f'Mismatch of the weighted mean of {measure.short_label}.')
+
+    if not np.allclose(variance, reference_variance, rtol=1e-6, atol=1e-12 * np.max(reference_mean ** 2)):
+        raise ValueError(f'Mismatch of the weighted variance of {measure.short_label}.')
+
+
+def test_weighted_average_detector_axis():
+    experiment = get_setup(*scatterer_cases[0][:2])
+
+    mean, variance = experiment.get_weighted_average(pms_measure.coupling, 'detector_NA', [1, 3])
+
+    array = experiment.get(pms_measure.coupling, export_as_numpy=True)
+
+    if not np.allclose(mean, np.average(array, axis=10, weights=[1, 3])[..., None, :, :, :], rtol=1e-10, atol=0):
+        raise ValueError('Mismatch of the weighted mean of the coupling over the detector NA.')
+
+
+@pytest.mark.parametrize('scatterer_class, parameters', [
+    (Sphere, dict(diameter=diameter[:4], index=[1.4, 1.5, 1.6], medium_index=[1.0, 1.1])),
+    (Cylinder, dict(diameter=diameter[:4], index=[1.4, 1.5, 1.6], medium_index=[1.0, 1.1])),
+    (CoreShell, dict(core_diameter=diameter[:4], shell_width=[100e-9, 150e-9, 200e-9], core_index=1.5, shell_index=1.4, medium_index=[1.0, 1.1]))
+], ids=['Sphere', 'Cylinder', 'CoreShell'])
+@pytest.mark.parametrize('measure', [pms_measure.Qsca, pms_measure.coupling], ids=['Qsca', 'coupling'])
+def test_weighted_average_axes(scatterer_class, parameters, measure):
+    source = Gaussian(wavelength=[500e-9, 800e-9], polarization=[0, 90], optical_power=1e-3, NA=0.2)
+
+    scatterer = scatterer_class(source=source, **parameters)
+
+    detector = Photodiode(NA=[0.1, 0.3], polarization_filter=[None, 0, 45], gamma_offset=0, phi_offset=[0, 30], sampling=100)
+
+    experiment = Setup(scatterer=scatterer, source=source, detector=detector)
+
+    array = experiment.get(measure, export_as_numpy=True)
+
+    keys = [f'{component}_{name}' for component, name, _ in experiment._get_result_axes(measure)]
+
+    for axis, parameter in enumerate(keys):
+        if axis < 4 or array.shape[axis] == 1:
+            continue
+
+        # The leading weights of zero leave the accumulation at its first nonzero weight.
+        weights = np.arange(array.shape[axis]) ** 2
+
+        mean, variance = experiment.get_weighted_average(measure, parameter, weights)
+
+        reference_mean = np.average(array, axis=axis, weights=weights)
+
+        reference_variance = np.average((array - np.expand_dims(reference_mean, axis)) ** 2, axis=axis, weights=weights)
+
+        if not np.allclose(mean.squeeze(axis), reference_mean, rtol=1e-10, atol=0):
+            raise ValueError(f'Mismatch of the weighted mean of {measure.short_label} over {parameter}.')
+
+        if not np.allclose(variance.squeeze(axis), reference_variance, rtol=1e-6, atol=1e-12 * np.max(reference_mean ** 2)):
+            raise ValueError(f'Mismatch of the weighted variance of {measure.short_label} over {parameter}.')
+
+
+def test_weighted_average_threads():
+    scatterer_class, parameters = scatterer_cases[0][:2]
+
+    weights = get_log_normal_weights(diameter, median=800e-9, sigma=0.3)
+
+    results = []
+    for n_threads in [1, 4]:
+        experiment = get_setup(scatterer_class, parameters)
+        experiment.binding.set_num_threads(n_threads)
+
+        results.append(experiment.get_weighted_average(pms_measure.coupling, 'sphere_diameter', weights))
+
+    # Each point is summed over the reduced axis in its order, whatever the number of threads.
+    for array_1, array_4 in zip(*results):
+        if not np.array_equal(array_1, array_4):
+            raise ValueError('The weighted average must not depend on the number of threads.')
+
+
+def test_weighted_variance_small_spread():
+    parameters = dict(diameter=1e-6 * (1 + 1e-7 * np.arange(15)), index=[1.4, 1.5], medium_index=1.0)
+
+    experiment = get_setup(Sphere, parameters)
+
+    mean, variance = experiment.get_weighted_average(pms_measure.Csca, 'sphere_diameter', np.ones(15))
+
+    array = experiment.get(pms_measure.Csca, export_as_numpy=True)
+
+    reference_variance = np.var(array, axis=4)[:, :, :, :, None]
+
+    if not np.allclose(variance, reference_variance, rtol=1e-6, atol=0):
+        raise ValueError('The weighted variance must keep its precision for a spread small relative to the mean.')
+
+
+def test_invalid_weighted_average():
+    experiment = get_setup(*scatterer_cases[0][:2])
+
+    with pytest.raises(ValueError):
+        experiment.get_weighted_average(pms_measure.Qsca, 'sphere_diameter', np.ones(3))
+
+    with pytest.raises(ValueError):
+        experiment.get_weighted_average(pms_measure.Qsca, 'source_wavelength', np.ones(2))
+
+    with pytest.raises(ValueError):
+        experiment.get_weighted_average(pms_measure.a1, 'sphere_diameter', np.ones(diameter.size))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,75 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import pytest
+import numpy as np
+
+from PyMieSim.experiment.detector import Photodiode
+from PyMieSim.experiment.scatterer import Sphere, Cylinder, CoreShell
+from PyMieSim.experiment.source import Gaussian
+from PyMieSim.experiment import Setup
+import PyMieSim.experiment.measure as pms_measure
+
+diameter = np.linspace(300e-9, 1500e-9, 4)
+index = np.linspace(1.3, 1.7, 4) + 0.01j
+medium_index = np.linspace(1.0, 1.33, 4)
+
+scatterer_cases = [
+    (Sphere, dict(diameter=diameter, index=index, medium_index=medium_index), ['diameter', 'index']),
+    (Sphere, dict(diameter=diameter, index=index, medium_index=medium_index), ['index', 'medium_index']),
+    (Cylinder, dict(diameter=diameter, index=index, medium_index=medium_index), ['diameter', 'medium_index']),
+    (CoreShell, dict(core_diameter=diameter, shell_width=diameter / 5, core_index=index, shell_index=index + 0.1, medium_index=medium_index), ['core_diameter', 'shell_width']),
+]
+
+
+def get_setup(scatterer_class, parameters: dict, zip_axes=None) -> Setup:
+    source = Gaussian(wavelength=[500e-9, 800e-9], polarization=[0, 90], optical_power=1e-3, NA=0.2)
+
+    scatterer = scatterer_class(source=source, zip_axes=zip_axes, **parameters)
+
+    detector = Photodiode(NA=[0.1, 0.3], polarization_filter=None, gamma_offset=0, phi_offset=0, sampling=100)
+
+    return Setup(scatterer=scatterer, source=source, detector=detector)
+
+
+def get_diagonal(array: np.ndarray, axes: list) -> np.ndarray:
+    """Values of the full grid along the diagonal of the given axes, the axes following the first one having a size of 1."""
+    diagonal = np.moveaxis(array, axes, range(len(axes)))
+
+    diagonal = np.moveaxis(diagonal[(np.arange(array.shape[axes[0]]),) * len(axes)], 0, axes[0])
+
+    return np.expand_dims(diagonal, axes[1:])
+
+
+@pytest.mark.parametrize('scatterer_class, parameters, zip_axes', scatterer_cases, ids=lambda x: str(x))
+def test_zip_axes(scatterer_class, parameters, zip_axes):
+    experiment = get_setup(scatterer_class, parameters, zip_axes=zip_axes)
+
+    reference = get_setup(scatterer_class, parameters)
+
+    names = list(experiment.scatterer.binding_kwargs.keys())
+
+    axes = sorted(4 + names.index(name) for name in zip_axes)
+
+    for measure in [pms_measure.Qsca, pms_measure.Qext, pms_measure.coupling]:
+        array = experiment.get(measure, export_as_numpy=True)
+
+        if not np.allclose(array, get_diagonal(reference.get(measure, export_as_numpy=True), axes), rtol=1e-12, atol=0):
+            raise ValueError(f'Mismatch of the zipped {measure.short_label} with the full grid.')
+
+
+def test_invalid_zip_axes():
+    parameters = dict(diameter=diameter, index=index[:2], medium_index=medium_index)
+
+    with pytest.raises(ValueError):
+        get_setup(Sphere, parameters, zip_axes=['diameter', 'index'])
+
+    with pytest.raises(ValueError):
+        get_setup(Sphere, parameters, zip_axes=['diameter', 'wavelength'])
+
+    with pytest.raises(ValueError):
+        get_setup(Sphere, parameters, zip_axes=['diameter'])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -3,6 +3,7 @@
 
 import numpy
 import pytest
+from scipy.constants import epsilon_0, c
 from PyMieSim.single.scatterer import Sphere, CoreShell
 from PyMieSim.single.source import Gaussian
 from PyMieSim.single.detector import Photodiode
@@ -45,11 +46,12 @@ def test_energy_flow_coupling():
         source=source
     )
 
+    # The offset keeps the coupling on the mesh, over which the energy flow is summed too.
     detector = Photodiode(
         sampling=500,
         NA=2.0,
         gamma_offset=0,
-        phi_offset=0
+        phi_offset=45
     )
 
     val0 = detector.get_energy_flow(sphere)
@@ -59,6 +61,37 @@ def test_energy_flow_coupling():
         raise ValueError('Mismatch with testing values')
 
 
+def test_on_axis_coupling_cross_section():
+    source = Gaussian(
+        wavelength=1e-6,
+        polarization=0,
+        optical_power=1,
+        NA=0.3
+    )
+
+    sphere = Sphere(
+        diameter=300e-9,
+        index=1.4,
+        medium_index=1.0,
+        source=source
+    )
+
+    detector = Photodiode(
+        sampling=500,
+        NA=2.0,
+        gamma_offset=0,
+        phi_offset=0
+    )
+
+    intensity = 0.5 * epsilon_0 * c * source.binding.amplitude ** 2
+
+    val0 = sphere.Csca * intensity
+    val1 = detector.coupling(sphere)
+
+    if not numpy.isclose(val0, val1, atol=0, rtol=1e-8):
+        raise ValueError('Mismatch with testing values')
+
+
 def test_compare_sphere_coreshell_0():
     source = Gaussian(
         wavelength=1e-6,